@@ -0,0 +1,92 @@
+# file: acl_index.py
+import os
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy.orm import Session
+from models import book_permission_model
+import authz_versions
+
+# Backstop: version bump ke bina bhi (jaise seedhe DB me badlav) index is interval ke andar reload ho jaata hai
+ACL_INDEX_REFRESH_SECONDS = float(os.getenv("ACL_INDEX_REFRESH_SECONDS", "60"))
+# book_permissions ka har badlav is authz_versions scope ka version usi transaction me badhata hai
+ACL_SCOPE = "acl:books"
+
+
+def bump_acl_version(db: Session) -> None:
+    """ book_permissions badalne wali transaction me call karein; commit ke baad forget_acl_version(). """
+    authz_versions.bump_version(db, ACL_SCOPE)
+
+
+def forget_acl_version() -> None:
+    authz_versions.forget(ACL_SCOPE)
+
+
+class BookAclIndex:
+    """
+    Restricted books ka in-memory ACL: book_id -> {user ids} aur {role ids}.
+    Har snapshot us ACL_SCOPE version ke saath rakha jaata hai jis par woh load hua. Access check se pehle
+    ensure_fresh() current version (authz_versions, AUTHZ_VERSION_TTL_SECONDS cache) se milata hai; kisi bhi worker
+    me assign/revoke hua ho toh version badal chuka hota hai aur index dobara load hota hai.
+    """
+
+    def __init__(self, refresh_seconds: float = ACL_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._users: Dict[int, Counter] = {}
+        self._roles: Dict[int, Counter] = {}
+        self._version: Optional[int] = None
+        self._loaded_at: Optional[float] = None
+
+    @staticmethod
+    def _current_version(db: Session) -> int:
+        return authz_versions.get_versions(db, [ACL_SCOPE])[ACL_SCOPE]
+
+    def load(self, db: Session, version: Optional[int] = None) -> None:
+        """
+        book_permissions table se poora index ek query me dobara banata hai. Version rows se pehle padha jaata hai,
+        taaki snapshot kam se kam us version jitna naya ho; purane version wala load naye snapshot ko overwrite nahi karta.
+        """
+        if version is None:
+            version = self._current_version(db)
+        rows = db.query(
+            book_permission_model.BookPermission.book_id,
+            book_permission_model.BookPermission.user_id,
+            book_permission_model.BookPermission.role_id
+        ).all()
+        users: Dict[int, Counter] = {}
+        roles: Dict[int, Counter] = {}
+        for book_id, user_id, role_id in rows:
+            if user_id is not None:
+                users.setdefault(book_id, Counter())[user_id] += 1
+            if role_id is not None:
+                roles.setdefault(book_id, Counter())[role_id] += 1
+        with self._lock:
+            if self._version is not None and version < self._version:
+                return
+            self._users, self._roles = users, roles
+            self._version = version
+            self._loaded_at = time.monotonic()
+
+    def ensure_fresh(self, db: Session) -> None:
+        version = self._current_version(db)
+        loaded_at = self._loaded_at
+        if version != self._version or loaded_at is None or time.monotonic() - loaded_at > self.refresh_seconds:
+            self.load(db, version)
+
+    def can_access(self, book_id: int, user_id: int, role_id: int) -> bool:
+        with self._lock:
+            return user_id in self._users.get(book_id, ()) or role_id in self._roles.get(book_id, ())
+
+    def visible_book_ids(self, book_ids: Iterable[int], user_id: int, role_id: int) -> Set[int]:
+        """ Diye gaye restricted book ids me se woh ids jinhe yeh user/role dekh sakta hai. """
+        with self._lock:
+            return {
+                book_id for book_id in book_ids
+                if user_id in self._users.get(book_id, ()) or role_id in self._roles.get(book_id, ())
+            }
+
+
+book_acl_index = BookAclIndex()
@@ -30,6 +30,9 @@ from models.permission_model import Permission
 from models.request_model import UploadRequest
 from models.log_model import Log
 from models.book_permission_model import BookPermission
+from models.authz_version_model import AuthzVersion
+from models.archive_model import archive_tables
+from models.recommendation_model import BookCooccurrence, BookRelated, JobWatermark
 # --- NAYA CODE YAHAN KHATM ---
 
 
@@ -43,6 +46,19 @@ if config.config_file_name is not None:
 # Target metadata for autogeneration
 target_metadata = Base.metadata
 
+# Full-text search (revision 0004) aur trigram (revision 0008) objects raw SQL se bante hain, models me nahi;
+# autogenerate unhe "removed" na samjhe
+SEARCH_OBJECTS = {"search_vector", "ix_books_search_vector", "ix_books_title_trgm", "ix_books_author_trgm"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if reflected and compare_to is None:
+        if type_ == "table" and name.startswith("books_fts"):
+            return False
+        if type_ in ("column", "index") and name in SEARCH_OBJECTS:
+            return False
+    return True
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -52,6 +68,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -71,7 +88,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
         with context.begin_transaction():
             context.run_migrations()
 
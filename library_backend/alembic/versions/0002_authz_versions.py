@@ -0,0 +1,38 @@
+"""authz versions table
+
+Permission-bearing JWTs ke liye role/user authorization versions.
+
+Revision ID: 0002_authz_versions
+Revises: 0001_baseline
+Create Date: 2026-10-18 12:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_authz_versions'
+down_revision: Union[str, Sequence[str], None] = '0001_baseline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if sa.inspect(op.get_bind()).has_table("authz_versions"):
+        return
+    op.create_table('authz_versions',
+    sa.Column('scope', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('scope'),
+    mysql_engine='InnoDB'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('authz_versions')
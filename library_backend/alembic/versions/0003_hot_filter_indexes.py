@@ -0,0 +1,60 @@
+"""hot filter indexes
+
+List endpoints ke filters aur joins ke liye composite / partial indexes.
+Postgres par CONCURRENTLY banaye jaate hain taaki badi tables lock na hon.
+
+Revision ID: 0003_hot_filter_indexes
+Revises: 0002_authz_versions
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_hot_filter_indexes'
+down_revision: Union[str, Sequence[str], None] = '0002_authz_versions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, partial WHERE clause)
+INDEXES = [
+    # read_books: sirf live (deleted_at IS NULL) books par visibility filter
+    ('ix_books_live_catalog', 'books', ['is_restricted', 'is_approved', 'id'], 'deleted_at IS NULL'),
+    ('ix_logs_timestamp', 'logs', ['timestamp'], None),
+    ('ix_logs_action_by_timestamp', 'logs', ['action_by_id', 'timestamp'], None),
+    ('ix_logs_action_type_timestamp', 'logs', ['action_type', 'timestamp'], None),
+    ('ix_issued_books_status', 'issued_books', ['Status'], None),
+    ('ix_issued_books_client_status', 'issued_books', ['ClientID', 'Status'], None),
+    ('ix_issued_books_copy', 'issued_books', ['CopyID'], None),
+    ('ix_book_copies_book_status', 'book_copies', ['BookID', 'Status'], None),
+    ('ix_book_copies_location', 'book_copies', ['LocationID'], None),
+    ('ix_digital_access_client_timestamp', 'digital_access', ['ClientID', 'AccessTimestamp'], None),
+    ('ix_book_permissions_book_user', 'book_permissions', ['book_id', 'user_id'], None),
+    ('ix_book_permissions_book_role', 'book_permissions', ['book_id', 'role_id'], None),
+    ('ix_book_permissions_user', 'book_permissions', ['user_id'], None),
+    ('ix_book_permissions_role', 'book_permissions', ['role_id'], None),
+    ('ix_book_subcategory_link_subcategory', 'book_subcategory_link', ['subcategory_id'], None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False, if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                sqlite_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,90 @@
+"""books full text search
+
+/api/books/search ke liye: Postgres par generated tsvector column + GIN index,
+SQLite (local dev) par FTS5 external-content table jo triggers se sync rehti hai.
+
+Revision ID: 0004_books_full_text_search
+Revises: 0003_hot_filter_indexes
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_books_full_text_search'
+down_revision: Union[str, Sequence[str], None] = '0003_hot_filter_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Title sabse zyada weight (A), description sabse kam (D). 'simple' config taaki Hindi/English dono titles chalein
+POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE books ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(author, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(publisher, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'D')
+    ) STORED
+    """,
+]
+POSTGRES_INDEX = "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_books_search_vector ON books USING gin (search_vector)"
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+        title, author, publisher, description,
+        content='books', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_ai AFTER INSERT ON books BEGIN
+        INSERT INTO books_fts(rowid, title, author, publisher, description)
+        VALUES (new.id, new.title, new.author, new.publisher, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_ad AFTER DELETE ON books BEGIN
+        INSERT INTO books_fts(books_fts, rowid, title, author, publisher, description)
+        VALUES ('delete', old.id, old.title, old.author, old.publisher, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_au AFTER UPDATE OF title, author, publisher, description ON books BEGIN
+        INSERT INTO books_fts(books_fts, rowid, title, author, publisher, description)
+        VALUES ('delete', old.id, old.title, old.author, old.publisher, old.description);
+        INSERT INTO books_fts(rowid, title, author, publisher, description)
+        VALUES (new.id, new.title, new.author, new.publisher, new.description);
+    END
+    """,
+    # Pehle se maujood books ko index me bharein
+    "INSERT INTO books_fts(books_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for statement in POSTGRES_UPGRADE:
+            op.execute(statement)
+        with op.get_context().autocommit_block():
+            op.execute(POSTGRES_INDEX)
+    elif dialect == "sqlite":
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_books_search_vector")
+        op.execute("ALTER TABLE books DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("books_fts_au", "books_fts_ad", "books_fts_ai"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS books_fts")
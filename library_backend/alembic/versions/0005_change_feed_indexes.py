@@ -0,0 +1,42 @@
+"""change feed indexes
+
+/api/changes har entity ko (updated_at, id) keyset par padhta hai.
+
+Revision ID: 0005_change_feed_indexes
+Revises: 0004_books_full_text_search
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_change_feed_indexes'
+down_revision: Union[str, Sequence[str], None] = '0004_books_full_text_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ('ix_books_updated_at_id', 'books', ['updated_at', 'id']),
+    ('ix_categories_updated_at_id', 'categories', ['updated_at', 'id']),
+    ('ix_subcategories_updated_at_id', 'subcategories', ['updated_at', 'id']),
+    ('ix_languages_updated_at_id', 'languages', ['updated_at', 'LanguageID']),
+    ('ix_book_copies_updated_at_id', 'book_copies', ['updated_at', 'CopyID']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, if_not_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,195 @@
+"""soft delete archive tables
+
+archive_deleted.py retention se purani soft-deleted rows (aur unki cascade wali dependent rows)
+yahan le jaata hai. Archive tables me FK nahi hain, taaki parent archive hone par bhi rows bani rahein.
+
+Revision ID: 0006_archive_tables
+Revises: 0005_change_feed_indexes
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_archive_tables'
+down_revision: Union[str, Sequence[str], None] = '0005_change_feed_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('archive_book_copies',
+    sa.Column('CopyID', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('BookID', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('LocationID', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('Status', sa.String(length=50), autoincrement=False, nullable=False),
+    sa.Column('created_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), autoincrement=False, nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('CopyID'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_book_permissions',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('book_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), autoincrement=False, nullable=True),
+    sa.Column('role_id', sa.Integer(), autoincrement=False, nullable=True),
+    sa.Column('created_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_book_subcategory_link',
+    sa.Column('book_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('subcategory_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('book_id', 'subcategory_id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_books',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=255), autoincrement=False, nullable=False),
+    sa.Column('author', sa.String(length=255), autoincrement=False, nullable=True),
+    sa.Column('publisher', sa.String(length=255), autoincrement=False, nullable=True),
+    sa.Column('publication_year', sa.Integer(), autoincrement=False, nullable=True),
+    sa.Column('isbn', sa.String(length=20), autoincrement=False, nullable=True),
+    sa.Column('language_id', sa.Integer(), autoincrement=False, nullable=True),
+    sa.Column('is_digital', sa.Boolean(), autoincrement=False, nullable=True),
+    sa.Column('cover_image_url', sa.Text(), autoincrement=False, nullable=True),
+    sa.Column('description', sa.Text(), autoincrement=False, nullable=True),
+    sa.Column('is_approved', sa.Boolean(), autoincrement=False, nullable=True),
+    sa.Column('is_restricted', sa.Boolean(), autoincrement=False, nullable=True),
+    sa.Column('created_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), autoincrement=False, nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_categories',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sa.String(length=100), autoincrement=False, nullable=False),
+    sa.Column('description', sa.Text(), autoincrement=False, nullable=True),
+    sa.Column('created_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), autoincrement=False, nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_languages',
+    sa.Column('LanguageID', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('LanguageName', sa.String(length=100), autoincrement=False, nullable=False),
+    sa.Column('Description', sa.Text(), autoincrement=False, nullable=True),
+    sa.Column('created_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), autoincrement=False, nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('LanguageID'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_locations',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sa.String(length=100), autoincrement=False, nullable=False),
+    sa.Column('room_name', sa.String(length=50), autoincrement=False, nullable=True),
+    sa.Column('shelf_number', sa.String(length=20), autoincrement=False, nullable=True),
+    sa.Column('section_name', sa.String(length=50), autoincrement=False, nullable=True),
+    sa.Column('description', sa.String(length=255), autoincrement=False, nullable=True),
+    sa.Column('created_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), autoincrement=False, nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_permissions',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sa.String(length=100), autoincrement=False, nullable=False),
+    sa.Column('description', sa.String(length=255), autoincrement=False, nullable=True),
+    sa.Column('created_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), autoincrement=False, nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_role_permissions',
+    sa.Column('role_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('permission_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('role_id', 'permission_id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_roles',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sa.String(length=50), autoincrement=False, nullable=False),
+    sa.Column('created_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), autoincrement=False, nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_subcategories',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sa.String(length=100), autoincrement=False, nullable=False),
+    sa.Column('description', sa.Text(), autoincrement=False, nullable=True),
+    sa.Column('category_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('created_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), autoincrement=False, nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_upload_requests',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('submitted_by_id', sa.Integer(), autoincrement=False, nullable=True),
+    sa.Column('book_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('status', sa.String(length=8), autoincrement=False, nullable=False),
+    sa.Column('reviewed_by_id', sa.Integer(), autoincrement=False, nullable=True),
+    sa.Column('submitted_at', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('reviewed_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('remarks', sa.String(length=500), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('archive_users',
+    sa.Column('ClientID', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('FullName', sa.String(length=255), autoincrement=False, nullable=True),
+    sa.Column('Email', sa.String(length=255), autoincrement=False, nullable=False),
+    sa.Column('Username', sa.String(length=100), autoincrement=False, nullable=False),
+    sa.Column('PasswordHash', sa.String(length=255), autoincrement=False, nullable=False),
+    sa.Column('DateJoined', sa.DateTime(), autoincrement=False, nullable=False),
+    sa.Column('Status', sa.String(length=50), autoincrement=False, nullable=True),
+    sa.Column('RoleID', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), autoincrement=False, nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), autoincrement=False, nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('ClientID'),
+    mysql_engine='InnoDB'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('archive_users')
+    op.drop_table('archive_upload_requests')
+    op.drop_table('archive_subcategories')
+    op.drop_table('archive_roles')
+    op.drop_table('archive_role_permissions')
+    op.drop_table('archive_permissions')
+    op.drop_table('archive_locations')
+    op.drop_table('archive_languages')
+    op.drop_table('archive_categories')
+    op.drop_table('archive_books')
+    op.drop_table('archive_book_subcategory_link')
+    op.drop_table('archive_book_permissions')
+    op.drop_table('archive_book_copies')
@@ -0,0 +1,51 @@
+"""book availability counters
+
+books par copies_total / copies_available / copies_on_loan, taaki catalog page har book ke liye
+book_copies ko GROUP BY na kare. Existing rows ka backfill yahin hota hai; baad me drift
+`python reconcile_availability.py` se pakda / theek kiya jaata hai.
+
+Revision ID: 0007_book_availability_counters
+Revises: 0006_archive_tables
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_book_availability_counters'
+down_revision: Union[str, Sequence[str], None] = '0006_archive_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = ('copies_total', 'copies_available', 'copies_on_loan')
+
+BACKFILL = """
+    UPDATE books SET
+        copies_total = (SELECT count(*) FROM book_copies c
+                        WHERE c."BookID" = books.id AND c.deleted_at IS NULL),
+        copies_available = (SELECT count(*) FROM book_copies c
+                             WHERE c."BookID" = books.id AND c.deleted_at IS NULL AND c."Status" = 'Available'),
+        copies_on_loan = (SELECT count(*) FROM book_copies c
+                          WHERE c."BookID" = books.id AND c.deleted_at IS NULL AND c."Status" = 'On Loan')
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('books', 'archive_books'):
+        with op.batch_alter_table(table) as batch_op:
+            for name in COUNTER_COLUMNS:
+                batch_op.add_column(sa.Column(name, sa.Integer(), server_default='0', nullable=False))
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('archive_books', 'books'):
+        with op.batch_alter_table(table) as batch_op:
+            for name in reversed(COUNTER_COLUMNS):
+                batch_op.drop_column(name)
@@ -0,0 +1,45 @@
+"""books trigram indexes
+
+/api/books/fuzzy ke liye pg_trgm GIN indexes (title, author). SQLite par kuch nahi banta;
+wahan fuzzy_search.py ka in-process trigram index kaam karta hai.
+
+Revision ID: 0008_books_trigram_indexes
+Revises: 0007_book_availability_counters
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_books_trigram_indexes'
+down_revision: Union[str, Sequence[str], None] = '0007_book_availability_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, column)
+INDEXES = [
+    ('ix_books_title_trgm', 'title'),
+    ('ix_books_author_trgm', 'author'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON books USING gin ({column} gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
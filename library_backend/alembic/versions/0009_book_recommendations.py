@@ -0,0 +1,58 @@
+"""book recommendations
+
+"Borrowed together" recommendations ke liye book_cooccurrence (sparse book x book borrower counts),
+book_related (har book ke top-K) aur job_watermarks (aakhri processed IssuedBookID). Tables khali
+bante hain; `python build_recommendations.py --full` pehli baar bharta hai.
+
+Revision ID: 0009_book_recommendations
+Revises: 0008_books_trigram_indexes
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_book_recommendations'
+down_revision: Union[str, Sequence[str], None] = '0008_books_trigram_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('book_cooccurrence',
+    sa.Column('book_id', sa.Integer(), nullable=False),
+    sa.Column('other_book_id', sa.Integer(), nullable=False),
+    sa.Column('borrowers', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('book_id', 'other_book_id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_table('book_related',
+    sa.Column('book_id', sa.Integer(), nullable=False),
+    sa.Column('related_book_id', sa.Integer(), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('borrowed_together', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('book_id', 'related_book_id'),
+    mysql_engine='InnoDB'
+    )
+    op.create_index('ix_book_related_book_id_rank', 'book_related', ['book_id', 'rank'], unique=False)
+    op.create_table('job_watermarks',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('name'),
+    mysql_engine='InnoDB'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_watermarks')
+    op.drop_index('ix_book_related_book_id_rank', table_name='book_related')
+    op.drop_table('book_related')
+    op.drop_table('book_cooccurrence')
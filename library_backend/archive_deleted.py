@@ -0,0 +1,180 @@
+# file: archive_deleted.py
+"""
+Retention se purani soft-deleted rows ko archive_<table> me le jaata hai (cron / scheduler se chalayein).
+
+Usage (library_backend folder se, `alembic upgrade head` ke baad):
+    python archive_deleted.py --dry-run
+    python archive_deleted.py --retention-days 90 --batch-size 500 --sleep 0.2
+    python archive_deleted.py --tables books book_copies
+
+Har batch apni transaction hai (copy -> delete -> commit), isliye locks sirf ek batch tak rehte hain.
+Rows children-first order me jaati hain; jis row ko abhi bhi koi doosri row refer karti hai (jaise
+issued_books wali copy, ya abhi archive na hui child) woh "blocked" gini jaati hai aur source me rehti hai,
+taaki foreign keys kabhi na tootein. ON DELETE CASCADE wali dependent rows (book_subcategory_link,
+book_permissions, role_permissions, upload_requests) parent ke saath hi archive hoti hain.
+Per-table report (candidates, blocked, archived, rows/sec) JSON me stdout par.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import DateTime, Table, delete, exists, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from database import Base, SessionLocal
+# Sabhi models import karein taaki relationships resolve ho sakein
+from models import (
+    book_model, log_model, library_management_models, book_permission_model,
+    language_model, user_model, request_model, permission_model, authz_version_model, archive_model
+)
+from utils import create_log
+import response_cache
+from acl_index import bump_acl_version
+
+ARCHIVE_RETENTION_DAYS = int(os.getenv("ARCHIVE_RETENTION_DAYS", "90"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+
+_CATALOG_TABLES = {"books", "categories", "subcategories", "languages"}
+
+
+def archivable_tables() -> List[Table]:
+    """ Entity tables children-first order me (pehle book_copies, phir books, ...). """
+    return [
+        table for table in reversed(Base.metadata.sorted_tables)
+        if table.name in archive_model.ARCHIVED_ENTITY_TABLES
+    ]
+
+
+def _references(table: Table):
+    """ (dependent foreign keys, blocking foreign keys) jo is table ki rows ko refer karte hain. """
+    dependent, blocking = [], []
+    for other in Base.metadata.sorted_tables:
+        if other.name.startswith("archive_"):
+            continue
+        for fk in other.foreign_keys:
+            if fk.column.table is not table:
+                continue
+            if other.name in archive_model.ARCHIVED_DEPENDENT_TABLES and fk.ondelete == "CASCADE":
+                dependent.append(fk)
+            else:
+                blocking.append(fk)
+    return dependent, blocking
+
+
+def _expired(table: Table, cutoff: datetime):
+    return table.c.deleted_at.is_not(None) & (table.c.deleted_at < cutoff)
+
+
+def _unreferenced(table: Table, blocking):
+    return [~exists().where(fk.parent == fk.column) for fk in blocking]
+
+
+def _copy_rows(db: Session, source: Table, where, archived_at: datetime) -> None:
+    archive = archive_model.archive_tables[source.name]
+    names = [column.name for column in source.columns]
+    db.execute(insert(archive).from_select(
+        names + ["archived_at"],
+        select(*source.columns, literal(archived_at, DateTime)).where(where)
+    ))
+
+
+def archive_table(
+    db: Session, table: Table, cutoff: datetime, batch_size: int,
+    dry_run: bool = False, sleep: float = 0.0, max_batches: Optional[int] = None
+) -> Dict[str, object]:
+    dependent, blocking = _references(table)
+    (pk,) = table.primary_key.columns
+    started = time.perf_counter()
+
+    expired = db.scalar(select(func.count()).select_from(table).where(_expired(table, cutoff)))
+    candidates = db.scalar(
+        select(func.count()).select_from(table).where(_expired(table, cutoff), *_unreferenced(table, blocking))
+    )
+    report = {
+        "table": table.name, "expired": expired, "candidates": candidates, "blocked": expired - candidates,
+        "archived": 0, "dependent_rows": 0, "batches": 0,
+    }
+
+    while not dry_run and (max_batches is None or report["batches"] < max_batches):
+        ids = db.scalars(
+            select(pk).where(_expired(table, cutoff), *_unreferenced(table, blocking)).order_by(pk).limit(batch_size)
+        ).all()
+        if not ids:
+            break
+        archived_at = datetime.utcnow()
+        for fk in dependent:
+            child = fk.parent.table
+            _copy_rows(db, child, fk.parent.in_(ids), archived_at)
+            report["dependent_rows"] += db.execute(delete(child).where(fk.parent.in_(ids))).rowcount
+        _copy_rows(db, table, pk.in_(ids), archived_at)
+        report["archived"] += db.execute(delete(table).where(pk.in_(ids))).rowcount
+        if table.name in _CATALOG_TABLES:
+            # Subcategory/language archive hone par live books ke links badal sakte hain
+            response_cache.invalidate(db, "books", "categories", "languages")
+        if any(fk.parent.table.name == "book_permissions" for fk in dependent):
+            # book_permissions rows hati hain; workers ke ACL index reload hon
+            bump_acl_version(db)
+        db.commit()
+        report["batches"] += 1
+        if sleep:
+            time.sleep(sleep)
+
+    if report["archived"]:
+        create_log(
+            db, None, "RECORDS_ARCHIVED",
+            f"Archived {report['archived']} soft-deleted rows from {table.name} "
+            f"({report['dependent_rows']} dependent rows), deleted before {cutoff.isoformat(timespec='seconds')}.",
+            table.name
+        )
+        db.commit()
+
+    elapsed = time.perf_counter() - started
+    report["elapsed_seconds"] = round(elapsed, 3)
+    report["rows_per_second"] = round(report["archived"] / elapsed, 1) if elapsed and report["archived"] else 0.0
+    return report
+
+
+def archive_deleted(
+    db: Session, retention_days: int = ARCHIVE_RETENTION_DAYS, batch_size: int = ARCHIVE_BATCH_SIZE,
+    tables: Optional[List[str]] = None, dry_run: bool = False, sleep: float = 0.0, max_batches: Optional[int] = None
+) -> dict:
+    """ deleted_at < (ab - retention_days) wali rows archive karta hai; dry_run me sirf counts. """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    selected = [table for table in archivable_tables() if tables is None or table.name in tables]
+    return {
+        "cutoff": cutoff.isoformat(timespec="seconds"),
+        "dry_run": dry_run,
+        "tables": [
+            archive_table(db, table, cutoff, batch_size, dry_run, sleep, max_batches) for table in selected
+        ],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Archive soft-deleted rows older than the retention window.")
+    parser.add_argument("--retention-days", type=int, default=ARCHIVE_RETENTION_DAYS)
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--tables", nargs="+", choices=archive_model.ARCHIVED_ENTITY_TABLES)
+    parser.add_argument("--dry-run", action="store_true", help="Sirf counts; kuch move nahi hota")
+    parser.add_argument("--sleep", type=float, default=0.0, help="Batches ke beech seconds (replication lag / load ke liye)")
+    parser.add_argument("--max-batches", type=int, help="Har table par itne batches ke baad ruk jaayein")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = archive_deleted(
+            db, args.retention_days, args.batch_size, args.tables, args.dry_run, args.sleep, args.max_batches
+        )
+    finally:
+        db.close()
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
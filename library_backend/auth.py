@@ -1,17 +1,27 @@
 # file: auth.py
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import os
 from sqlalchemy.orm import Session, joinedload
 from models import user_model
-from database import SessionLocal
+from database import SessionLocal, AsyncSessionLocal
+from permission_cache import permission_cache, EffectivePermissions
+import authz_versions
 
 SECRET_KEY = "this-is-a-very-secret-key-please-change-it-for-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# Ek worker me ek saath kitne logins bcrypt + DB kaam kar sakte hain
+LOGIN_MAX_CONCURRENCY = int(os.getenv("LOGIN_MAX_CONCURRENCY", "4"))
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # --- NAYA BADLAV YAHAN HAI ---
@@ -24,6 +34,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+# Login ka blocking kaam (sync query + bcrypt) is alag, bounded pool me chalta hai,
+# taaki event loop aur baaki requests ka default threadpool free rahe
+_login_executor = ThreadPoolExecutor(max_workers=LOGIN_MAX_CONCURRENCY, thread_name_prefix="login")
+
+async def run_login_task(func, *args, **kwargs):
+    """ Sync login function ko login pool me chalata hai aur uska result await karta hai. """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_login_executor, functools.partial(func, *args, **kwargs))
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     # ... (yeh function waisa hi rahega)
     to_encode = data.copy()
@@ -41,9 +60,15 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    # Async endpoints ke liye; DB wait ke dauraan threadpool slot nahi gherta
+    async with AsyncSessionLocal() as db:
+        yield db
+
 # --- NAYA BADLAV YAHAN HAI ---
 # get_current_user function ko isse replace karein
-async def get_current_user(token: str | None = Depends(optional_oauth2_scheme), db: Session = Depends(get_db)):
+# Sync dependency hai taaki token version / user lookup threadpool me chale, event loop par nahi
+def get_current_user(token: str | None = Depends(optional_oauth2_scheme), db: Session = Depends(get_db)):
     if token is None:
         return None # Agar token nahi hai, toh koi user nahi hai
 
@@ -60,41 +85,147 @@ async def get_current_user(token: str | None = Depends(optional_oauth2_scheme),
     except JWTError:
         raise credentials_exception
     
+    # Naye tokens me permissions aur version hote hain; version fresh ho toh DB join ki zaroorat nahi
+    token_user = user_from_token_claims(db, payload)
+    if token_user is not None:
+        return token_user
+
     user = db.query(user_model.User).options(joinedload(user_model.User.role)).filter(user_model.User.username == username).first()
     if user is None:
         raise credentials_exception
     return user
 
-# require_permission function waisa hi rahega, kyunki woh get_current_user par depend karta hai
+@dataclass(frozen=True)
+class TokenRole:
+    id: int
+    name: str
+
+@dataclass(frozen=True)
+class TokenUser:
+    """
+    JWT claims se bana user. Controllers isse ORM User ki tarah padhte hain
+    (id, username, role_id, status, role.name), lekin yeh DB se load nahi hota.
+    """
+    id: int
+    username: str
+    role_id: int
+    status: str
+    role: TokenRole
+    permissions: EffectivePermissions
+
+def build_token_claims(db: Session, user: user_model.User) -> dict:
+    """ Login ke waqt token me jaane wale claims: identity, permissions aur authz versions. """
+    role_scope = authz_versions.role_scope(user.role_id)
+    user_scope = authz_versions.user_scope(user.id)
+    versions = authz_versions.get_versions(db, [role_scope, user_scope])
+    effective = permission_cache.get_or_load(
+        user.id, user.role_id,
+        lambda: load_effective_permissions(db, user.role_id),
+        versions[role_scope]
+    )
+    return {
+        "sub": user.username,
+        "role": user.role.name,
+        "uid": user.id,
+        "rid": user.role_id,
+        "perms": sorted(effective.permissions) if effective else [],
+        "rv": versions[role_scope],
+        "uv": versions[user_scope],
+    }
+
+def user_from_token_claims(db: Session, payload: dict) -> TokenUser | None:
+    """ Claims valid aur versions current hon toh TokenUser, warna None (DB fallback). """
+    try:
+        user_id, role_id = int(payload["uid"]), int(payload["rid"])
+        role_name, perms = str(payload["role"]), payload["perms"]
+        role_version, user_version = int(payload["rv"]), int(payload["uv"])
+    except (KeyError, TypeError, ValueError):
+        return None # Purana token format
+
+    role_scope = authz_versions.role_scope(role_id)
+    user_scope = authz_versions.user_scope(user_id)
+    versions = authz_versions.get_versions(db, [role_scope, user_scope])
+    if versions[role_scope] != role_version or versions[user_scope] != user_version:
+        return None # Stale token, DB se dobara resolve karein
+
+    effective = EffectivePermissions(role_id=role_id, role_name=role_name, permissions=frozenset(perms))
+    return TokenUser(
+        id=user_id,
+        username=payload["sub"],
+        role_id=role_id,
+        status="Active", # Token sirf Active users ko milta hai; status / role badalne par authz_versions ka flush hook user version bump karta hai
+        role=TokenRole(id=role_id, name=role_name),
+        permissions=effective
+    )
+
+def load_effective_permissions(db: Session, role_id: int) -> EffectivePermissions | None:
+    """ Role aur uski permissions ko ek hi query me load karke snapshot banata hai. """
+    role = db.query(user_model.Role).options(joinedload(user_model.Role.permissions)) \
+        .filter(user_model.Role.id == role_id).one_or_none()
+    if role is None:
+        return None
+    return EffectivePermissions(
+        role_id=role.id,
+        role_name=role.name,
+        permissions=frozenset(p.name for p in role.permissions)
+    )
+
+@dataclass
+class Principal:
+    """ Ek request ka authenticated user aur uski resolved permissions. """
+    user: user_model.User | TokenUser
+    permissions: EffectivePermissions | None
+
+    def allows(self, permission_name: str) -> bool:
+        return self.permissions is not None and self.permissions.allows(permission_name)
+
+def get_principal(
+    request: Request,
+    current_user: user_model.User | None = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Principal | None:
+    """
+    Principal ko request me sirf ek baar banata hai aur request.state par rakhta hai,
+    taaki ek endpoint ke sabhi require_permission checks use share karein.
+    """
+    if hasattr(request.state, "principal"):
+        return request.state.principal
+
+    principal = None
+    if isinstance(current_user, TokenUser):
+        principal = Principal(user=current_user, permissions=current_user.permissions)
+    elif current_user is not None:
+        # Role version ke saath lookup: doosre worker me hua revoke bhi purana cached snapshot stale kar deta hai
+        role_scope = authz_versions.role_scope(current_user.role_id)
+        role_version = authz_versions.get_versions(db, [role_scope])[role_scope]
+        effective = permission_cache.get_or_load(
+            current_user.id, current_user.role_id,
+            lambda: load_effective_permissions(db, current_user.role_id),
+            role_version
+        )
+        principal = Principal(user=current_user, permissions=effective)
+
+    request.state.principal = principal
+    return principal
+
+# Har permission check ab request ke shared Principal par chalta hai, koi extra query nahi
 def require_permission(permission_name: str):
-    async def permission_checker(
-        current_user: user_model.User = Depends(get_current_user), # Yeh ab None bhi ho sakta hai
-        db: Session = Depends(get_db)
-    ):
-        if not current_user:
+    async def permission_checker(principal: Principal | None = Depends(get_principal)):
+        if not principal:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
-        if current_user.status != "Active":
+        if principal.user.status != "Active":
              raise HTTPException(status_code=400, detail="Inactive user, please contact admin.")
 
-        # ... (baaki ka permission check logic waisa hi rahega) ...
-        user_with_role_and_permissions = db.query(user_model.User) \
-            .options(joinedload(user_model.User.role).joinedload(user_model.Role.permissions)) \
-            .filter(user_model.User.id == current_user.id).one_or_none()
-
-        if not user_with_role_and_permissions or not user_with_role_and_permissions.role:
+        if principal.permissions is None:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User has no role assigned.")
-        
-        if user_with_role_and_permissions.role.name.lower() == 'admin':
-            return user_with_role_and_permissions
 
-        user_permissions = {p.name for p in user_with_role_and_permissions.role.permissions}
-        if permission_name not in user_permissions:
+        if not principal.allows(permission_name):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Permission '{permission_name}' required to perform this action."
             )
         
-        return user_with_role_and_permissions
+        return principal.user
         
-    return permission_checker
\ No newline at end of file
+    return permission_checker
@@ -0,0 +1,107 @@
+# file: authz_versions.py
+import os
+import threading
+import time
+from typing import Dict, Iterable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from models.authz_version_model import AuthzVersion
+from models import user_model
+
+# Doosre workers ke bump kitni der me dikhenge, yeh isi TTL se tay hota hai
+AUTHZ_VERSION_TTL_SECONDS = float(os.getenv("AUTHZ_VERSION_TTL_SECONDS", "5"))
+
+# In User attributes ke badalne par token ke "uv" claim wala user version badhta hai
+USER_VERSION_ATTRIBUTES = ("status", "role_id", "deleted_at")
+
+_lock = threading.Lock()
+_versions: Dict[str, tuple] = {}
+
+
+def role_scope(role_id: int) -> str:
+    return f"role:{role_id}"
+
+
+def user_scope(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def get_versions(db: Session, scopes: Iterable[str]) -> Dict[str, int]:
+    """
+    Scopes ke current versions return karta hai. Cached values TTL tak reuse hoti hain;
+    expire hui scopes ek hi query me reload hoti hain. Jis scope ki row nahi hai uska version 0 hai.
+    """
+    scopes = list(scopes)
+    now = time.monotonic()
+    result, missing = {}, []
+    with _lock:
+        for scope in scopes:
+            entry = _versions.get(scope)
+            if entry is not None and entry[0] > now:
+                result[scope] = entry[1]
+            else:
+                missing.append(scope)
+
+    if missing:
+        rows = db.query(AuthzVersion.scope, AuthzVersion.version).filter(AuthzVersion.scope.in_(missing)).all()
+        loaded = {scope: 0 for scope in missing}
+        loaded.update({row.scope: row.version for row in rows})
+        with _lock:
+            for scope, version in loaded.items():
+                _versions[scope] = (now + AUTHZ_VERSION_TTL_SECONDS, version)
+        result.update(loaded)
+    return result
+
+
+def bump_version(db: Session, scope: str) -> None:
+    """
+    Scope ka version badhata hai. Commit calling function karega;
+    commit ke baad forget() call karein taaki is worker ka cache turant fresh ho.
+    """
+    updated = db.query(AuthzVersion).filter(AuthzVersion.scope == scope) \
+        .update({AuthzVersion.version: AuthzVersion.version + 1}, synchronize_session=False)
+    if not updated:
+        db.add(AuthzVersion(scope=scope, version=1))
+
+
+def bump_role_version(db: Session, role_id: int) -> None:
+    bump_version(db, role_scope(role_id))
+
+
+def bump_user_version(db: Session, user_id: int) -> None:
+    bump_version(db, user_scope(user_id))
+
+
+def forget(*scopes: str) -> None:
+    with _lock:
+        for scope in scopes:
+            _versions.pop(scope, None)
+
+
+# --- Session events: user ka status / role badle ya user delete ho toh usi flush me user version bump ---
+
+@event.listens_for(Session, "before_flush")
+def _bump_changed_users(session, flush_context, instances):
+    for obj in list(session.dirty) + list(session.deleted):
+        if not isinstance(obj, user_model.User) or obj.id is None:
+            continue
+        state = inspect(obj)
+        if obj in session.deleted or any(state.attrs[key].history.has_changes() for key in USER_VERSION_ATTRIBUTES):
+            scope = user_scope(obj.id)
+            bumped = session.info.setdefault("authz_users_bumped", set())
+            if scope not in bumped:
+                bump_version(session, scope)
+                bumped.add(scope)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_bumped_users(session):
+    scopes = session.info.pop("authz_users_bumped", None)
+    if scopes:
+        forget(*scopes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_bumped_users(session):
+    session.info.pop("authz_users_bumped", None)
@@ -0,0 +1,102 @@
+# file: availability.py
+from typing import Dict, List
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+
+from models import book_model, library_management_models as lm
+import response_cache
+
+AVAILABLE, ON_LOAN = "Available", "On Loan"
+
+COUNTER_COLUMNS = ("copies_total", "copies_available", "copies_on_loan")
+
+
+def status_counts(status: str) -> Dict[str, int]:
+    """ Ek copy ka counters me hissa (total har live copy ka, baaki status ke hisaab se). """
+    return {
+        "copies_total": 1,
+        "copies_available": 1 if status == AVAILABLE else 0,
+        "copies_on_loan": 1 if status == ON_LOAN else 0,
+    }
+
+
+def adjust_counters(db: Session, book_id: int, **deltas: int) -> None:
+    """
+    Book ke counters `column = column + delta` se badalta hai, caller ki transaction me.
+    Read-modify-write nahi hai, isliye ek hi book par parallel issue/return ke updates khote nahi.
+    """
+    Book = book_model.Book
+    values = {name: getattr(Book, name) + delta for name, delta in deltas.items() if delta}
+    if values:
+        db.execute(
+            update(Book).where(Book.id == book_id).values(**values).execution_options(synchronize_session=False)
+        )
+
+
+def move_copy(db: Session, copy, new_status: str) -> None:
+    """ Copy ka status badalne se pehle call karein (issue / return); soft-deleted copy counters me nahi gini jaati. """
+    if copy.deleted_at is not None or copy.status == new_status:
+        return
+    old, new = status_counts(copy.status), status_counts(new_status)
+    adjust_counters(db, copy.book_id, **{name: new[name] - old[name] for name in COUNTER_COLUMNS})
+
+
+def actual_counts_query():
+    """ book_copies se asli counts (sirf live copies), book ke hisaab se group. """
+    Copy = lm.BookCopy
+    return (
+        select(
+            Copy.book_id,
+            func.count().label("copies_total"),
+            func.sum(case((Copy.status == AVAILABLE, 1), else_=0)).label("copies_available"),
+            func.sum(case((Copy.status == ON_LOAN, 1), else_=0)).label("copies_on_loan"),
+        )
+        .where(Copy.deleted_at.is_(None))
+        .group_by(Copy.book_id)
+    )
+
+
+def reconcile(db: Session, fix: bool = True, batch_size: int = 1000, max_reported: int = 100) -> dict:
+    """
+    Sab books ke counters book_copies se dobara gin kar compare karta hai (id order me batches, har batch ek GROUP BY).
+    fix=True par jin books me drift hai sirf unhe update karke har batch commit hota hai. Batch ki book rows
+    FOR UPDATE lock hoti hain, taaki beech me chalne wala issue/return apna delta fixed value ke upar hi lagaye.
+    """
+    Book = book_model.Book
+    report = {"books_checked": 0, "books_drifted": 0, "fixed": fix, "drift": []}
+    last_id = 0
+    while True:
+        query = (
+            select(Book.id, *[getattr(Book, name) for name in COUNTER_COLUMNS])
+            .where(Book.id > last_id).order_by(Book.id).limit(batch_size)
+        )
+        books = db.execute(query.with_for_update() if fix else query).all()
+        if not books:
+            break
+        last_id = books[-1].id
+        ids = [row.id for row in books]
+        actual = {
+            row.book_id: row for row in db.execute(actual_counts_query().where(lm.BookCopy.book_id.in_(ids)))
+        }
+
+        drifted: List[dict] = []
+        for row in books:
+            counted = actual.get(row.id)
+            expected = {name: int(getattr(counted, name)) if counted else 0 for name in COUNTER_COLUMNS}
+            stored = {name: getattr(row, name) for name in COUNTER_COLUMNS}
+            if stored != expected:
+                drifted.append({"book_id": row.id, "stored": stored, "actual": expected})
+
+        report["books_checked"] += len(books)
+        report["books_drifted"] += len(drifted)
+        report["drift"].extend(drifted[:max(0, max_reported - len(report["drift"]))])
+        if fix and drifted:
+            for item in drifted:
+                db.execute(
+                    update(Book).where(Book.id == item["book_id"]).values(**item["actual"])
+                    .execution_options(synchronize_session=False)
+                )
+            response_cache.invalidate(db, "books")
+        db.commit()
+    return report
@@ -0,0 +1,120 @@
+# file: bench_catalog_async.py
+"""
+Public catalog list query (GET /api/books jaisi: live, approved, non-restricted books, subcategories aur
+language ke saath) ka throughput do tarah se naapta hai:
+  sync:  SessionLocal, ek thread pool me (FastAPI ka default threadpool 40 threads ka hai)
+  async: AsyncSessionLocal, ek event loop par asyncio tasks
+Dono me utne hi requests ek saath chalte hain; report requests/second aur p50 / p99 latency deti hai.
+
+Usage (library_backend folder se, DATABASE_URL / ASYNC_DATABASE_URL wahi jo server use karta hai):
+    python bench_catalog_async.py
+    python bench_catalog_async.py --concurrency 10 40 100 --requests 2000 --limit 100
+
+Asli sawaal hosted Postgres (asyncpg) ka hai. SQLite par aiosqlite har connection ke liye ek helper thread
+chalata hai, isliye wahan ke numbers sirf script check karne ke kaam ke hain.
+Report JSON stdout par.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
+
+from database import AsyncSessionLocal, SessionLocal, async_engine, engine
+# Sabhi models import karein taaki relationships resolve ho sakein
+from models import (
+    book_model, log_model, library_management_models, book_permission_model,
+    language_model, user_model, request_model, permission_model, authz_version_model, archive_model,
+    recommendation_model
+)
+
+
+def catalog_query(limit: int):
+    Book = book_model.Book
+    return (
+        select(Book)
+        .options(selectinload(Book.subcategories).joinedload(book_model.Subcategory.category), joinedload(Book.language))
+        .filter(Book.is_restricted == False, Book.is_approved == True, Book.deleted_at.is_(None))
+        .order_by(Book.id)
+        .limit(limit)
+    )
+
+
+def _summary(mode: str, concurrency: int, latencies: list, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "requests": len(ordered),
+        "requests_per_second": round(len(ordered) / elapsed, 1),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+    }
+
+
+def run_sync(concurrency: int, requests: int, limit: int) -> dict:
+    query = catalog_query(limit)
+
+    def one_request() -> float:
+        start = time.perf_counter()
+        db = SessionLocal()
+        try:
+            db.execute(query).scalars().all()
+        finally:
+            db.close()
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(lambda _: one_request(), range(requests)))
+    return _summary("sync", concurrency, latencies, time.perf_counter() - start)
+
+
+async def run_async(concurrency: int, requests: int, limit: int) -> dict:
+    query = catalog_query(limit)
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one_request() -> float:
+        async with gate:
+            start = time.perf_counter()
+            async with AsyncSessionLocal() as db:
+                (await db.execute(query)).scalars().all()
+            return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(one_request() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await async_engine.dispose()  # Pool isi event loop se bandha hai
+    return _summary("async", concurrency, latencies, elapsed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare sync and async sessions on the public catalog list query.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 40, 100])
+    parser.add_argument("--requests", type=int, default=1000, help="Har run me kitni queries")
+    parser.add_argument("--limit", type=int, default=100, help="Har query me kitni books (?limit=)")
+    args = parser.parse_args()
+
+    # Warm-up: connections aur mapper configuration measurement se bahar
+    run_sync(2, 10, args.limit)
+    asyncio.run(run_async(2, 10, args.limit))
+
+    runs = []
+    for concurrency in args.concurrency:
+        runs.append(run_sync(concurrency, args.requests, args.limit))
+        runs.append(asyncio.run(run_async(concurrency, args.requests, args.limit)))
+    print(json.dumps({
+        "sync_url": engine.url.render_as_string(hide_password=True),
+        "async_url": async_engine.url.render_as_string(hide_password=True),
+        "runs": runs,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# file: bench_fuzzy.py
+"""
+In-process trigram index (GET /api/books/fuzzy, non-Postgres) ka benchmark: ek scratch SQLite database me
+synthetic books daal kar BookTrigramIndex.load ka time, aur har threshold par typo wali queries ki
+p50 / p95 latency naapta hai. Saath me ek book badalne ke baad incremental refresh ka time.
+
+Usage (library_backend folder se):
+    python bench_fuzzy.py
+    python bench_fuzzy.py --books 200000 --thresholds 0.2 0.3 0.5 --queries 500
+
+Configured DATABASE_URL ko nahi chhoota; --db ki SQLite file (default temp folder me) har run par naye sire se banti hai.
+Report JSON stdout par.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+LETTERS = "etaoinshrdlcumwfgypbvkjxqz"
+LETTER_WEIGHTS = [12, 9, 8, 7, 7, 6, 6, 6, 6, 4, 4, 3, 3, 2, 2, 2, 2, 2, 2, 1.5, 1, 0.8, 0.2, 0.2, 0.1, 0.1]
+
+
+def word_generator(rng: random.Random, vocabulary_size: int = 30000):
+    """ English jaisi letter frequency wale words; Zipf jaisa distribution taaki common words baar baar aayein. """
+    vocabulary = ["".join(rng.choices(LETTERS, LETTER_WEIGHTS, k=rng.randint(3, 10))) for _ in range(vocabulary_size)]
+    cumulative = list(itertools.accumulate(1 / (i + 1) ** 0.8 for i in range(vocabulary_size)))
+    return lambda: rng.choices(vocabulary, cum_weights=cumulative)[0].capitalize()
+
+
+def with_typo(rng: random.Random, value: str) -> str:
+    i = rng.randrange(len(value))
+    return value[:i] + value[i + 1:]
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the in-process trigram index behind /api/books/fuzzy.")
+    parser.add_argument("--books", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.3, 0.5])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "bench_fuzzy.db"))
+    args = parser.parse_args()
+
+    if os.path.exists(args.db):
+        os.remove(args.db)
+    # database module DATABASE_URL import par padhta hai, isliye imports iske baad
+    os.environ["DATABASE_URL"] = f"sqlite:///{args.db}"
+    os.environ["DATABASE_REPLICA_URLS"] = ""
+    from sqlalchemy import insert
+    from database import Base, SessionLocal, engine
+    # Sabhi models import karein taaki relationships resolve ho sakein
+    from models import (
+        book_model, log_model, library_management_models, book_permission_model,
+        language_model, user_model, request_model, permission_model, authz_version_model, archive_model,
+        recommendation_model
+    )
+    from fuzzy_search import BookTrigramIndex
+
+    rng = random.Random(args.seed)
+    word = word_generator(rng)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        language = language_model.Language(name="English")
+        db.add(language)
+        db.commit()
+        rows = [
+            dict(
+                title=" ".join(word() for _ in range(rng.randint(2, 6))), author=f"{word()} {word()}",
+                language_id=language.id, is_approved=True, is_restricted=False
+            )
+            for _ in range(args.books)
+        ]
+        db.execute(insert(book_model.Book), rows)
+        db.commit()
+
+        index = BookTrigramIndex()
+        start = time.perf_counter()
+        index.load(db)
+        load_seconds = time.perf_counter() - start
+
+        # Aadhi queries title ke pehle do words, aadhi author; har ek me ek letter gayab
+        queries = []
+        for _ in range(args.queries):
+            row = rng.choice(rows)
+            source = " ".join(row["title"].split()[:2]) if rng.random() < 0.5 else row["author"]
+            queries.append(with_typo(rng, source))
+
+        thresholds = []
+        for threshold in args.thresholds:
+            latencies, with_matches = [], 0
+            for q in queries:
+                start = time.perf_counter()
+                matches = index.search(q, threshold, args.limit)
+                latencies.append((time.perf_counter() - start) * 1000)
+                with_matches += bool(matches)
+            thresholds.append({
+                "threshold": threshold,
+                "p50_ms": round(_percentile(latencies, 0.50), 2),
+                "p95_ms": round(_percentile(latencies, 0.95), 2),
+                "queries_with_matches": with_matches,
+            })
+
+        book = db.get(book_model.Book, 1)
+        book.title = "Completely New Title"
+        db.commit()
+        start = time.perf_counter()
+        index.mark_stale([book.id])
+        index.ensure_fresh(db)
+        incremental_ms = (time.perf_counter() - start) * 1000
+    finally:
+        db.close()
+
+    print(json.dumps({
+        "books": args.books,
+        "queries": args.queries,
+        "load_seconds": round(load_seconds, 2),
+        "index": index.stats(),
+        "thresholds": thresholds,
+        "incremental_refresh_ms": round(incremental_ms, 2),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+# file: bench_login.py
+"""
+Login load ke dauraan baaki requests ki latency: kuch threads /token par lagataar login karte hain
+(har login me bcrypt), aur ek probe thread ek unrelated GET ki p50 / p99 latency naapta hai.
+Pehle bina login load ke baseline, phir har --login-threads value ke saath ek run.
+
+Usage (server pehle se chal raha ho, jaise `uvicorn main:app` ya gunicorn):
+    python bench_login.py --username admin --password secret
+    python bench_login.py --base-url http://127.0.0.1:8000 --login-threads 1 8 --duration 20
+
+Sahi password dein: failed logins login_throttle se bcrypt se pehle 429 ho jaate hain aur load naap nahi paate.
+Report JSON stdout par (logins_throttled > 0 ho toh run bharosemand nahi).
+"""
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+def _request(url: str, data: bytes = None) -> int:
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data), timeout=60) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run(base_url: str, probe_path: str, form: bytes, login_threads: int, duration: float, probe_interval: float) -> dict:
+    stop = threading.Event()
+    login_statuses = []
+    lock = threading.Lock()
+
+    def hammer_login():
+        while not stop.is_set():
+            code = _request(f"{base_url}/token", form)
+            with lock:
+                login_statuses.append(code)
+
+    workers = [threading.Thread(target=hammer_login, daemon=True) for _ in range(login_threads)]
+    for worker in workers:
+        worker.start()
+    time.sleep(1.0 if login_threads else 0)  # Login load chadhne dein
+
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        if _request(f"{base_url}{probe_path}") != 200:
+            errors += 1
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(probe_interval)
+
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return {
+        "login_threads": login_threads,
+        "probes": len(latencies),
+        "probe_errors": errors,
+        "probe_p50_ms": round(statistics.median(latencies), 1),
+        "probe_p99_ms": round(_percentile(latencies, 0.99), 1),
+        "probe_max_ms": round(max(latencies), 1),
+        "logins": len(login_statuses),
+        "logins_per_second": round(len(login_statuses) / duration, 1),
+        "logins_throttled": login_statuses.count(429),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure GET latency while /token is under login load.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--probe-path", default="/api/languages/", help="Login se alag koi GET endpoint")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--login-threads", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--duration", type=float, default=20.0, help="Har run kitne seconds")
+    parser.add_argument("--probe-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    form = urllib.parse.urlencode({"username": args.username, "password": args.password}).encode()
+    if _request(f"{base_url}/token", form) != 200:
+        print("Login fail hua: username / password aur --base-url check karein.", file=sys.stderr)
+        return 1
+    for _ in range(5):
+        _request(f"{base_url}{args.probe_path}")  # Warm-up, taaki pehli request baseline p99 na bigaade
+
+    runs = [run(base_url, args.probe_path, form, threads, args.duration, args.probe_interval)
+            for threads in [0] + args.login_threads]
+    print(json.dumps({"base_url": base_url, "probe_path": args.probe_path, "runs": runs}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
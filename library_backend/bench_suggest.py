@@ -0,0 +1,123 @@
+# file: bench_suggest.py
+"""
+Type-ahead index (GET /api/suggest) ka benchmark: scratch SQLite database me synthetic books aur users daal kar
+SuggestIndex.load ka time aur har kind (book / author / user) ke SuggestIndex.suggest lookups ki p50 / p99 latency
+(microseconds) naapta hai. Target: har lookup 1 ms se kam; `under_1ms` batata hai kitne lookups us se kam the.
+
+Usage (library_backend folder se):
+    python bench_suggest.py
+    python bench_suggest.py --books 200000 --lookups 5000 --limit 25
+
+Configured DATABASE_URL ko nahi chhoota; --db ki SQLite file (default temp folder me) har run par naye sire se banti hai.
+Report JSON stdout par.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from bench_fuzzy import word_generator
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SuggestIndex.suggest lookups behind /api/suggest.")
+    parser.add_argument("--books", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=2000, help="Har kind ke liye kitne lookups")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "bench_suggest.db"))
+    args = parser.parse_args()
+
+    if os.path.exists(args.db):
+        os.remove(args.db)
+    # database module DATABASE_URL import par padhta hai, isliye imports iske baad
+    os.environ["DATABASE_URL"] = f"sqlite:///{args.db}"
+    os.environ["DATABASE_REPLICA_URLS"] = ""
+    from sqlalchemy import insert
+    from database import Base, SessionLocal, engine
+    # Sabhi models import karein taaki relationships resolve ho sakein
+    from models import (
+        book_model, log_model, library_management_models, book_permission_model,
+        language_model, user_model, request_model, permission_model, authz_version_model, archive_model,
+        recommendation_model
+    )
+    from suggest_index import SuggestIndex
+
+    rng = random.Random(args.seed)
+    word = word_generator(rng)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        language = language_model.Language(name="English")
+        role = user_model.Role(name="Member")
+        db.add_all([language, role])
+        db.commit()
+        # Har author ki aam taur par kai books, jaise asli catalog me
+        authors = [f"{word()} {word()}" for _ in range(max(1, args.books // 5))]
+        titles = [" ".join(word() for _ in range(rng.randint(2, 7))) for _ in range(args.books)]
+        db.execute(insert(book_model.Book), [
+            dict(
+                title=title, author=rng.choice(authors), language_id=language.id,
+                is_approved=rng.random() < 0.9, is_restricted=rng.random() < 0.02
+            )
+            for title in titles
+        ])
+        usernames = [f"{word().lower()}{i}" for i in range(args.users)]
+        db.execute(insert(user_model.User), [
+            dict(
+                username=username, email=f"{username}@example.com", full_name=f"{word()} {word()}",
+                password_hash="x", role_id=role.id
+            )
+            for username in usernames
+        ])
+        db.commit()
+
+        index = SuggestIndex()
+        start = time.perf_counter()
+        index.load(db)
+        load_seconds = time.perf_counter() - start
+    finally:
+        db.close()
+
+    sources = {"book": titles, "author": authors, "user": usernames}
+    kinds = []
+    for kind, values in sources.items():
+        latencies = []
+        for _ in range(args.lookups):
+            # Kisi bhi word ke 1-5 shuruati letters, jaise user type karta hai
+            typed = rng.choice(rng.choice(values).split())
+            prefix = typed[:rng.randint(1, min(5, len(typed)))]
+            scope = rng.choice(["public", "all"]) if kind != "user" else "public"
+            start = time.perf_counter()
+            index.suggest(kind, prefix, args.limit, scope)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+        kinds.append({
+            "kind": kind,
+            "p50_us": round(_percentile(latencies, 0.50)),
+            "p99_us": round(_percentile(latencies, 0.99)),
+            "max_us": round(max(latencies)),
+            "under_1ms": round(sum(1 for latency in latencies if latency < 1000) / len(latencies), 4),
+        })
+
+    print(json.dumps({
+        "books": args.books,
+        "users": args.users,
+        "limit": args.limit,
+        "load_seconds": round(load_seconds, 2),
+        "index": index.stats(),
+        "lookups": kinds,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
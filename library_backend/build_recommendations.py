@@ -0,0 +1,44 @@
+# file: build_recommendations.py
+"""
+issued_books se "borrowed together" recommendations (book_cooccurrence + book_related) update karta hai.
+Default run incremental hai: sirf pichhli run ke baad ke issues process hote hain.
+
+Usage (library_backend folder se, cron me har kuch minute):
+    python build_recommendations.py
+    python build_recommendations.py --full --top-k 30
+
+Report JSON stdout par.
+"""
+import argparse
+import json
+import sys
+
+from database import SessionLocal
+# Sabhi models import karein taaki relationships resolve ho sakein
+from models import (
+    book_model, log_model, library_management_models, book_permission_model,
+    language_model, user_model, request_model, permission_model, authz_version_model, archive_model,
+    recommendation_model
+)
+import recommendations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Refresh borrowed-together book recommendations from new issues.")
+    parser.add_argument("--full", action="store_true", help="Poori issue history se matrix dobara banayein")
+    parser.add_argument("--top-k", type=int, default=recommendations.RELATED_TOP_K)
+    parser.add_argument("--min-borrowers", type=int, default=recommendations.RELATED_MIN_BORROWERS)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = recommendations.refresh(db, args.full, args.top_k, args.min_borrowers)
+    finally:
+        db.close()
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# file: catalog_export.py
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+from typing import Callable, Iterator, List, Optional
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from database import SessionLocal
+from models import book_model, language_model, library_management_models as lm
+
+# Server-side cursor se ek baar me itni rows aati hain; memory isi par tikti hai, export size par nahi
+EXPORT_YIELD_PER = int(os.getenv("EXPORT_YIELD_PER", "1000"))
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+BOOK_EXPORT_COLUMNS = (
+    "id", "title", "author", "publisher", "publication_year", "isbn", "language_id", "language",
+    "is_digital", "description", "cover_image_url", "is_approved", "is_restricted", "created_at", "subcategory_ids",
+)
+COPY_EXPORT_COLUMNS = (
+    "id", "book_id", "book_title", "isbn", "location_id", "location", "status", "created_at",
+)
+
+
+def books_export_query():
+    """ Sabhi live books (restricted/unapproved bhi, yeh staff export hai); language naam join se. """
+    Book, Language = book_model.Book, language_model.Language
+    return (
+        select(
+            Book.id, Book.title, Book.author, Book.publisher, Book.publication_year, Book.isbn,
+            Book.language_id, Language.name.label("language"), Book.is_digital, Book.description,
+            Book.cover_image_url, Book.is_approved, Book.is_restricted, Book.created_at,
+        )
+        .outerjoin(Language, Language.id == Book.language_id)
+        .where(Book.deleted_at.is_(None))
+        .order_by(Book.id)
+    )
+
+
+def copies_export_query():
+    Book, Copy, Location = book_model.Book, lm.BookCopy, lm.Location
+    return (
+        select(
+            Copy.id, Copy.book_id, Book.title.label("book_title"), Book.isbn, Copy.location_id,
+            Location.name.label("location"), Copy.status, Copy.created_at,
+        )
+        .join(Book, Book.id == Copy.book_id)
+        .outerjoin(Location, Location.id == Copy.location_id)
+        .where(Copy.deleted_at.is_(None))
+        .order_by(Copy.id)
+    )
+
+
+def add_subcategory_ids(db, rows: List[dict]) -> None:
+    """ Har partition ki books ke subcategory ids ek link-table query se ("3|7", import format jaisa). """
+    link = book_model.book_subcategory_link
+    ids = {row["id"]: [] for row in rows}
+    for book_id, subcategory_id in db.execute(
+        select(link.c.book_id, link.c.subcategory_id).where(link.c.book_id.in_(ids)).order_by(link.c.subcategory_id)
+    ):
+        ids[book_id].append(subcategory_id)
+    for row in rows:
+        row["subcategory_ids"] = ids[row["id"]]
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _encode(rows: List[dict], columns, file_format: str) -> str:
+    if file_format == "ndjson":
+        return "".join(json.dumps(row, default=_json_default, ensure_ascii=False) + "\n" for row in rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            "|".join(map(str, value)) if isinstance(value, list)
+            else value.isoformat() if isinstance(value, (datetime, date))
+            else value
+            for value in (row.get(column) for column in columns)
+        ])
+    return buffer.getvalue()
+
+
+def stream_rows(query, columns, file_format: str, enrich: Optional[Callable] = None) -> Iterator[str]:
+    """
+    Query ko yield_per ke partitions me padh kar encoded chunks deta hai.
+    Apna session kholta hai, kyunki StreamingResponse request dependencies ke baad tak chalta hai.
+    """
+    db = SessionLocal()
+    try:
+        if file_format == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(columns)
+            yield buffer.getvalue()
+        result = db.execute(query.execution_options(yield_per=EXPORT_YIELD_PER))
+        for partition in result.partitions():
+            rows = [dict(row._mapping) for row in partition]
+            if enrich is not None:
+                enrich(db, rows)
+            yield _encode(rows, columns, file_format)
+    finally:
+        db.close()
+
+
+def export_response(query, columns, file_format: str, filename: str, enrich: Optional[Callable] = None) -> StreamingResponse:
+    return StreamingResponse(
+        stream_rows(query, columns, file_format, enrich),
+        media_type=MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{file_format}"'},
+    )
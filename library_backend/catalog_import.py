@@ -0,0 +1,250 @@
+# file: catalog_import.py
+import csv
+import io
+import json
+import os
+import time
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from sqlalchemy import func, insert, or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from models import book_model, language_model, user_model
+from utils import create_log
+from facet_index import book_facet_index
+from fuzzy_search import book_trigram_index
+from suggest_index import suggest_index
+import response_cache
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+# Report me itni row errors tak detail; baaki sirf count me
+IMPORT_MAX_REPORTED_ERRORS = int(os.getenv("IMPORT_MAX_REPORTED_ERRORS", "1000"))
+
+
+class BookImportRow(BaseModel):
+    """ Import file ki ek row. Language naam (`language`) ya `language_id` se; subcategory_ids CSV me "1|2" format me. """
+    title: str = Field(..., min_length=1, max_length=255)
+    author: Optional[str] = None
+    publisher: Optional[str] = None
+    publication_year: Optional[int] = None
+    isbn: Optional[str] = Field(None, max_length=20)
+    is_digital: bool = False
+    description: Optional[str] = None
+    cover_image_url: Optional[str] = None
+    language_id: Optional[int] = None
+    language: Optional[str] = None
+    subcategory_ids: List[int] = []
+
+    @field_validator("subcategory_ids", mode="before")
+    @classmethod
+    def split_ids(cls, value):
+        if isinstance(value, str):
+            return [part.strip() for part in value.replace(",", "|").split("|") if part.strip()]
+        return value or []
+
+
+class ImportReport:
+    def __init__(self):
+        self.total_rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+        self.started = time.perf_counter()
+
+    def error(self, row_number: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row_number, "error": message})
+
+    def as_dict(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "total_rows": self.total_rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": sorted(self.errors, key=lambda e: e["row"]),
+            "errors_truncated": self.failed > len(self.errors),
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(self.total_rows / elapsed, 1) if elapsed else 0.0,
+        }
+
+
+def _clean(record: dict) -> dict:
+    # CSV ki khaali cells ko None maanein
+    return {key.strip(): (None if value == "" else value) for key, value in record.items() if key}
+
+
+def iter_csv_rows(stream: IO[str]) -> Iterator[Tuple[int, object]]:
+    """ (row number, dict) deta hai; header line 1 hai, isliye data rows 2 se shuru. """
+    for row_number, record in enumerate(csv.DictReader(stream), start=2):
+        yield row_number, _clean(record)
+
+
+def iter_jsonl_rows(stream: IO[str]) -> Iterator[Tuple[int, object]]:
+    """ (line number, dict ya parse error string) deta hai; khaali lines skip. """
+    for row_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield row_number, json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield row_number, f"Invalid JSON: {exc.msg}"
+
+
+def iter_rows(stream: IO[str], file_format: str) -> Iterator[Tuple[int, object]]:
+    if file_format == "csv":
+        return iter_csv_rows(stream)
+    if file_format == "jsonl":
+        return iter_jsonl_rows(stream)
+    raise ValueError(f"Unsupported import format: {file_format}")
+
+
+def detect_format(filename: Optional[str]) -> Optional[str]:
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return None
+
+
+def text_stream(binary: IO[bytes]) -> IO[str]:
+    """ Upload ki binary file ko bina poora memory me padhe text lines me badalta hai. """
+    return io.TextIOWrapper(binary, encoding="utf-8-sig", newline="")
+
+
+def _lookup_batch(db: Session, rows: List[Tuple[int, BookImportRow]], seen_isbns: set):
+    """ Poore batch ke languages, subcategories aur ISBNs teen set-based queries me resolve karta hai. """
+    Language, Subcategory, Book = language_model.Language, book_model.Subcategory, book_model.Book
+
+    names = {row.language.strip().lower() for _, row in rows if row.language}
+    ids = {row.language_id for _, row in rows if row.language_id is not None}
+    languages_by_name: Dict[str, int] = {}
+    language_ids = set()
+    if names or ids:
+        # Language naam case-insensitive match hota hai
+        found = db.query(Language.id, Language.name).filter(
+            or_(Language.id.in_(ids), func.lower(Language.name).in_(names))
+        ).all()
+        for language_id, name in found:
+            language_ids.add(language_id)
+            languages_by_name[name.lower()] = language_id
+
+    subcategory_ids = {sid for _, row in rows for sid in row.subcategory_ids}
+    existing_subcategories = set()
+    if subcategory_ids:
+        existing_subcategories = {sid for (sid,) in db.query(Subcategory.id).filter(Subcategory.id.in_(subcategory_ids))}
+
+    isbns = {row.isbn for _, row in rows if row.isbn} - seen_isbns
+    existing_isbns = set()
+    if isbns:
+        existing_isbns = {isbn for (isbn,) in db.query(Book.isbn).filter(Book.isbn.in_(isbns))}
+
+    return language_ids, languages_by_name, existing_subcategories, existing_isbns
+
+
+def _import_batch(
+    db: Session, batch: List[Tuple[int, object]], user: Optional[user_model.User],
+    report: ImportReport, seen_isbns: set
+) -> None:
+    parsed: List[Tuple[int, BookImportRow]] = []
+    for row_number, record in batch:
+        if isinstance(record, str):
+            report.error(row_number, record)
+            continue
+        try:
+            parsed.append((row_number, BookImportRow.model_validate(record)))
+        except ValidationError as exc:
+            report.error(row_number, "; ".join(
+                f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in exc.errors()
+            ))
+    if not parsed:
+        return
+
+    language_ids, languages_by_name, existing_subcategories, existing_isbns = _lookup_batch(db, parsed, seen_isbns)
+
+    books, links, row_numbers = [], [], []
+    for row_number, row in parsed:
+        language_id = row.language_id
+        if row.language:
+            language_id = languages_by_name.get(row.language.strip().lower())
+            if language_id is None:
+                report.error(row_number, f"Language '{row.language}' not found.")
+                continue
+        if language_id is None or language_id not in language_ids:
+            report.error(row_number, f"Language with ID {row.language_id} not found." if row.language_id else "language or language_id is required.")
+            continue
+        missing = sorted(set(row.subcategory_ids) - existing_subcategories)
+        if missing:
+            report.error(row_number, f"Subcategories not found: {missing}")
+            continue
+        if row.isbn and (row.isbn in existing_isbns or row.isbn in seen_isbns):
+            report.error(row_number, f"A book with ISBN {row.isbn} already exists.")
+            continue
+        if row.isbn:
+            seen_isbns.add(row.isbn)
+
+        data = row.model_dump(exclude={"language", "subcategory_ids"})
+        data.update(language_id=language_id, is_approved=False, is_restricted=False)
+        books.append(data)
+        links.append(sorted(set(row.subcategory_ids)))
+        row_numbers.append(row_number)
+
+    if not books:
+        return
+
+    try:
+        # Ek executemany insert; RETURNING se ids parameter order me milti hain
+        new_ids = db.execute(
+            insert(book_model.Book).returning(book_model.Book.id, sort_by_parameter_order=True), books
+        ).scalars().all()
+        link_rows = [
+            {"book_id": book_id, "subcategory_id": sid}
+            for book_id, subcategory_ids in zip(new_ids, links) for sid in subcategory_ids
+        ]
+        if link_rows:
+            db.execute(insert(book_model.book_subcategory_link), link_rows)
+        create_log(
+            db, user, "BOOKS_IMPORTED",
+            f"Bulk import: {len(new_ids)} books created (rows {row_numbers[0]}-{row_numbers[-1]}), pending approval.",
+            "Book"
+        )
+        response_cache.invalidate(db, "books")
+        db.commit()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        for row_number, data in zip(row_numbers, books):
+            if data.get("isbn"):
+                seen_isbns.discard(data["isbn"])
+            report.error(row_number, f"Batch insert failed: {exc.__class__.__name__}: {str(exc.orig if hasattr(exc, 'orig') else exc)[:200]}")
+        return
+
+    # Core insert ORM flush events trigger nahi karta, isliye in-memory indexes ko khud batayein
+    book_facet_index.mark_stale(new_ids)
+    book_trigram_index.mark_stale(new_ids)
+    suggest_index.mark_stale(book_ids=new_ids)
+    report.imported += len(new_ids)
+
+
+def import_books(
+    db: Session, rows: Iterable[Tuple[int, object]], user: Optional[user_model.User],
+    batch_size: int = IMPORT_BATCH_SIZE
+) -> dict:
+    """
+    (row number, record) stream ko batch_size ke chunks me import karta hai. Har batch apna commit
+    aur ek summary log likhta hai, isliye beech me fail hone par pehle ke batches bache rehte hain.
+    """
+    report = ImportReport()
+    seen_isbns: set = set()
+    batch: List[Tuple[int, object]] = []
+    for item in rows:
+        report.total_rows += 1
+        batch.append(item)
+        if len(batch) >= batch_size:
+            _import_batch(db, batch, user, report, seen_isbns)
+            batch = []
+    if batch:
+        _import_batch(db, batch, user, report, seen_isbns)
+    return report.as_dict()
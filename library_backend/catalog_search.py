@@ -0,0 +1,66 @@
+# file: catalog_search.py
+import re
+from typing import Optional
+
+from sqlalchemy import Float, Integer, func, literal_column, or_, select, text
+
+from models import book_model
+
+# Postgres: books.search_vector (generated tsvector + GIN), SQLite: books_fts (FTS5)
+# Dono alembic revision 0004_books_full_text_search banata hai; model me declare nahi hain
+SEARCH_VECTOR_COLUMN = "search_vector"
+SQLITE_FTS_TABLE = "books_fts"
+
+# FTS5 bm25 weights: title, author, publisher, description
+_FTS5_WEIGHTS = "10.0, 5.0, 2.0, 1.0"
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def fts5_match_expression(q: str) -> Optional[str]:
+    """
+    User input ko safe FTS5 query me badalta hai: har word quoted prefix term ("word"*), sab AND.
+    Koi word na ho toh None.
+    """
+    tokens = _TOKEN.findall(q)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def ranked_book_ids(dialect_name: str, q: str):
+    """
+    Query ke liye (Book.id) select jo relevance ke hisaab se sorted hai (best pehle).
+    Visibility filters caller lagata hai. Match hone layak kuch na ho toh None.
+    """
+    Book = book_model.Book
+
+    if dialect_name == "postgresql":
+        vector = literal_column(f"books.{SEARCH_VECTOR_COLUMN}")
+        tsquery = func.websearch_to_tsquery("simple", q)
+        return (
+            select(Book.id)
+            .where(vector.op("@@")(tsquery))
+            .order_by(func.ts_rank_cd(vector, tsquery).desc(), Book.id)
+        )
+
+    if dialect_name == "sqlite":
+        match = fts5_match_expression(q)
+        if match is None:
+            return None
+        fts = text(
+            f"SELECT rowid AS book_id, bm25({SQLITE_FTS_TABLE}, {_FTS5_WEIGHTS}) AS rank "
+            f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :match"
+        ).bindparams(match=match).columns(book_id=Integer, rank=Float).subquery("fts")
+        # bm25 me chhota score = behtar match
+        return select(Book.id).join(fts, fts.c.book_id == Book.id).order_by(fts.c.rank, Book.id)
+
+    # Baaki databases (jaise MySQL) ke liye simple LIKE fallback, title match pehle
+    pattern = f"%{q}%"
+    return (
+        select(Book.id)
+        .where(or_(
+            Book.title.ilike(pattern), Book.author.ilike(pattern),
+            Book.publisher.ilike(pattern), Book.description.ilike(pattern)
+        ))
+        .order_by(Book.title.ilike(pattern).desc(), Book.id)
+    )
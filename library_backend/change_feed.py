@@ -0,0 +1,168 @@
+# file: change_feed.py
+import base64
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import String, cast, func, inspect, select
+from sqlalchemy.orm import Session
+
+from models import book_model, language_model, library_management_models as lm
+from models.archive_model import archive_tables
+from pagination import decode_cursor, encode_cursor, keyset_paginate
+from acl_index import book_acl_index
+
+# Isse naye changes agle poll tak roke jaate hain, taaki der se commit hui transaction ka
+# (pehle ka) updated_at client ke token ke peeche na chhoot jaaye
+CHANGES_SETTLE_SECONDS = int(os.getenv("CHANGES_SETTLE_SECONDS", "5"))
+# archive_deleted.py itne din se purane tombstones hata deta hai; isse purana token poora resync maangta hai
+ARCHIVE_RETENTION_DAYS = int(os.getenv("ARCHIVE_RETENTION_DAYS", "90"))
+
+# (entity naam, model); har entity (updated_at, id) keyset par padhi jaati hai
+FEED_ENTITIES = [
+    ("book", book_model.Book),
+    ("category", book_model.Category),
+    ("subcategory", book_model.Subcategory),
+    ("language", language_model.Language),
+    ("copy", lm.BookCopy),
+]
+
+
+def encode_token(cursors: Dict[str, str]) -> str:
+    raw = json.dumps(cursors, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_token(token: Optional[str]) -> Dict[str, str]:
+    """ Token har entity ka apna keyset cursor rakhta hai; khaali token = shuru se poora sync. """
+    if not token:
+        return {}
+    try:
+        cursors = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        if not isinstance(cursors, dict) or not all(isinstance(v, str) for v in cursors.values()):
+            raise ValueError
+        return cursors
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid change feed token.")
+
+
+def feed_clock(model, dialect_name: str):
+    """
+    Sort/compare ke liye updated_at expression. SQLite me TIMESTAMP text hai ('YYYY-MM-DD HH:MM:SS'),
+    datetime bind karne par microseconds wala format aata hai aur barabar seconds wali rows chhoot jaati;
+    isliye wahan raw text par hi compare karte hain.
+    """
+    if dialect_name == "sqlite":
+        return cast(model.updated_at, String)
+    return model.updated_at
+
+
+def settle_cutoff(dialect_name: str):
+    if dialect_name == "sqlite":
+        return func.datetime("now", f"-{CHANGES_SETTLE_SECONDS} seconds")
+    return func.now() - timedelta(seconds=CHANGES_SETTLE_SECONDS)
+
+
+def token_expired(db: Session, cursors: Dict[str, str], dialect_name: str) -> bool:
+    """
+    Token ke baad ka koi tombstone archive_deleted.py archive kar chuka ho toh client use kabhi nahi dekh paayega.
+    Archive sirf retention se purane rows leta hai, isliye archive table sirf utne purane cursors par dekhi jaati hai.
+    """
+    horizon = datetime.utcnow() - timedelta(days=ARCHIVE_RETENTION_DAYS)
+    for entity, model in FEED_ENTITIES:
+        if entity not in cursors:
+            continue
+        values = decode_cursor(cursors[entity])
+        clock = values[0] if values else None
+        # feed_clock SQLite par text aur baaki jagah timestamp hai; doosra type archive se compare nahi ho sakta
+        if not isinstance(clock, str if dialect_name == "sqlite" else datetime):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid change feed token.")
+        try:
+            as_datetime = datetime.fromisoformat(clock) if isinstance(clock, str) else clock
+        except ValueError:
+            continue
+        if as_datetime.replace(tzinfo=None) >= horizon:
+            continue
+        archive = archive_tables[model.__table__.name]
+        latest = db.scalar(select(func.max(feed_clock(archive.c, dialect_name))))
+        if latest is not None and latest > clock:
+            return True
+    return False
+
+
+def row_data(obj) -> dict:
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+
+def _subcategory_ids(db: Session, book_ids: List[int]) -> Dict[int, List[int]]:
+    link = book_model.book_subcategory_link
+    ids = {book_id: [] for book_id in book_ids}
+    if book_ids:
+        for book_id, subcategory_id in db.execute(
+            select(link.c.book_id, link.c.subcategory_id).where(link.c.book_id.in_(book_ids))
+        ):
+            ids[book_id].append(subcategory_id)
+    return ids
+
+
+def read_changes(db: Session, token: Optional[str], limit: int, principal) -> dict:
+    """
+    Token ke baad ke upserts aur tombstones (deleted_at wali rows) updated_at order me, aur naya token.
+    Books par live rows wale hi visibility rules: unapproved books (deleted ho ya na ho) non-admin callers ko
+    bilkul nahi bheji jaatin, na upsert na tombstone. Restricted book bina ACL ke tombstone sirf logged-in callers
+    ko aati hai, taaki ACL revoke (jo books.updated_at badhata hai) client ke mirror se use hata de; anonymous
+    callers ko restricted books kabhi nahi dikhti, isliye unhe unke tombstones bhi nahi. Copies sirf COPY_VIEW walon ko.
+    """
+    cursors = decode_token(token)
+    dialect_name = db.get_bind().dialect.name
+    if token_expired(db, cursors, dialect_name):
+        # Client apna mirror khaali karke shuru se sync kare
+        return {"changes": [], "next_token": encode_token({}), "has_more": True, "reset": True}
+    cutoff = settle_cutoff(dialect_name)
+
+    candidates = []
+    for entity, model in FEED_ENTITIES:
+        if entity == "copy" and not (principal and principal.allows("COPY_VIEW")):
+            continue
+        clock = feed_clock(model, dialect_name)
+        query = db.query(model, clock.label("feed_clock")).filter(model.updated_at <= cutoff)
+        query = keyset_paginate(query, clock, model.id, cursors.get(entity), limit)
+        for obj, clock_value in query.all():
+            candidates.append((clock_value, entity, obj.id, obj))
+
+    # Sab entities ko ek timeline me merge karke pehle `limit` changes
+    candidates.sort(key=lambda c: (c[0], c[1], c[2]))
+    page, has_more = candidates[:limit], len(candidates) > limit
+
+    user = principal.user if principal else None
+    is_admin = bool(principal) and principal.permissions is not None and principal.permissions.is_admin
+    restricted = [obj.id for _, entity, _, obj in page if entity == "book" and obj.is_restricted and obj.deleted_at is None]
+    visible_restricted = set()
+    if restricted and user and not is_admin:
+        book_acl_index.ensure_fresh(db)
+        visible_restricted = book_acl_index.visible_book_ids(restricted, user.id, user.role_id)
+
+    changes, upserted_books = [], []
+    for clock_value, entity, obj_id, obj in page:
+        cursors[entity] = encode_cursor([clock_value, obj_id])
+        hidden = entity == "book" and not is_admin and (
+            not obj.is_approved or (obj.is_restricted and obj_id not in visible_restricted)
+        )
+        # Jo book is caller ne kabhi dekhi hi nahi ho sakti uska id tombstone me bhi nahi
+        if entity == "book" and not is_admin and (not obj.is_approved or (obj.is_restricted and not user)):
+            continue
+        if obj.deleted_at is not None or hidden:
+            changes.append({"entity": entity, "op": "delete", "id": obj_id, "updated_at": obj.updated_at})
+            continue
+        change = {"entity": entity, "op": "upsert", "id": obj_id, "updated_at": obj.updated_at, "data": row_data(obj)}
+        changes.append(change)
+        if entity == "book":
+            upserted_books.append(change)
+
+    subcategory_ids = _subcategory_ids(db, [change["id"] for change in upserted_books])
+    for change in upserted_books:
+        change["data"]["subcategory_ids"] = subcategory_ids[change["id"]]
+
+    return {"changes": changes, "next_token": encode_token(cursors), "has_more": has_more, "reset": False}
@@ -0,0 +1,40 @@
+# file: controllers/admin_controller.py
+import os
+from fastapi import APIRouter, Depends, status
+from database import all_pool_status
+from auth import require_permission
+from slow_query_log import slow_query_log, SLOW_QUERY_THRESHOLD_MS
+from response_cache import rendered_cache
+
+router = APIRouter()
+
+@router.get("/db-pool", dependencies=[Depends(require_permission("SYSTEM_MONITOR"))])
+def get_db_pool_status():
+    """
+    Is worker ke DB connection pools ki live metrics dekhein (checked-out, idle, overflow, wait times):
+    sync primary, async primary aur har replica alag alag. Har gunicorn worker ke pools alag hote hain,
+    isliye worker_pid bhi return hota hai.
+    """
+    return all_pool_status()
+
+@router.get("/slow-queries", dependencies=[Depends(require_permission("SYSTEM_MONITOR"))])
+def get_slow_queries(limit: int = 20):
+    """
+    Is worker ki sabse zyada total time lene wali slow query shapes, routes, parameters aur EXPLAIN plans ke saath.
+    """
+    return {
+        "worker_pid": os.getpid(),
+        "threshold_ms": SLOW_QUERY_THRESHOLD_MS,
+        "top_offenders": slow_query_log.top(limit),
+    }
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_permission("SYSTEM_MONITOR"))])
+def reset_slow_queries():
+    """ Is worker ke slow query stats reset karein. """
+    slow_query_log.reset()
+
+
+@router.get("/response-cache", dependencies=[Depends(require_permission("SYSTEM_MONITOR"))])
+def get_response_cache_stats():
+    """ Is worker ke public catalog response cache ke hits/misses aur entries. """
+    return {"worker_pid": os.getpid(), **rendered_cache.stats()}
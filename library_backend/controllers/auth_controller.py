@@ -1,22 +1,31 @@
 # file: controllers/auth_controller.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import timedelta
 from models import user_model
-from auth import verify_password, create_access_token, get_db, ACCESS_TOKEN_EXPIRE_MINUTES
+from auth import verify_password, create_access_token, build_token_claims, get_db, run_login_task, ACCESS_TOKEN_EXPIRE_MINUTES
 from utils import create_log
+from login_throttle import login_throttle, failed_login_aggregator, throttle_keys
 
 router = APIRouter()
 
-@router.post("/token", tags=["Authentication"])
-async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.query(user_model.User).filter(user_model.User.username == form_data.username).first()
-    
-    if not user or not verify_password(form_data.password, user.password_hash):
-        # Log failed login attempt
-        create_log(db, None, "LOGIN_FAILED", f"Failed login attempt for username: {form_data.username}")
+def write_failed_login_summary(db: Session, force: bool = False) -> None:
+    """ Window poori hone par aggregated failed logins ki ek LOGIN_FAILED row likhta hai. """
+    summary = failed_login_aggregator.drain(force=force)
+    if summary:
+        create_log(db, None, "LOGIN_FAILED", summary)
         db.commit()
+
+def authenticate_and_issue_token(db: Session, username: str, password: str, client_ip: str) -> dict:
+    """ Login ka poora sync kaam: user lookup, bcrypt verify, token aur log. Login pool me chalta hai. """
+    user = db.query(user_model.User).filter(user_model.User.username == username).first()
+    
+    if not user or not verify_password(password, user.password_hash):
+        # Har attempt ki alag row nahi; failure count hota hai aur window ke end me ek summary row jaati hai
+        login_throttle.consume(throttle_keys(username, client_ip))
+        failed_login_aggregator.record(username, client_ip)
+        write_failed_login_summary(db)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -28,11 +37,33 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
         
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.username, "role": user.role.name}, expires_delta=access_token_expires
+        data=build_token_claims(db, user), expires_delta=access_token_expires
     )
     
+    # Successful login ke baad is username ka bucket reset
+    login_throttle.reset(throttle_keys(username, client_ip)[:1])
+
     # Log successful login
     create_log(db, user, "LOGIN_SUCCESS", f"User '{user.username}' logged in successfully.")
     db.commit()
+    write_failed_login_summary(db)
     
-    return {"access_token": access_token, "token_type": "bearer", "role": user.role.name}
\ No newline at end of file
+    return {"access_token": access_token, "token_type": "bearer", "role": user.role.name}
+
+@router.post("/token", tags=["Authentication"])
+async def login_for_access_token(request: Request, form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    client_ip = request.client.host if request.client else "unknown"
+
+    # Throttled attempts bcrypt aur login pool tak pahunchne se pehle hi reject hote hain
+    retry_after = login_throttle.retry_after(throttle_keys(form_data.username, client_ip))
+    if retry_after:
+        failed_login_aggregator.record(form_data.username, client_ip, throttled=True)
+        await run_login_task(write_failed_login_summary, db)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts. Please try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    # Event loop par koi blocking kaam nahi; LOGIN_MAX_CONCURRENCY se zyada logins queue me wait karte hain
+    return await run_login_task(authenticate_and_issue_token, db, form_data.username, form_data.password, client_ip)
\ No newline at end of file
@@ -1,42 +1,300 @@
 # file: controllers/book_controller.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from datetime import datetime
+import csv
+import os
 
 # Sabhi zaroori models aur schemas
-from models import book_model, language_model, user_model, book_permission_model
+from models import book_model, language_model, user_model
 from schemas import book_schema
 
 # Authentication aur helper functions
-from auth import require_permission, get_db, get_current_user
+from auth import require_permission, get_db, get_async_db, get_current_user
 from utils import create_log
+from acl_index import book_acl_index
+from pagination import keyset_paginate, paginate_results, set_next_cursor
+import catalog_search
+from facet_index import book_facet_index
+import fuzzy_search
+from fuzzy_search import book_trigram_index
+import response_cache
+import catalog_import
+import catalog_export
+import recommendations
 
 router = APIRouter()
 
-@router.get("/", response_model=List[book_schema.Book])
-def read_books(
-    skip: int = 0, limit: int = 100, 
-    approved_only: bool = True, db: Session = Depends(get_db)
+# Sparse fieldsets (fields= / view=summary) me allowed flat fields; subcategory_ids alag query se aata hai
+BOOK_FIELDS = (
+    "id", "title", "author", "publisher", "publication_year", "isbn", "language_id", "is_digital",
+    "cover_image_url", "description", "is_approved", "is_restricted", "subcategory_ids",
+    "copies_total", "copies_available", "copies_on_loan"
+)
+SUMMARY_FIELDS = (
+    "id", "title", "author", "isbn", "language_id", "is_approved", "is_restricted", "copies_total", "copies_available"
+)
+
+
+def parse_fields(fields: Optional[str], view: Optional[str]) -> Optional[List[str]]:
+    """ Requested flat fields (id hamesha shamil, cursor ke liye). Full view ke liye None. """
+    if fields:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(BOOK_FIELDS))
+        if unknown:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(BOOK_FIELDS)}")
+        return ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+    if view == "summary":
+        return list(SUMMARY_FIELDS)
+    return None
+
+
+async def load_subcategory_ids(db: AsyncSession, book_ids: List[int]) -> dict:
+    """ Page ki books ke subcategory ids ek link-table query me (join se row multiplication nahi). """
+    link = book_model.book_subcategory_link
+    result = await db.execute(select(link.c.book_id, link.c.subcategory_id).where(link.c.book_id.in_(book_ids)))
+    subcategory_ids = {book_id: [] for book_id in book_ids}
+    for book_id, subcategory_id in result:
+        subcategory_ids[book_id].append(subcategory_id)
+    return subcategory_ids
+
+
+@router.get("/", response_model=Union[List[book_schema.Book], book_schema.BookFacetPage])
+async def read_books(
+    response: Response,
+    skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+    approved_only: bool = True,
+    category_id: Optional[List[int]] = Query(None),
+    subcategory_id: Optional[List[int]] = Query(None),
+    language_id: Optional[List[int]] = Query(None),
+    publication_year: Optional[List[int]] = Query(None),
+    is_digital: Optional[bool] = None,
+    with_facets: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[str] = Query(None, pattern="^(full|summary)$"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """ Sabhi non-deleted books ki list fetch karein (sirf non-restricted). """
-    query = db.query(book_model.Book).options(
-        joinedload(book_model.Book.subcategories).joinedload(book_model.Subcategory.category),
-        joinedload(book_model.Book.language)
-    ).filter(
+    """
+    Sabhi non-deleted books ki list fetch karein (sirf non-restricted).
+    Agle page ke liye X-Next-Cursor header ki value `cursor` param me bhejein.
+    Facet filters repeat kiye ja sakte hain (?language_id=1&language_id=2): ek facet ke andar OR, facets ke beech AND.
+    with_facets=true par response {"items": [...], "facets": {...}} hota hai; counts poore public catalog ke hain.
+    fields=id,title ya view=summary par sirf woh columns select hote hain aur flat objects (nested language/subcategories nahi) milte hain.
+    """
+    selected_fields = parse_fields(fields, view)
+
+    filters = [
+        book_model.Book.is_restricted == False,
+        book_model.Book.deleted_at.is_(None)  # Soft Delete Filter
+    ]
+    if approved_only:
+        filters.append(book_model.Book.is_approved == True)
+
+    # --- Facet filters ---
+    if category_id:
+        filters.append(book_model.Book.subcategories.any(book_model.Subcategory.category_id.in_(category_id)))
+    if subcategory_id:
+        filters.append(book_model.Book.subcategories.any(book_model.Subcategory.id.in_(subcategory_id)))
+    if language_id:
+        filters.append(book_model.Book.language_id.in_(language_id))
+    if publication_year:
+        filters.append(book_model.Book.publication_year.in_(publication_year))
+    if is_digital is not None:
+        filters.append(book_model.Book.is_digital == is_digital)
+
+    if selected_fields is None:
+        # Many-to-many ke liye selectinload: joinedload har book ko uski subcategories jitni rows me badal deta tha
+        query = select(book_model.Book).options(
+            selectinload(book_model.Book.subcategories).joinedload(book_model.Subcategory.category),
+            joinedload(book_model.Book.language)
+        )
+    else:
+        columns = [getattr(book_model.Book, name) for name in selected_fields if name != "subcategory_ids"]
+        query = select(*columns)
+    query = query.filter(*filters)
+
+    query = keyset_paginate(query, book_model.Book.id, book_model.Book.id, cursor, limit, skip)
+    result = await db.execute(query)
+
+    if selected_fields is None:
+        books, next_cursor = paginate_results(result.scalars().all(), limit, "id")
+    else:
+        rows, next_cursor = paginate_results(result.all(), limit, "id")
+        books = [dict(row._mapping) for row in rows]
+        if "subcategory_ids" in selected_fields and books:
+            subcategory_ids = await load_subcategory_ids(db, [book["id"] for book in books])
+            for book in books:
+                book["subcategory_ids"] = subcategory_ids[book["id"]]
+
+    body = books
+    if with_facets:
+        # Maintained aggregate se counts; sirf badli hui books dobara padhi jaati hain
+        await db.run_sync(book_facet_index.ensure_fresh)
+        body = {"items": books, "facets": book_facet_index.counts(approved_only)}
+
+    if selected_fields is None:
+        set_next_cursor(response, next_cursor)
+        return body
+    # Flat dicts seedhe JSON me; full Book schema se validate/serialize nahi karna
+    sparse_response = JSONResponse(content=body)
+    set_next_cursor(sparse_response, next_cursor)
+    return sparse_response
+
+@router.get("/search", response_model=List[book_schema.Book])
+async def search_books(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = 0, limit: int = 20,
+    approved_only: bool = True, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Title, author, publisher aur description par ranked full-text search (best match pehle).
+    read_books wale hi visibility rules: restricted aur deleted books kabhi nahi dikhti.
+    """
+    ids_query = catalog_search.ranked_book_ids(db.get_bind().dialect.name, q)
+    if ids_query is None:
+        return []
+
+    ids_query = ids_query.filter(
         book_model.Book.is_restricted == False,
         book_model.Book.deleted_at.is_(None)  # Soft Delete Filter
     )
-    
     if approved_only:
-        query = query.filter(book_model.Book.is_approved == True)
-    
-    books = query.offset(skip).limit(limit).all()
-    return books
+        ids_query = ids_query.filter(book_model.Book.is_approved == True)
+
+    book_ids = (await db.execute(ids_query.offset(skip).limit(limit))).scalars().all()
+    return await load_books_in_order(db, book_ids)
+
+
+async def load_books_in_order(db: AsyncSession, book_ids: List[int]) -> list:
+    """ Relationships ke saath books load karta hai, phir diya hua (rank wala) order wapas lagata hai. """
+    if not book_ids:
+        return []
+    result = await db.execute(
+        select(book_model.Book).options(
+            selectinload(book_model.Book.subcategories).joinedload(book_model.Subcategory.category),
+            joinedload(book_model.Book.language)
+        ).filter(book_model.Book.id.in_(book_ids))
+    )
+    books = {book.id: book for book in result.scalars().all()}
+    return [books[book_id] for book_id in book_ids if book_id in books]
+
+@router.get("/fuzzy", response_model=List[book_schema.BookFuzzyMatch])
+async def fuzzy_match_books(
+    q: str = Query(..., min_length=1, max_length=200),
+    threshold: float = Query(fuzzy_search.FUZZY_MATCH_THRESHOLD, ge=0.0, le=1.0),
+    limit: int = Query(20, ge=1, le=100),
+    approved_only: bool = True, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Title / author par typo-tolerant trigram match, similarity ke hisaab se (best pehle).
+    threshold kam karne par zyada (dheele) matches aate hain. search_books wale hi visibility rules.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        # pg_trgm GIN indexes (revision 0008); threshold sirf is transaction ke liye
+        await db.execute(fuzzy_search.postgres_threshold(threshold))
+        query = fuzzy_search.postgres_matches(q).filter(
+            book_model.Book.is_restricted == False,
+            book_model.Book.deleted_at.is_(None)  # Soft Delete Filter
+        )
+        if approved_only:
+            query = query.filter(book_model.Book.is_approved == True)
+        matches = [(row.id, round(row.score, 4)) for row in (await db.execute(query.limit(limit))).all()]
+    else:
+        # SQLite me pg_trgm nahi hai: in-process trigram index (sirf live, non-restricted books),
+        # background refresher fresh rakhta hai; yahan sirf memory lookup
+        matches = book_trigram_index.search(q, threshold, limit, approved_only)
+
+    scores = dict(matches)
+    books = await load_books_in_order(db, [book_id for book_id, _ in matches])
+    return [
+        book_schema.BookFuzzyMatch(**book_schema.Book.model_validate(book).model_dump(), similarity=scores[book.id])
+        for book in books
+    ]
+
+@router.get("/export", dependencies=[Depends(require_permission("BOOK_MANAGE"))])
+def export_books(format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    """
+    Poora catalog NDJSON ya CSV me stream karein (server-side cursor, yield_per partitions).
+    Export size kitna bhi ho, memory ek partition jitni hi rehti hai. CSV columns import format se match karte hain.
+    """
+    return catalog_export.export_response(
+        catalog_export.books_export_query(), catalog_export.BOOK_EXPORT_COLUMNS, format, "books",
+        enrich=catalog_export.add_subcategory_ids
+    )
+
+# Ek batch request me zyada se zyada itni ids
+BOOK_BATCH_MAX_IDS = int(os.getenv("BOOK_BATCH_MAX_IDS", "1000"))
+
+
+def fetch_books_batch(db: Session, book_ids: List[int], current_user) -> dict:
+    """
+    read_book wale visibility rules bulk me: ek query me books, restricted ACL ek baar me in-memory index se.
+    Unapproved (non-admin ke liye) aur missing ids not_found me, bina permission wali restricted ids forbidden me.
+    """
+    book_ids = list(dict.fromkeys(book_ids))
+    if len(book_ids) > BOOK_BATCH_MAX_IDS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {BOOK_BATCH_MAX_IDS} ids per batch.")
+
+    books = {
+        book.id: book for book in db.query(book_model.Book).options(
+            selectinload(book_model.Book.subcategories).joinedload(book_model.Subcategory.category),
+            joinedload(book_model.Book.language)
+        ).filter(
+            book_model.Book.id.in_(book_ids),
+            book_model.Book.deleted_at.is_(None)  # Soft Delete Filter
+        )
+    } if book_ids else {}
+
+    is_admin = bool(current_user) and current_user.role.name.lower() == 'admin'
+    restricted_ids = [book.id for book in books.values() if book.is_restricted and (book.is_approved or is_admin)]
+    visible_restricted = set()
+    if restricted_ids and current_user and not is_admin:
+        book_acl_index.ensure_fresh(db)
+        visible_restricted = book_acl_index.visible_book_ids(restricted_ids, current_user.id, current_user.role_id)
+
+    result = {"books": [], "not_found": [], "forbidden": []}
+    for book_id in book_ids:
+        book = books.get(book_id)
+        if book is None or (not book.is_approved and not is_admin):
+            result["not_found"].append(book_id)
+        elif book.is_restricted and not is_admin and book_id not in visible_restricted:
+            result["forbidden"].append(book_id)
+        else:
+            result["books"].append(book)
+    return result
+
+
+@router.get("/batch", response_model=book_schema.BookBatch)
+def read_books_batch(
+    ids: str = Query(..., description="Comma separated book ids, e.g. 1,2,3"),
+    db: Session = Depends(get_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user)
+):
+    """ Kai books ek saath unki IDs se (read_book jaisi permission checks, bulk me). Badi lists ke liye POST /batch. """
+    try:
+        book_ids = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be a comma separated list of integers.")
+    return fetch_books_batch(db, book_ids, current_user)
+
+
+@router.post("/batch", response_model=book_schema.BookBatch)
+def read_books_batch_post(
+    batch: book_schema.BookBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user)
+):
+    """ GET /batch jaisa hi, ids JSON body me ({"ids": [...]}). """
+    return fetch_books_batch(db, batch.ids, current_user)
 
 @router.get("/{book_id}", response_model=book_schema.Book)
 def read_book(
     book_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: Optional[user_model.User] = Depends(get_current_user)
 ):
@@ -52,6 +310,10 @@ def read_book(
     if db_book is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
 
+    # Restricted/unapproved book ka response user par depend karta hai, shared cache me na jaaye
+    if db_book.is_restricted or not db_book.is_approved:
+        response.headers["Cache-Control"] = "private, no-store"
+
     if not db_book.is_approved:
         if not current_user or current_user.role.name.lower() != 'admin':
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found or not approved")
@@ -63,17 +325,46 @@ def read_book(
         if current_user.role.name.lower() == 'admin':
             return db_book
 
-        permission_exists = db.query(book_permission_model.BookPermission).filter(
-            book_permission_model.BookPermission.book_id == book_id,
-            (book_permission_model.BookPermission.user_id == current_user.id) | 
-            (book_permission_model.BookPermission.role_id == current_user.role_id)
-        ).first()
-
-        if not permission_exists:
+        # In-memory ACL index se check, har request par book_permissions query nahi
+        book_acl_index.ensure_fresh(db)
+        if not book_acl_index.can_access(book_id, current_user.id, current_user.role_id):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You do not have permission to view this restricted book.")
     
     return db_book
 
+@router.get("/{book_id}/related", response_model=List[book_schema.RelatedBook])
+def read_related_books(
+    book_id: int,
+    response: Response,
+    limit: int = Query(10, ge=1, le=recommendations.RELATED_TOP_K),
+    db: Session = Depends(get_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user)
+):
+    """
+    "Borrowed together": jin books ko is book ke borrowers ne bhi borrow kiya, score ke hisaab se.
+    Lists `build_recommendations.py` pehle se bana kar rakhta hai; yahan sirf ek index range scan aur
+    fetch_books_batch wale visibility rules (user jo book nahi dekh sakta woh list se hat jaati hai).
+    """
+    base = fetch_books_batch(db, [book_id], current_user)
+    if base["not_found"]:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+    if base["forbidden"]:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You do not have permission to view this restricted book.")
+
+    related = recommendations.related_books(db, book_id, recommendations.RELATED_TOP_K)
+    visible = fetch_books_batch(db, [row.related_book_id for row in related], current_user)
+    # Restricted books dikh rahi hon toh list user par depend karti hai
+    if any(book.is_restricted or not book.is_approved for book in base["books"] + visible["books"]):
+        response.headers["Cache-Control"] = "private, no-store"
+    books = {book.id: book for book in visible["books"]}
+    return [
+        book_schema.RelatedBook(
+            **book_schema.Book.model_validate(books[row.related_book_id]).model_dump(),
+            score=row.score, borrowed_together=row.borrowed_together
+        )
+        for row in related if row.related_book_id in books
+    ][:limit]
+
 @router.post("/", response_model=book_schema.Book, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_permission("BOOK_MANAGE"))])
 def create_book(
     book: book_schema.BookCreate, 
@@ -99,10 +390,33 @@ def create_book(
     db.add(db_book)
     db.flush() # ID generate karne ke liye flush karein
     create_log(db, current_user, "BOOK_CREATED", f"Book '{book.title}' created and pending approval.", "Book", db_book.id)
+    response_cache.invalidate(db, "books")
     db.commit()
     db.refresh(db_book)
     return db_book
 
+@router.post("/import", dependencies=[Depends(require_permission("BOOK_MANAGE"))])
+def import_books(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|jsonl)$"),
+    batch_size: int = Query(catalog_import.IMPORT_BATCH_SIZE, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(require_permission("BOOK_MANAGE"))
+):
+    """
+    CSV ya JSONL file se books bulk me import karein (sab pending approval).
+    File stream hoti hai aur batch_size rows ke chunks me insert hoti hai; har batch ka ek summary log.
+    Response me har fail hui row ka error aur rows/sec throughput hota hai.
+    """
+    file_format = format or catalog_import.detect_format(file.filename)
+    if file_format is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Could not detect file format; pass format=csv or format=jsonl.")
+    rows = catalog_import.iter_rows(catalog_import.text_stream(file.file), file_format)
+    try:
+        return catalog_import.import_books(db, rows, current_user, batch_size)
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not read import file: {exc}")
+
 @router.put("/{book_id}", response_model=book_schema.Book, dependencies=[Depends(require_permission("BOOK_MANAGE"))])
 def update_book(
     book_id: int,
@@ -123,6 +437,8 @@ def update_book(
     if "subcategory_ids" in update_data:
         subcategories = db.query(book_model.Subcategory).filter(book_model.Subcategory.id.in_(update_data["subcategory_ids"])).all()
         db_book.subcategories = subcategories
+        # Sirf link rows badalne par books row update nahi hoti; change feed ke liye updated_at khud badhayein
+        db_book.updated_at = func.now()
         del update_data["subcategory_ids"]
     
     for key, value in update_data.items():
@@ -132,6 +448,7 @@ def update_book(
       db_book.is_restricted = book_update.is_restricted
 
     create_log(db, current_user, "BOOK_UPDATED", f"Book ID {book_id} was updated.")
+    response_cache.invalidate(db, "books")
     db.commit()
     db.refresh(db_book)
     return db_book
@@ -153,6 +470,7 @@ def delete_book(
     db_book.deleted_at = datetime.utcnow()
     
     create_log(db, current_user, "BOOK_DELETED", f"Book '{db_book.title}' (ID: {book_id}) soft-deleted.")
+    response_cache.invalidate(db, "books")
     db.commit()
     # 204 response me body nahi hoti, isliye kuch return na karein ya ek empty response return karein
     return 
\ No newline at end of file
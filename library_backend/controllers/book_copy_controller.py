@@ -1,11 +1,15 @@
 # file: controllers/book_copy_controller.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session, joinedload
-from typing import List
+from typing import List, Optional
 from models import library_management_models as models, user_model
 from schemas import library_management_schemas as schemas
 from auth import require_permission, get_db
 from utils import create_log
+from pagination import keyset_paginate, paginate_results, set_next_cursor
+import catalog_export
+import availability
+import response_cache
 
 router = APIRouter()
 
@@ -17,17 +21,30 @@ def create_book_copy(
 ):
     db_copy = models.BookCopy(**copy.dict())
     db.add(db_copy)
+    availability.adjust_counters(db, copy.book_id, **availability.status_counts(copy.status))
     create_log(db, current_user, "COPY_CREATED", f"New copy created for Book ID {copy.book_id}.")
+    response_cache.invalidate(db, "books")
     db.commit()
     db.refresh(db_copy)
     return db_copy
 
 @router.get("/", response_model=List[schemas.BookCopy], dependencies=[Depends(require_permission("COPY_VIEW"))])
-def get_all_book_copies(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return db.query(models.BookCopy).options(
+def get_all_book_copies(response: Response, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    query = db.query(models.BookCopy).options(
         joinedload(models.BookCopy.book),
         joinedload(models.BookCopy.location)
-    ).offset(skip).limit(limit).all()
+    )
+    query = keyset_paginate(query, models.BookCopy.id, models.BookCopy.id, cursor, limit, skip)
+    copies, next_cursor = paginate_results(query.all(), limit, "id")
+    set_next_cursor(response, next_cursor)
+    return copies
+
+@router.get("/export", dependencies=[Depends(require_permission("COPY_VIEW"))])
+def export_book_copies(format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    """ Copy inventory (book title, location ke saath) NDJSON ya CSV me stream karein. """
+    return catalog_export.export_response(
+        catalog_export.copies_export_query(), catalog_export.COPY_EXPORT_COLUMNS, format, "book_copies"
+    )
 
 @router.get("/{copy_id}", response_model=schemas.BookCopy, dependencies=[Depends(require_permission("COPY_VIEW"))])
 def get_book_copy(copy_id: int, db: Session = Depends(get_db)):
@@ -1,13 +1,21 @@
 # file: controllers/book_permission_controller.py
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List
-from models import book_permission_model, user_model
+from models import book_model, book_permission_model, user_model
 from schemas import book_permission_schema
 from auth import require_permission, get_db
+from acl_index import bump_acl_version, forget_acl_version
 
 router = APIRouter()
 
+def touch_book(db: Session, book_id: int) -> None:
+    """ ACL badalne se book kisi ke liye dikhni / chhupni shuru hoti hai; change feed ke liye updated_at badhayein. """
+    db.query(book_model.Book).filter(book_model.Book.id == book_id).update(
+        {book_model.Book.updated_at: func.now()}, synchronize_session=False
+    )
+
 @router.post("/", response_model=book_permission_schema.BookPermission, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_permission("BOOK_PERMISSION_MANAGE"))])
 def assign_book_permission(
     permission: book_permission_schema.BookPermissionCreate,
@@ -16,7 +24,11 @@ def assign_book_permission(
     """ Ek specific book ki permission kisi user ya role ko assign karein. """
     db_permission = book_permission_model.BookPermission(**permission.dict())
     db.add(db_permission)
+    touch_book(db, db_permission.book_id)
+    # Version bump se har worker ka ACL index agle access check par reload hota hai
+    bump_acl_version(db)
     db.commit()
+    forget_acl_version()
     db.refresh(db_permission)
     return db_permission
 
@@ -32,5 +44,8 @@ def revoke_book_permission(permission_id: int, db: Session = Depends(get_db)):
     if not db_permission:
         raise HTTPException(status_code=404, detail="Permission not found")
     db.delete(db_permission)
+    touch_book(db, db_permission.book_id)
+    bump_acl_version(db)
     db.commit()
+    forget_acl_version()
     return {"detail": "Permission revoked"}
\ No newline at end of file
@@ -1,11 +1,15 @@
 # file: controllers/category_controller.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from models import book_model, user_model
 from schemas import category_schema
-from auth import require_permission, get_db
+from auth import require_permission, get_db, get_async_db
 from utils import create_log
+from pagination import keyset_paginate, paginate_results, set_next_cursor
+import response_cache
 
 router = APIRouter()
 
@@ -21,14 +25,19 @@ def create_category(
     new_category = book_model.Category(**category.dict())
     db.add(new_category)
     create_log(db, current_user, "CATEGORY_CREATED", f"Category '{category.name}' created.")
+    response_cache.invalidate(db, "categories")
     db.commit()
     db.refresh(new_category)
     return new_category
 
 # Public endpoint
 @router.get("/", response_model=List[category_schema.Category])
-def read_categories(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return db.query(book_model.Category).offset(skip).limit(limit).all()
+async def read_categories(response: Response, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    query = keyset_paginate(select(book_model.Category), book_model.Category.id, book_model.Category.id, cursor, limit, skip)
+    result = await db.execute(query)
+    categories, next_cursor = paginate_results(result.scalars().all(), limit, "id")
+    set_next_cursor(response, next_cursor)
+    return categories
 
 # Public endpoint
 @router.get("/{category_id}", response_model=category_schema.Category)
@@ -54,6 +63,7 @@ def update_category(
     db_category.description = category_update.description
     
     create_log(db, current_user, "CATEGORY_UPDATED", f"Category ID {category_id} updated.")
+    response_cache.invalidate(db, "categories")
     db.commit()
     db.refresh(db_category)
     return db_category
@@ -71,5 +81,6 @@ def delete_category(
     
     create_log(db, current_user, "CATEGORY_DELETED", f"Category '{db_category.name}' (ID: {category_id}) deleted.")
     db.delete(db_category)
+    response_cache.invalidate(db, "categories")
     db.commit()
     return {"detail": "Category deleted successfully"} # Response 204 me body nahi jaati, par yeh confirmation ke liye hai
\ No newline at end of file
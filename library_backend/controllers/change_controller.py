@@ -0,0 +1,24 @@
+# file: controllers/change_controller.py
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from auth import get_db, get_principal, Principal
+import change_feed
+
+router = APIRouter()
+
+# Public endpoint (login ho toh restricted books aur copies bhi)
+@router.get("/")
+def get_changes(
+    since: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=5000),
+    db: Session = Depends(get_db),
+    principal: Optional[Principal] = Depends(get_principal)
+):
+    """
+    Books, categories, subcategories, languages aur copies ke incremental changes.
+    Pehli baar bina `since` ke call karein; phir har response ka `next_token` agle call me `since` bhejein.
+    has_more true ho toh turant dobara call karein. Tombstones (op=delete) soft-deleted ya ab na dikhne wali rows hain.
+    reset true ho toh token archive retention se purana hai: local copy khaali karke `next_token` se dobara sync karein.
+    """
+    return change_feed.read_changes(db, since, limit, principal)
@@ -1,12 +1,15 @@
 # file: controllers/issue_controller.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from models import library_management_models as models, user_model
 from schemas import library_management_schemas as schemas
 from auth import require_permission, get_db
 from utils import create_log
+from pagination import keyset_paginate, paginate_results, set_next_cursor
+import availability
+import response_cache
 
 router = APIRouter()
 
@@ -16,13 +19,15 @@ def issue_book_to_client(
     db: Session = Depends(get_db),
     current_user: user_model.User = Depends(require_permission("BOOK_ISSUE"))
 ):
-    db_copy = db.query(models.BookCopy).filter(models.BookCopy.id == issue_data.copy_id).first()
+    # Row lock: ek hi copy ke do parallel issue dono "Available" na padhein (counters double na ghatein)
+    db_copy = db.query(models.BookCopy).filter(models.BookCopy.id == issue_data.copy_id).with_for_update().first()
     if not db_copy:
         raise HTTPException(status_code=404, detail="Book copy not found")
     if db_copy.status != "Available":
         raise HTTPException(status_code=400, detail=f"Book copy is not available. Status: {db_copy.status}")
     
     db_issue = models.IssuedBook(**issue_data.dict())
+    availability.move_copy(db, db_copy, "On Loan")
     db_copy.status = "On Loan"
     
     db.add(db_issue)
@@ -30,6 +35,7 @@ def issue_book_to_client(
     client = db.query(user_model.User).filter(user_model.User.id == issue_data.client_id).first()
     log_desc = f"Book copy ID {db_copy.id} issued to client '{client.username}'."
     create_log(db, current_user, "BOOK_ISSUED", log_desc, "IssuedBook", db_issue.id)
+    response_cache.invalidate(db, "books")
     
     db.commit()
     db.refresh(db_issue)
@@ -41,7 +47,7 @@ def return_book(
     db: Session = Depends(get_db),
     current_user: user_model.User = Depends(require_permission("BOOK_ISSUE"))
 ):
-    db_issue = db.query(models.IssuedBook).filter(models.IssuedBook.id == issue_id).first()
+    db_issue = db.query(models.IssuedBook).filter(models.IssuedBook.id == issue_id).with_for_update().first()
     if not db_issue:
         raise HTTPException(status_code=404, detail="Issue record not found")
     if db_issue.status == "Returned":
@@ -52,15 +58,20 @@ def return_book(
     
     db_copy = db.query(models.BookCopy).filter(models.BookCopy.id == db_issue.copy_id).first()
     if db_copy:
+        availability.move_copy(db, db_copy, "Available")
         db_copy.status = "Available"
     
     log_desc = f"Book copy ID {db_issue.copy_id} returned."
     create_log(db, current_user, "BOOK_RETURNED", log_desc, "IssuedBook", db_issue.id)
+    response_cache.invalidate(db, "books")
 
     db.commit()
     db.refresh(db_issue)
     return db_issue
 
 @router.get("/", response_model=List[schemas.IssuedBook], dependencies=[Depends(require_permission("ISSUE_VIEW"))])
-def get_all_issues(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return db.query(models.IssuedBook).offset(skip).limit(limit).all()
\ No newline at end of file
+def get_all_issues(response: Response, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    query = keyset_paginate(db.query(models.IssuedBook), models.IssuedBook.id, models.IssuedBook.id, cursor, limit, skip)
+    issues, next_cursor = paginate_results(query.all(), limit, "id")
+    set_next_cursor(response, next_cursor)
+    return issues
\ No newline at end of file
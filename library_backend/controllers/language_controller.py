@@ -1,11 +1,15 @@
 # file: controllers/language_controller.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from models import language_model, user_model
 from schemas import language_schema
-from auth import require_permission, get_db
+from auth import require_permission, get_db, get_async_db
 from utils import create_log
+from pagination import keyset_paginate, paginate_results, set_next_cursor
+import response_cache
 
 router = APIRouter()
 
@@ -21,14 +25,19 @@ def create_language(
     new_language = language_model.Language(**language.dict())
     db.add(new_language)
     create_log(db, current_user, "LANGUAGE_CREATED", f"Language '{language.name}' created.")
+    response_cache.invalidate(db, "languages")
     db.commit()
     db.refresh(new_language)
     return new_language
 
 # Public endpoint
 @router.get("/", response_model=List[language_schema.Language])
-def read_languages(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return db.query(language_model.Language).offset(skip).limit(limit).all()
+async def read_languages(response: Response, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    query = keyset_paginate(select(language_model.Language), language_model.Language.id, language_model.Language.id, cursor, limit, skip)
+    result = await db.execute(query)
+    languages, next_cursor = paginate_results(result.scalars().all(), limit, "id")
+    set_next_cursor(response, next_cursor)
+    return languages
 
 # Public endpoint
 @router.get("/{language_id}", response_model=language_schema.Language)
@@ -1,11 +1,12 @@
 # file: controllers/location_controller.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from models import library_management_models as models, user_model
 from schemas import library_management_schemas as schemas
 from auth import require_permission, get_db
 from utils import create_log
+from pagination import keyset_paginate, paginate_results, set_next_cursor
 
 router = APIRouter()
 
@@ -27,5 +28,8 @@ def create_location(
 
 # Public endpoint
 @router.get("/", response_model=List[schemas.Location])
-def get_all_locations(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return db.query(models.Location).offset(skip).limit(limit).all()
\ No newline at end of file
+def get_all_locations(response: Response, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    query = keyset_paginate(db.query(models.Location), models.Location.id, models.Location.id, cursor, limit, skip)
+    locations, next_cursor = paginate_results(query.all(), limit, "id")
+    set_next_cursor(response, next_cursor)
+    return locations
\ No newline at end of file
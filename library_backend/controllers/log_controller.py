@@ -1,29 +1,35 @@
 # file: controllers/log_controller.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from models import log_model
 from schemas import log_schema
 from auth import require_permission, get_db
+from pagination import keyset_paginate, paginate_results, set_next_cursor
 
 router = APIRouter()
 
 @router.get("/", response_model=List[log_schema.Log], dependencies=[Depends(require_permission("LOG_VIEW"))])
 def get_logs(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     user_id: Optional[int] = None,
     action_type: Optional[str] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
     System logs dekhein. Filters apply kar sakte hain.
+    Naye se purane (timestamp, id) order me; agla page X-Next-Cursor header wale `cursor` se.
     """
-    query = db.query(log_model.Log).order_by(log_model.Log.timestamp.desc())
+    query = db.query(log_model.Log)
     if user_id:
         query = query.filter(log_model.Log.action_by_id == user_id)
     if action_type:
         query = query.filter(log_model.Log.action_type == action_type)
     
-    logs = query.offset(skip).limit(limit).all()
+    query = keyset_paginate(query, log_model.Log.timestamp, log_model.Log.id, cursor, limit, skip, descending=True)
+    logs, next_cursor = paginate_results(query.all(), limit, "timestamp")
+    set_next_cursor(response, next_cursor)
     return logs
\ No newline at end of file
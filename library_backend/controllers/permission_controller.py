@@ -8,6 +8,8 @@ from schemas import permission_schema
 # get_current_admin_user ko hata kar require_permission ko import kiya gaya hai
 from auth import require_permission, get_db
 from utils import create_log # Logging ke liye import
+from permission_cache import permission_cache
+import authz_versions
 
 router = APIRouter()
 
@@ -63,7 +65,12 @@ def assign_permissions_to_role(
     db_role.permissions = permissions
     log_desc = f"Permissions {assignment_data.permission_ids} assigned to role '{db_role.name}'."
     create_log(db, current_user, "ROLE_PERMISSIONS_UPDATED", log_desc, "Role", role_id)
+    # Version bump se is role ke purane tokens stale ho jaate hain
+    authz_versions.bump_role_version(db, role_id)
     db.commit()
+    # Is role ke cached permission snapshots ab purane hain
+    permission_cache.invalidate_role(role_id)
+    authz_versions.forget(authz_versions.role_scope(role_id))
     db.refresh(db_role)
     return db_role
 
@@ -75,4 +82,13 @@ def get_role_permissions(role_id: int, db: Session = Depends(get_db)):
     db_role = db.query(user_model.Role).filter(user_model.Role.id == role_id).first()
     if not db_role:
         raise HTTPException(status_code=404, detail="Role not found")
-    return db_role
\ No newline at end of file
+    return db_role
+
+# --- Permission Cache Stats ---
+
+@router.get("/cache/stats", dependencies=[Depends(require_permission("PERMISSION_VIEW"))])
+def get_permission_cache_stats():
+    """
+    Is worker ke effective-permission cache ke hit/miss counters dekhein.
+    """
+    return permission_cache.stats()
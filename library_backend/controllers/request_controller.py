@@ -8,6 +8,7 @@ from models import book_model, user_model, request_model
 from schemas import request_schema
 from auth import require_permission, get_db
 from utils import create_log
+import response_cache
 
 router = APIRouter()
 
@@ -85,6 +86,7 @@ def review_upload_request(
         db_book = db.query(book_model.Book).filter(book_model.Book.id == db_request.book_id).first()
         if db_book:
             db_book.is_approved = True
+            response_cache.invalidate(db, "books")
     
     create_log(db, current_user, "REQUEST_REVIEWED", f"Request ID {request_id} was {review_data.status}.", "Request", request_id)
     db.commit()
@@ -1,11 +1,15 @@
 # file: controllers/subcategory_controller.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from models import book_model, user_model
 from schemas import subcategory_schema
-from auth import require_permission, get_db
+from auth import require_permission, get_db, get_async_db
 from utils import create_log
+from pagination import keyset_paginate, paginate_results, set_next_cursor
+import response_cache
 
 router = APIRouter()
 
@@ -21,14 +25,21 @@ def create_subcategory(
     db_subcategory = book_model.Subcategory(**subcategory.dict())
     db.add(db_subcategory)
     create_log(db, current_user, "SUBCATEGORY_CREATED", f"Subcategory '{subcategory.name}' created.")
+    # Subcategories ka response category collection ke version se cache hota hai
+    response_cache.invalidate(db, "categories")
     db.commit()
     db.refresh(db_subcategory)
     return db_subcategory
 
 # Public endpoint
 @router.get("/", response_model=List[subcategory_schema.SubcategoryWithCategory])
-def read_subcategories(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return db.query(book_model.Subcategory).options(joinedload(book_model.Subcategory.category)).offset(skip).limit(limit).all()
+async def read_subcategories(response: Response, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    query = select(book_model.Subcategory).options(joinedload(book_model.Subcategory.category))
+    query = keyset_paginate(query, book_model.Subcategory.id, book_model.Subcategory.id, cursor, limit, skip)
+    result = await db.execute(query)
+    subcategories, next_cursor = paginate_results(result.scalars().all(), limit, "id")
+    set_next_cursor(response, next_cursor)
+    return subcategories
 
 # Public endpoint
 @router.get("/{subcategory_id}", response_model=subcategory_schema.SubcategoryWithCategory)
@@ -0,0 +1,41 @@
+# file: controllers/suggest_controller.py
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from auth import get_principal, Principal
+from suggest_index import suggest_index, SUGGEST_MAX_RESULTS
+
+router = APIRouter()
+
+# Restricted / unapproved books ke titles sirf catalog staff ko
+STAFF_PERMISSIONS = ("BOOK_MANAGE", "BOOK_PERMISSION_VIEW")
+
+def _check_allowed(principal: Optional[Principal], permission_names, detail: str) -> None:
+    """ require_permission jaise hi checks (login, Active status, role), par diye gaye permissions me se koi ek kaafi hai. """
+    if not principal:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    if principal.user.status != "Active":
+        raise HTTPException(status_code=400, detail="Inactive user, please contact admin.")
+    if principal.permissions is None or not any(principal.allows(name) for name in permission_names):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+@router.get("/")
+async def suggest(
+    kind: str = Query(..., pattern="^(book|author|user)$"),
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=SUGGEST_MAX_RESULTS),
+    scope: str = Query("public", pattern="^(public|all|restricted)$"),
+    principal: Optional[Principal] = Depends(get_principal)
+):
+    """
+    Type-ahead suggestions: book titles (kisi bhi word ki shuruaat se), authors (books ki ginti ke saath)
+    ya users (username / naam). `scope=all|restricted` (unapproved aur restricted books) staff ke liye hai;
+    kind=user ke liye USER_VIEW chahiye. Zyada se zyada `limit` results; `truncated` batata hai ki aur bhi the.
+    """
+    if kind == "user":
+        _check_allowed(principal, ("USER_VIEW",), "Permission 'USER_VIEW' required to perform this action.")
+    elif scope != "public":
+        _check_allowed(principal, STAFF_PERMISSIONS, f"scope '{scope}' requires catalog staff permissions.")
+
+    # Index background refresher fresh rakhta hai; yahan sirf memory me bisect
+    suggestions, truncated = suggest_index.suggest(kind, prefix, limit, scope)
+    return {"kind": kind, "prefix": prefix, "suggestions": suggestions, "truncated": truncated}
@@ -1,9 +1,17 @@
 # postgraysql
 # file: database.py
 import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -15,6 +23,203 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable not set.")
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Read replicas (comma separated); khaali ho toh saara traffic primary par jaata hai
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+
+# --- Connection pool settings (har gunicorn worker ka apna pool hota hai) ---
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Hosted Postgres idle connections drop kar deta hai, isliye recycle aur pre-ping
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+
+class PoolMetrics:
+    """ Pool se connection milne me lagne wala wait time aur timeouts record karta hai. """
+
+    def __init__(self, sample_size: int = 1000):
+        self._lock = threading.Lock()
+        self._recent_waits = deque(maxlen=sample_size)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self._recent_waits.append(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent_waits)
+            checkouts = self.checkouts
+            return {
+                "checkouts": checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / checkouts * 1000, 3) if checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "recent_p95_wait_ms": round(recent[int(len(recent) * 0.95) - 1] * 1000, 3) if recent else 0.0,
+            }
+
+
+class InstrumentedPoolMixin:
+    """
+    Har checkout ka wait time pool ke apne `metrics` me record karta hai, taaki primary, replicas aur
+    async pools ke numbers alag alag dikhein. recreate() (dispose/invalidate) par metrics naye pool me chale jaate hain.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """ Sync engines ka QueuePool, wait metrics ke saath. """
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """ Async engines ka pool, wait metrics ke saath. """
+
+
+def engine_options(url: str) -> dict:
+    """ URL ke hisaab se pool options; SQLite (local dev) default pool hi rakhta hai. """
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def async_database_url(url: str) -> str:
+    """ Sync URL ka async driver wala version: Postgres ke liye asyncpg, SQLite ke liye aiosqlite. """
+    scheme, sep, rest = url.partition("://")
+    if scheme in ("postgres", "postgresql") or scheme.startswith("postgresql+"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    if scheme == "sqlite" or scheme.startswith("sqlite+"):
+        return f"sqlite+aiosqlite{sep}{rest}"
+    return url
+
+
+def async_engine_options(url: str) -> dict:
+    """ Async engine ke pool options; QueuePool ki jagah instrumented async adapted pool. """
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def pool_status(engine) -> dict:
+    """ Ek engine ke pool ki live state: checked-out, idle, overflow aur wait times. Async engine ke liye .sync_engine dein. """
+    pool = engine.pool
+    status = {
+        "worker_pid": os.getpid(),
+        "pool_class": type(pool).__name__,
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status["wait"] = metrics.snapshot()
+    if isinstance(pool, QueuePool):
+        status.update({
+            "pool_size": pool.size(),
+            "max_overflow": DB_MAX_OVERFLOW,
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "timeout_seconds": pool.timeout(),
+        })
+    return status
+
+
+# Request ka route: "replica" sirf un GET requests ke liye jo read-your-writes window me nahi hain
+db_route: ContextVar[str] = ContextVar("db_route", default="primary")
+
+
+class RoutingSession(Session):
+    """
+    Session jo reads ko replica par aur writes/flush ko primary par bhejta hai.
+    Ek session poori request me ek hi replica use karta hai taaki reads consistent rahein.
+    """
+    primary_bind = None
+    replica_binds = ()
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            self.replica_binds
+            and db_route.get() == "replica"
+            and not self._flushing
+            and not (self.new or self.dirty or self.deleted)
+        ):
+            replica = self.info.get("replica_bind")
+            if replica is None:
+                replica = self.info["replica_bind"] = random.choice(self.replica_binds)
+            return replica
+        return self.primary_bind
+
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+replica_engines = [create_engine(url, **engine_options(url)) for url in DATABASE_REPLICA_URLS]
+
+class PrimaryReplicaSession(RoutingSession):
+    primary_bind = engine
+    replica_binds = tuple(replica_engines)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, class_=PrimaryReplicaSession)
+
+# Public catalog reads ke liye async engine, taaki ek worker kai queries ek saath chala sake
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or async_database_url(DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **async_engine_options(DATABASE_URL))
+async_replica_engines = [
+    create_async_engine(async_database_url(url), **async_engine_options(url)) for url in DATABASE_REPLICA_URLS
+]
+
+class AsyncPrimaryReplicaSession(RoutingSession):
+    primary_bind = async_engine.sync_engine
+    replica_binds = tuple(e.sync_engine for e in async_replica_engines)
+
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, sync_session_class=AsyncPrimaryReplicaSession)
 Base = declarative_base()
+
+
+def all_pool_status() -> dict:
+    """ Is worker ke saare pools: sync primary, async primary aur har replica (sync + async) alag alag. """
+    pools = {"primary": pool_status(engine), "async_primary": pool_status(async_engine.sync_engine)}
+    for index, replica in enumerate(replica_engines):
+        pools[f"replica_{index}"] = pool_status(replica)
+    for index, replica in enumerate(async_replica_engines):
+        pools[f"async_replica_{index}"] = pool_status(replica.sync_engine)
+    for status in pools.values():
+        del status["worker_pid"]
+    return {"worker_pid": os.getpid(), "pools": pools}
@@ -0,0 +1,72 @@
+# file: db_routing.py
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi import Request
+from database import db_route, DATABASE_REPLICA_URLS
+
+# Write ke baad itne seconds tak us client ke reads primary se hote hain (replica lag ke liye)
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "10"))
+READ_PIN_MAX_CLIENTS = int(os.getenv("READ_PIN_MAX_CLIENTS", "10000"))
+READ_PIN_COOKIE = "db_primary_until"
+
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+_lock = threading.Lock()
+_pinned_until: "OrderedDict[str, float]" = OrderedDict()
+
+
+def client_key(request: Request) -> str:
+    """ Bearer token (ya token na ho toh client IP) se client pehchanta hai. """
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return "t:" + hashlib.sha256(authorization.encode()).hexdigest()[:32]
+    return "ip:" + (request.client.host if request.client else "unknown")
+
+
+def pin_to_primary(key: str, until: float) -> None:
+    with _lock:
+        _pinned_until[key] = until
+        _pinned_until.move_to_end(key)
+        while len(_pinned_until) > READ_PIN_MAX_CLIENTS:
+            _pinned_until.popitem(last=False)
+
+
+def is_pinned(request: Request, key: str) -> bool:
+    now = time.time()
+    with _lock:
+        until = _pinned_until.get(key)
+    if until and until > now:
+        return True
+    # Cookie se pin doosre gunicorn workers tak bhi pahunchta hai
+    try:
+        return float(request.cookies.get(READ_PIN_COOKIE, "0")) > now
+    except ValueError:
+        return False
+
+
+async def route_db_reads(request: Request, call_next):
+    """
+    HTTP middleware: GET requests replica par, baaki primary par.
+    Successful write ke baad client READ_YOUR_WRITES_SECONDS ke liye primary par pin hota hai.
+    """
+    if not DATABASE_REPLICA_URLS:
+        return await call_next(request)
+
+    key = client_key(request)
+    is_read = request.method in READ_METHODS
+    route = "replica" if is_read and not is_pinned(request, key) else "primary"
+    token = db_route.set(route)
+    try:
+        response = await call_next(request)
+    finally:
+        db_route.reset(token)
+
+    if not is_read and response.status_code < 400:
+        until = time.time() + READ_YOUR_WRITES_SECONDS
+        pin_to_primary(key, until)
+        response.set_cookie(READ_PIN_COOKIE, str(int(until) + 1), max_age=int(READ_YOUR_WRITES_SECONDS) + 1, httponly=True)
+    return response
\ No newline at end of file
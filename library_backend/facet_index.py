@@ -0,0 +1,174 @@
+# file: facet_index.py
+import os
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, NamedTuple, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from models import book_model
+
+# Doosre workers ki book writes is interval ke andar poore reload se dikh jaati hain
+FACET_INDEX_REFRESH_SECONDS = float(os.getenv("FACET_INDEX_REFRESH_SECONDS", "300"))
+
+FACETS = ("category", "subcategory", "language", "publication_year", "is_digital")
+
+
+class BookFacets(NamedTuple):
+    is_approved: bool
+    language_id: Optional[int]
+    publication_year: Optional[int]
+    is_digital: bool
+    subcategory_ids: frozenset
+    category_ids: frozenset
+
+    def values(self, facet: str) -> Iterable:
+        if facet == "category":
+            return self.category_ids
+        if facet == "subcategory":
+            return self.subcategory_ids
+        if facet == "language":
+            return () if self.language_id is None else (self.language_id,)
+        if facet == "publication_year":
+            return () if self.publication_year is None else (self.publication_year,)
+        return (str(self.is_digital).lower(),)
+
+
+class BookFacetIndex:
+    """
+    Public catalog (live, non-restricted books) ke facet counts ka in-memory aggregate.
+    Har request par COUNT nahi chalta: counts load ke waqt bante hain aur sirf badli hui
+    books (ORM flush events se pata chalti hain) ke liye incrementally update hote hain.
+    """
+
+    def __init__(self, refresh_seconds: float = FACET_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._books: Dict[int, BookFacets] = {}
+        # approved_only scope -> facet -> Counter(value -> books)
+        self._counts: Dict[bool, Dict[str, Counter]] = self._empty_counts()
+        self._stale: Set[int] = set()
+        self._loaded_at: Optional[float] = None
+
+    @staticmethod
+    def _empty_counts() -> Dict[bool, Dict[str, Counter]]:
+        return {scope: {facet: Counter() for facet in FACETS} for scope in (True, False)}
+
+    def _fetch(self, db: Session, book_ids: Optional[Iterable[int]] = None) -> Dict[int, BookFacets]:
+        """ Do queries: books ke scalar facets aur subcategory/category links. """
+        Book, Subcategory, link = book_model.Book, book_model.Subcategory, book_model.book_subcategory_link
+        books = db.query(
+            Book.id, Book.is_approved, Book.language_id, Book.publication_year, Book.is_digital
+        ).filter(Book.is_restricted == False, Book.deleted_at.is_(None))
+        links = db.query(link.c.book_id, Subcategory.id, Subcategory.category_id).join(
+            Subcategory, Subcategory.id == link.c.subcategory_id
+        )
+        if book_ids is not None:
+            book_ids = list(book_ids)
+            books = books.filter(Book.id.in_(book_ids))
+            links = links.filter(link.c.book_id.in_(book_ids))
+
+        subcategories: Dict[int, Set[int]] = {}
+        categories: Dict[int, Set[int]] = {}
+        for book_id, subcategory_id, category_id in links:
+            subcategories.setdefault(book_id, set()).add(subcategory_id)
+            categories.setdefault(book_id, set()).add(category_id)
+
+        return {
+            book_id: BookFacets(
+                bool(is_approved), language_id, publication_year, bool(is_digital),
+                frozenset(subcategories.get(book_id, ())), frozenset(categories.get(book_id, ()))
+            )
+            for book_id, is_approved, language_id, publication_year, is_digital in books
+        }
+
+    def _apply(self, facets: BookFacets, delta: int) -> None:
+        scopes = (False, True) if facets.is_approved else (False,)
+        for scope in scopes:
+            for facet in FACETS:
+                counter = self._counts[scope][facet]
+                for value in facets.values(facet):
+                    counter[value] += delta
+                    if counter[value] <= 0:
+                        del counter[value]
+
+    def load(self, db: Session) -> None:
+        """ Poora aggregate dobara banata hai. """
+        books = self._fetch(db)
+        with self._lock:
+            self._books = books
+            self._counts = self._empty_counts()
+            for facets in books.values():
+                self._apply(facets, 1)
+            self._stale.clear()
+            self._loaded_at = time.monotonic()
+
+    def mark_stale(self, book_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._stale.update(book_ids)
+
+    def invalidate(self) -> None:
+        """ Agli request par poora reload (jaise subcategory ki category badalne par). """
+        self._loaded_at = None
+
+    def ensure_fresh(self, db: Session) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.refresh_seconds:
+            self.load(db)
+            return
+        with self._lock:
+            stale, self._stale = self._stale, set()
+        if not stale:
+            return
+        fresh = self._fetch(db, stale)
+        with self._lock:
+            for book_id in stale:
+                old = self._books.pop(book_id, None)
+                if old is not None:
+                    self._apply(old, -1)
+                new = fresh.get(book_id)
+                if new is not None:
+                    self._books[book_id] = new
+                    self._apply(new, 1)
+
+    def counts(self, approved_only: bool = True) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                facet: {str(value): count for value, count in counter.items()}
+                for facet, counter in self._counts[approved_only].items()
+            }
+
+
+book_facet_index = BookFacetIndex()
+
+
+# --- Session events: kisi bhi controller se book badle toh uske counts stale mark karein ---
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_books(session, flush_context):
+    changed = session.info.setdefault("facet_changed_books", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, book_model.Book) and obj.id is not None:
+            changed.add(obj.id)
+        elif isinstance(obj, book_model.Subcategory) and obj not in session.new:
+            # Sirf books collection badalna (book ke subcategories set karne par) reload ki wajah nahi
+            if obj in session.deleted or session.is_modified(obj, include_collections=False):
+                session.info["facet_full_reload"] = True
+        elif isinstance(obj, book_model.Category) and obj in session.deleted:
+            session.info["facet_full_reload"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changed_books(session):
+    changed = session.info.pop("facet_changed_books", None)
+    if session.info.pop("facet_full_reload", False):
+        book_facet_index.invalidate()
+    elif changed:
+        book_facet_index.mark_stale(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_books(session):
+    session.info.pop("facet_changed_books", None)
+    session.info.pop("facet_full_reload", None)
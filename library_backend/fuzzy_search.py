@@ -0,0 +1,222 @@
+# file: fuzzy_search.py
+import os
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import event, func, literal, or_, select
+from sqlalchemy.orm import Session
+
+from index_refresher import IndexRefresher
+from models import book_model
+
+# pg_trgm jaisa default: is se kam similarity wale matches nahi aate
+FUZZY_MATCH_THRESHOLD = float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.3"))
+# SQLite trigram index: doosre workers ki writes is interval ke andar poore reload se dikhti hain
+FUZZY_INDEX_REFRESH_SECONDS = float(os.getenv("FUZZY_INDEX_REFRESH_SECONDS", "300"))
+
+FIELDS = ("title", "author")
+_WORD = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def trigrams(value: Optional[str]) -> Set[str]:
+    """ pg_trgm jaise trigrams: lowercase, har word ke aage do aur peeche ek space. """
+    result: Set[str] = set()
+    for word in _WORD.findall((value or "").lower()):
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+# --- Postgres: pg_trgm (alembic revision 0008_books_trigram_indexes) ---
+
+def postgres_matches(q: str):
+    """
+    (Book.id, score) select: `q <% column` word-similarity operator GIN index use karta hai.
+    Threshold caller `set_config('pg_trgm.word_similarity_threshold', ...)` se transaction ke liye set karta hai.
+    """
+    Book = book_model.Book
+    query = literal(q)
+    score = func.greatest(
+        func.word_similarity(query, Book.title), func.word_similarity(query, func.coalesce(Book.author, ""))
+    ).label("score")
+    return (
+        select(Book.id, score)
+        .where(or_(query.op("<%")(Book.title), query.op("<%")(Book.author)))
+        .order_by(score.desc(), Book.id)
+    )
+
+
+def postgres_threshold(threshold: float):
+    return select(func.set_config("pg_trgm.word_similarity_threshold", str(threshold), True))
+
+
+# --- SQLite / baaki: in-process trigram index ---
+
+class IndexedBook(NamedTuple):
+    is_approved: bool
+    title: str
+    author: Optional[str]
+
+
+class BookTrigramIndex:
+    """
+    Public catalog (live, non-restricted books) ke title/author ka inverted trigram index.
+    Score pg_trgm ke word_similarity jaisa hai: query ke trigrams me se kitne field me mile; barabari par
+    poori similarity (shared / union) se chhota, behtar match wala field pehle. Badli hui books flush events se
+    stale mark hoti hain; background refresher (index_refresher) sirf wahi dobara padhta hai aur har
+    refresh_seconds par poora rebuild karke swap karta hai. Request path sirf search() se padhta hai.
+    """
+
+    def __init__(self, refresh_seconds: float = FUZZY_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._books: Dict[int, IndexedBook] = {}
+        # field -> trigram -> book ids
+        self._postings: Dict[str, Dict[str, List[int]]] = {field: {} for field in FIELDS}
+        # field -> book id -> us field ke trigrams ki ginti
+        self._sizes: Dict[str, Dict[int, int]] = {field: {} for field in FIELDS}
+        self._stale: Set[int] = set()
+        self._loaded_at: Optional[float] = None
+        # mark_stale isse set karta hai taaki refresher thread turant jaage
+        self.changed = threading.Event()
+
+    @property
+    def loaded_at(self) -> Optional[float]:
+        return self._loaded_at
+
+    def _fetch(self, db: Session, book_ids: Optional[Iterable[int]] = None) -> Dict[int, IndexedBook]:
+        Book = book_model.Book
+        query = db.query(Book.id, Book.is_approved, Book.title, Book.author).filter(
+            Book.is_restricted == False, Book.deleted_at.is_(None)
+        )
+        if book_ids is not None:
+            query = query.filter(Book.id.in_(list(book_ids)))
+        return {
+            book_id: IndexedBook(bool(is_approved), title, author)
+            for book_id, is_approved, title, author in query.yield_per(5000)
+        }
+
+    def _add(self, book_id: int, book: IndexedBook) -> None:
+        self._books[book_id] = book
+        for field in FIELDS:
+            grams = trigrams(getattr(book, field))
+            if grams:
+                self._sizes[field][book_id] = len(grams)
+            postings = self._postings[field]
+            for gram in grams:
+                postings.setdefault(gram, []).append(book_id)
+
+    def _remove(self, book_id: int) -> None:
+        book = self._books.pop(book_id, None)
+        if book is None:
+            return
+        for field in FIELDS:
+            self._sizes[field].pop(book_id, None)
+            postings = self._postings[field]
+            for gram in trigrams(getattr(book, field)):
+                ids = postings.get(gram)
+                if ids is not None:
+                    ids.remove(book_id)
+                    if not ids:
+                        del postings[gram]
+
+    def load(self, db: Session) -> None:
+        """ Poora index dobara banata hai (lock ke bahar), phir swap. """
+        # Fetch ke dauraan stale hui books agli ensure_fresh me lagengi, isliye clear fetch se pehle
+        with self._lock:
+            self._stale.clear()
+        fresh = BookTrigramIndex(self.refresh_seconds)
+        for book_id, book in self._fetch(db).items():
+            fresh._add(book_id, book)
+        with self._lock:
+            self._books, self._postings, self._sizes = fresh._books, fresh._postings, fresh._sizes
+            self._loaded_at = time.monotonic()
+
+    def mark_stale(self, book_ids: Iterable[int]) -> None:
+        # Index kabhi load hi nahi hua (jaise Postgres par) toh stale ids jama karne ka matlab nahi
+        if self._loaded_at is None:
+            return
+        with self._lock:
+            self._stale.update(book_ids)
+        self.changed.set()
+
+    def ensure_fresh(self, db: Session) -> None:
+        """ Refresher thread se: interval poora ho toh poora reload, warna sirf stale books. """
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.refresh_seconds:
+            self.load(db)
+            return
+        with self._lock:
+            stale, self._stale = self._stale, set()
+        if not stale:
+            return
+        fresh = self._fetch(db, stale)
+        with self._lock:
+            for book_id in stale:
+                self._remove(book_id)
+                if book_id in fresh:
+                    self._add(book_id, fresh[book_id])
+
+    def search(self, q: str, threshold: float, limit: int, approved_only: bool = True) -> List[Tuple[int, float]]:
+        """ (book id, score) best match pehle; score >= threshold wale hi. """
+        query = trigrams(q)
+        if not query:
+            return []
+        # Threshold tak pahunchne ke liye kam se kam itne trigrams milne chahiye
+        needed = max(1, int(threshold * len(query) + 0.999999))
+        best: Dict[int, Tuple[float, float]] = {}
+        with self._lock:
+            for field in FIELDS:
+                postings, sizes = self._postings[field], self._sizes[field]
+                shared = Counter()
+                for gram in query:
+                    ids = postings.get(gram)
+                    if ids:
+                        shared.update(ids)
+                for book_id, count in shared.items():
+                    if count < needed:
+                        continue
+                    if approved_only and not self._books[book_id].is_approved:
+                        continue
+                    score = (count / len(query), count / (len(query) + sizes[book_id] - count))
+                    if score[0] >= threshold and score > best.get(book_id, (0.0, 0.0)):
+                        best[book_id] = score
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], -item[1][1], item[0]))
+        return [(book_id, round(score[0], 4)) for book_id, score in ranked[:limit]]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "books": len(self._books),
+                "trigrams": {field: len(self._postings[field]) for field in FIELDS},
+                "stale": len(self._stale),
+            }
+
+
+book_trigram_index = BookTrigramIndex()
+book_trigram_refresher = IndexRefresher("trigram", book_trigram_index)
+
+
+# --- Session events: title/author/visibility badle toh book stale ---
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_books(session, flush_context):
+    changed = session.info.setdefault("trigram_changed_books", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, book_model.Book) and obj.id is not None:
+            changed.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changed_books(session):
+    changed = session.info.pop("trigram_changed_books", None)
+    if changed:
+        book_trigram_index.mark_stale(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_books(session):
+    session.info.pop("trigram_changed_books", None)
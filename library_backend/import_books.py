@@ -0,0 +1,57 @@
+# file: import_books.py
+"""
+CSV / JSONL file se books bulk import karta hai (POST /api/books/import jaisa hi, bina HTTP ke).
+
+Usage (library_backend folder se):
+    python import_books.py donated_books.csv --username admin
+    python import_books.py books.jsonl --batch-size 2000
+
+CSV columns: title, author, publisher, publication_year, isbn, is_digital, description,
+cover_image_url, language (naam) ya language_id, subcategory_ids ("3|7").
+JSONL me har line ek JSON object, wahi keys (subcategory_ids list ho sakti hai).
+Report JSON stdout par; koi row fail ho toh exit code 1.
+"""
+import argparse
+import json
+import sys
+
+from database import SessionLocal
+# Sabhi models import karein taaki relationships resolve ho sakein
+from models import (
+    book_model, log_model, library_management_models, book_permission_model,
+    language_model, user_model, request_model, permission_model, authz_version_model
+)
+import catalog_import
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk import books from CSV or JSONL.")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="File extension se detect na ho toh")
+    parser.add_argument("--batch-size", type=int, default=catalog_import.IMPORT_BATCH_SIZE)
+    parser.add_argument("--username", help="Audit log me is user ke naam se entries")
+    args = parser.parse_args()
+
+    file_format = args.format or catalog_import.detect_format(args.path)
+    if file_format is None:
+        parser.error("could not detect file format; pass --format")
+
+    db = SessionLocal()
+    try:
+        user = None
+        if args.username:
+            user = db.query(user_model.User).filter(user_model.User.username == args.username).first()
+            if user is None:
+                parser.error(f"user '{args.username}' not found")
+        with open(args.path, "rb") as binary:
+            rows = catalog_import.iter_rows(catalog_import.text_stream(binary), file_format)
+            report = catalog_import.import_books(db, rows, user, args.batch_size)
+    finally:
+        db.close()
+
+    print(json.dumps(report, indent=2))
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+# file: index_refresher.py
+import logging
+import threading
+import time
+
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Reload fail ho jaye toh itne seconds baad dobara koshish
+INDEX_RETRY_SECONDS = 5.0
+
+
+class IndexRefresher:
+    """
+    In-memory index ko ek background thread me fresh rakhta hai, taaki request path sirf padhe.
+    Index ka `changed` event (mark_stale) thread ko turant jagata hai aur sirf badli rows dobara padhi jaati hain;
+    `refresh_seconds` poore hone par poora rebuild lock ke bahar banta hai aur phir ek saath swap hota hai.
+    Index ko `changed`, `refresh_seconds`, `loaded_at` aur `ensure_fresh(db)` dena hota hai.
+    """
+
+    def __init__(self, name: str, index):
+        self.name = name
+        self.index = index
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name=f"{self.name}-refresher", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopping.set()
+            self.index.changed.set()
+            thread.join(timeout)
+
+    def _next_reload_in(self) -> float:
+        loaded_at = self.index.loaded_at
+        if loaded_at is None:
+            return 0.0
+        return max(0.0, loaded_at + self.index.refresh_seconds - time.monotonic())
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.index.changed.wait(self._next_reload_in())
+            self.index.changed.clear()
+            if self._stopping.is_set():
+                break
+            db = SessionLocal()
+            try:
+                self.index.ensure_fresh(db)
+            except Exception:
+                logger.exception("%s index refresh failed", self.name)
+                self._stopping.wait(INDEX_RETRY_SECONDS)
+            finally:
+                db.close()
@@ -0,0 +1,126 @@
+# file: login_throttle.py
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Iterable, Optional
+
+# Har username / IP ke liye token bucket: BURST attempts turant, phir REFILL_PER_MINUTE ki raftaar se
+LOGIN_USER_BURST = int(os.getenv("LOGIN_USER_BURST", "5"))
+LOGIN_USER_REFILL_PER_MINUTE = float(os.getenv("LOGIN_USER_REFILL_PER_MINUTE", "5"))
+LOGIN_IP_BURST = int(os.getenv("LOGIN_IP_BURST", "20"))
+LOGIN_IP_REFILL_PER_MINUTE = float(os.getenv("LOGIN_IP_REFILL_PER_MINUTE", "20"))
+LOGIN_THROTTLE_MAX_KEYS = int(os.getenv("LOGIN_THROTTLE_MAX_KEYS", "10000"))
+
+# Failed logins is window ke andar ek hi summary log row me jaate hain
+LOGIN_FAILED_SUMMARY_SECONDS = float(os.getenv("LOGIN_FAILED_SUMMARY_SECONDS", "60"))
+
+
+class TokenBucketThrottle:
+    """
+    Keys ('user:<name>', 'ip:<addr>') ke liye in-memory token buckets.
+    Sirf failed attempts token consume karte hain; bucket khaali ho toh attempt bcrypt se pehle reject hota hai.
+    """
+
+    def __init__(self, max_keys: int = LOGIN_THROTTLE_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    @staticmethod
+    def _limits(key: str) -> tuple:
+        if key.startswith("ip:"):
+            return LOGIN_IP_BURST, LOGIN_IP_REFILL_PER_MINUTE / 60.0
+        return LOGIN_USER_BURST, LOGIN_USER_REFILL_PER_MINUTE / 60.0
+
+    def _refilled(self, key: str, now: float) -> list:
+        burst, rate = self._limits(key)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return [float(burst), now]
+        tokens = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+        return [tokens, now]
+
+    def retry_after(self, keys: Iterable[str]) -> Optional[int]:
+        """ Koi bhi bucket khaali ho toh kitne seconds baad retry karein, warna None. """
+        now = time.monotonic()
+        wait = 0.0
+        with self._lock:
+            for key in keys:
+                tokens, _ = self._refilled(key, now)
+                if tokens < 1:
+                    _, rate = self._limits(key)
+                    wait = max(wait, (1 - tokens) / rate if rate else 60.0)
+            if wait:
+                self.rejected += 1
+        return int(wait) + 1 if wait else None
+
+    def consume(self, keys: Iterable[str]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                bucket = self._refilled(key, now)
+                bucket[0] = max(0.0, bucket[0] - 1)
+                self._buckets[key] = bucket
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+    def reset(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._buckets.pop(key, None)
+
+
+class FailedLoginAggregator:
+    """ Failed login attempts ko gin kar har window me ek summary banata hai. """
+
+    def __init__(self, window_seconds: float = LOGIN_FAILED_SUMMARY_SECONDS):
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._count = 0
+        self._throttled = 0
+        self._usernames = Counter()
+        self._ips = Counter()
+        self._window_start = None
+        self._window_started_at = time.monotonic()
+
+    def record(self, username: str, client_ip: str, throttled: bool = False) -> None:
+        with self._lock:
+            if self._window_start is None:
+                self._window_start = datetime.utcnow()
+                self._window_started_at = time.monotonic()
+            self._count += 1
+            self._throttled += int(throttled)
+            self._usernames[username] += 1
+            self._ips[client_ip] += 1
+
+    def drain(self, force: bool = False) -> Optional[str]:
+        """ Window poori hone par (ya force par) summary description return karke counters reset karta hai. """
+        with self._lock:
+            if not self._count:
+                return None
+            if not force and time.monotonic() - self._window_started_at < self.window_seconds:
+                return None
+            usernames = ", ".join(f"{name} ({n})" for name, n in self._usernames.most_common(20))
+            ips = ", ".join(f"{ip} ({n})" for ip, n in self._ips.most_common(10))
+            summary = (
+                f"{self._count} failed login attempts ({self._throttled} throttled) "
+                f"between {self._window_start:%Y-%m-%d %H:%M:%S} and {datetime.utcnow():%Y-%m-%d %H:%M:%S} UTC. "
+                f"Usernames: {usernames}. Client IPs: {ips}."
+            )
+            self._reset()
+            return summary
+
+
+login_throttle = TokenBucketThrottle()
+failed_login_aggregator = FailedLoginAggregator()
+
+
+def throttle_keys(username: str, client_ip: str) -> list:
+    return [f"user:{username.lower()}", f"ip:{client_ip}"]
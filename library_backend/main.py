@@ -1,8 +1,16 @@
 # file: main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, APIRouter
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from database import engine, Base
+from database import engine, Base, SessionLocal, replica_engines, async_engine, async_replica_engines
+from acl_index import book_acl_index
+from facet_index import book_facet_index
+from fuzzy_search import book_trigram_index, book_trigram_refresher
+from suggest_index import suggest_index, suggest_refresher
+from db_routing import route_db_reads
+import slow_query_log
+import response_cache
 
 # --- Sabhi controllers ko import karein ---
 from controllers import (
@@ -20,7 +28,10 @@ from controllers import (
     request_controller, 
     log_controller, 
     permission_controller,
-    book_permission_controller  # Naya controller add kiya
+    book_permission_controller,  # Naya controller add kiya
+    admin_controller,
+    change_controller,
+    suggest_controller
 )
 
 # --- Sabhi models ko import karein taaki create_all unhe dekh sake ---
@@ -32,14 +43,45 @@ from models import (
     request_model, 
     log_model, 
     permission_model,
-    book_permission_model  # Naya model add kiya
+    book_permission_model,  # Naya model add kiya
+    authz_version_model,
+    archive_model,
+    recommendation_model
 )
 
 # Database me tables create karein (agar maujood nahi hain)
 #Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Restricted books ka ACL index aur catalog facet counts startup par ek baar load karein
+    db = SessionLocal()
+    try:
+        book_acl_index.load(db)
+        book_facet_index.load(db)
+        suggest_index.load(db)
+        # Postgres pg_trgm use karta hai; baaki databases par fuzzy match in-process trigram index se
+        if engine.dialect.name != "postgresql":
+            book_trigram_index.load(db)
+    finally:
+        db.close()
+    # Aage ke refresh / rebuild background thread me, request path sirf index padhta hai
+    suggest_refresher.start()
+    if engine.dialect.name != "postgresql":
+        book_trigram_refresher.start()
+    yield
+    suggest_refresher.stop()
+    book_trigram_refresher.stop()
+    # Shutdown par bache hue failed-login counts ki summary likh dein
+    db = SessionLocal()
+    try:
+        auth_controller.write_failed_login_summary(db, force=True)
+    finally:
+        db.close()
+
 # FastAPI application ka instance banayein
 app = FastAPI(
+    lifespan=lifespan,
     title="Advanced Library Management API",
     version="5.0.0",  # Version update kiya
     description="A comprehensive API with Role-Based Access Control, Logging, Approval System, and Restricted Book Permissions.",
@@ -47,13 +89,28 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
-# CORS Middleware (Cross-Origin Resource Sharing) ko enable karein
+# Slow queries ko record karne ke liye sabhi engines par timing hooks
+slow_query_log.install(
+    engine, *replica_engines,
+    async_engine.sync_engine, *(e.sync_engine for e in async_replica_engines)
+)
+app.middleware("http")(slow_query_log.track_request_route)
+
+# Public catalog GETs: ETag / 304 aur rendered-response cache (route_db_reads ke andar chalta hai)
+app.middleware("http")(response_cache.cache_public_responses)
+
+# GET requests ko read replica par route karein (DATABASE_REPLICA_URLS set ho tab)
+app.middleware("http")(route_db_reads)
+
+# CORS Middleware (Cross-Origin Resource Sharing) ko enable karein.
+# Sabse aakhir me add kiya hai taaki yeh sabse bahar rahe: cached 200 / 304 bhi isi se guzarte hain
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Production me ise apne frontend URL se replace karein
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],  # Cursor pagination aur conditional GETs ke liye
 )
 
 # Static files (jaise uploaded images) ko serve karne ke liye
@@ -84,6 +141,10 @@ api_router.include_router(language_controller.router, prefix="/languages", tags=
 # Naya router yahan add karein
 api_router.include_router(book_permission_controller.router, prefix="/book-permissions", tags=["Restricted Book Permissions"])
 
+api_router.include_router(admin_controller.router, prefix="/admin", tags=["Admin Diagnostics"])
+api_router.include_router(change_controller.router, prefix="/changes", tags=["Change Feed"])
+api_router.include_router(suggest_controller.router, prefix="/suggest", tags=["Autocomplete"])
+
 # Sabhi API routes ko /api prefix ke saath main app me include karein
 app.include_router(api_router, prefix="/api")
 
@@ -0,0 +1,49 @@
+# file: models/archive_model.py
+from sqlalchemy import Column, DateTime, Enum, String, Table
+from database import Base
+
+# Source tables pehle register hone chahiye
+from . import (
+    book_model, language_model, library_management_models, user_model,
+    permission_model, book_permission_model, request_model
+)
+
+# Soft-deleted rows (deleted_at) wali tables jinhe archival job archive_<table> me le jaata hai
+ARCHIVED_ENTITY_TABLES = (
+    "books", "categories", "subcategories", "languages", "locations",
+    "book_copies", "users", "roles", "permissions",
+)
+# Parent ke saath jaane wali dependent rows (ON DELETE CASCADE, apna deleted_at nahi)
+ARCHIVED_DEPENDENT_TABLES = (
+    "book_subcategory_link", "book_permissions", "role_permissions", "upload_requests",
+)
+
+
+def _archive_type(column_type):
+    # Enum ka Postgres type source table ka hai; archive me plain string kaafi hai
+    if isinstance(column_type, Enum):
+        return String(column_type.length)
+    return column_type
+
+
+def _archive_table(source: Table) -> Table:
+    """ Source jaise hi columns (bina FK / unique constraints / indexes) aur archived_at. """
+    columns = [
+        Column(
+            column.name, _archive_type(column.type),
+            primary_key=column.primary_key, autoincrement=False, nullable=column.nullable
+        )
+        for column in source.columns
+    ]
+    return Table(
+        f"archive_{source.name}", Base.metadata, *columns,
+        Column("archived_at", DateTime, nullable=False),
+        mysql_engine='InnoDB'
+    )
+
+
+# source table naam -> archive Table
+archive_tables = {
+    name: _archive_table(Base.metadata.tables[name])
+    for name in ARCHIVED_ENTITY_TABLES + ARCHIVED_DEPENDENT_TABLES
+}
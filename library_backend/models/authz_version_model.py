@@ -0,0 +1,16 @@
+# file: models/authz_version_model.py
+from sqlalchemy import Column, Integer, String, TIMESTAMP, func
+from database import Base
+
+class AuthzVersion(Base):
+    """
+    Har scope ('role:<id>' ya 'user:<id>') ka authorization version.
+    Role ki permissions ya user ka status badalne par version bump hota hai,
+    jisse purane JWT ke andar ki permissions stale maani jaati hain.
+    """
+    __tablename__ = 'authz_versions'
+    scope = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = {'mysql_engine': 'InnoDB'}
\ No newline at end of file
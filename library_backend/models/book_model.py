@@ -1,5 +1,5 @@
 # file: models/book_model.py
-from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, Table, TIMESTAMP, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, Table, TIMESTAMP, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime
@@ -9,6 +9,7 @@ book_subcategory_link = Table(
     Base.metadata,
     Column('book_id', Integer, ForeignKey('books.id', ondelete="CASCADE"), primary_key=True),
     Column('subcategory_id', Integer, ForeignKey('subcategories.id', ondelete="CASCADE"), primary_key=True),
+    Index('ix_book_subcategory_link_subcategory', 'subcategory_id'),
     mysql_engine='InnoDB'
 )
 
@@ -56,6 +57,10 @@ class Book(Base):
     description = Column(Text, nullable=True)
     is_approved = Column(Boolean, default=False)
     is_restricted = Column(Boolean, default=False)
+    # Copies ke denormalized counters (availability.py; issue/return ke saath usi transaction me badalte hain)
+    copies_total = Column(Integer, nullable=False, default=0, server_default="0")
+    copies_available = Column(Integer, nullable=False, default=0, server_default="0")
+    copies_on_loan = Column(Integer, nullable=False, default=0, server_default="0")
     
     # --- BADLAV YAHAN HAI ---
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -65,4 +70,16 @@ class Book(Base):
     language = relationship("Language", back_populates="books")
     subcategories = relationship("Subcategory", secondary=book_subcategory_link, back_populates="books")
     upload_request = relationship("UploadRequest", back_populates="book", cascade="all, delete-orphan", uselist=False)
-    __table_args__ = {'mysql_engine': 'InnoDB'}
\ No newline at end of file
+    __table_args__ = {'mysql_engine': 'InnoDB'}
+
+# Hot filter indexes (alembic revision 0003_hot_filter_indexes)
+# read_books ka visibility filter sirf live books (deleted_at IS NULL) par chalta hai
+Index(
+    'ix_books_live_catalog', Book.is_restricted, Book.is_approved, Book.id,
+    postgresql_where=Book.deleted_at.is_(None), sqlite_where=Book.deleted_at.is_(None)
+)
+
+# Change feed (alembic revision 0005_change_feed_indexes): (updated_at, id) keyset
+Index('ix_books_updated_at_id', Book.updated_at, Book.id)
+Index('ix_categories_updated_at_id', Category.updated_at, Category.id)
+Index('ix_subcategories_updated_at_id', Subcategory.updated_at, Subcategory.id)
\ No newline at end of file
@@ -1,5 +1,5 @@
 # file: models/book_permission_model.py
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, func
 from database import Base
 from datetime import datetime
 
@@ -14,4 +14,10 @@ class BookPermission(Base):
     # --- BADLAV YAHAN HAI ---
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
-    __table_args__ = {'mysql_engine': 'InnoDB'}
\ No newline at end of file
+    __table_args__ = {'mysql_engine': 'InnoDB'}
+
+# Restricted book ACL lookups aur users/roles delete par cascade ke liye indexes (revision 0003)
+Index('ix_book_permissions_book_user', BookPermission.book_id, BookPermission.user_id)
+Index('ix_book_permissions_book_role', BookPermission.book_id, BookPermission.role_id)
+Index('ix_book_permissions_user', BookPermission.user_id)
+Index('ix_book_permissions_role', BookPermission.role_id)
\ No newline at end of file
@@ -1,5 +1,5 @@
 # file: models/language_model.py
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime
@@ -16,4 +16,7 @@ class Language(Base):
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime, nullable=True)
     
-    __table_args__ = {'mysql_engine': 'InnoDB'}
\ No newline at end of file
+    __table_args__ = {'mysql_engine': 'InnoDB'}
+
+# Change feed (alembic revision 0005_change_feed_indexes): (updated_at, id) keyset
+Index('ix_languages_updated_at_id', Language.updated_at, Language.id)
@@ -1,5 +1,5 @@
 # file: models/library_management_models.py
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime
@@ -69,4 +69,14 @@ class DigitalAccess(Base):
     client = relationship("User")
     book = relationship("Book")
     
-    __table_args__ = {'mysql_engine': 'InnoDB'}
\ No newline at end of file
+    __table_args__ = {'mysql_engine': 'InnoDB'}
+
+# Hot filter indexes (alembic revision 0003_hot_filter_indexes)
+Index('ix_issued_books_status', IssuedBook.status)
+Index('ix_issued_books_client_status', IssuedBook.client_id, IssuedBook.status)
+Index('ix_issued_books_copy', IssuedBook.copy_id)
+Index('ix_book_copies_book_status', BookCopy.book_id, BookCopy.status)
+Index('ix_book_copies_location', BookCopy.location_id)
+Index('ix_digital_access_client_timestamp', DigitalAccess.client_id, DigitalAccess.access_timestamp)
+# Change feed (alembic revision 0005_change_feed_indexes): (updated_at, id) keyset
+Index('ix_book_copies_updated_at_id', BookCopy.updated_at, BookCopy.id)
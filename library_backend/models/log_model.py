@@ -1,5 +1,5 @@
 # file: models/log_model.py
-from sqlalchemy import Column, Integer, String, TIMESTAMP, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, TIMESTAMP, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -16,4 +16,9 @@ class Log(Base):
     target_id = Column(Integer, nullable=True)
     description = Column(Text, nullable=True)
     action_by = relationship("User")
-    __table_args__ = {'mysql_engine': 'InnoDB'}
\ No newline at end of file
+    __table_args__ = {'mysql_engine': 'InnoDB'}
+
+# Hot filter indexes (alembic revision 0003_hot_filter_indexes)
+Index('ix_logs_timestamp', Log.timestamp)
+Index('ix_logs_action_by_timestamp', Log.action_by_id, Log.timestamp)
+Index('ix_logs_action_type_timestamp', Log.action_type, Log.timestamp)
\ No newline at end of file
@@ -0,0 +1,43 @@
+# file: models/recommendation_model.py
+from sqlalchemy import Column, Float, Index, Integer, String, TIMESTAMP, func
+from database import Base
+
+# Yeh tables issued_books se nikla hua (derived) data hain; `python build_recommendations.py --full`
+# inhe kabhi bhi dobara bana sakta hai, isliye books par foreign keys nahi rakhi.
+
+class BookCooccurrence(Base):
+    """
+    Sparse book x book matrix: kitne alag users ne dono books borrow ki hain. Dono direction ki
+    rows rakhi jaati hain (symmetric); book_id == other_book_id wali row us book ke alag borrowers ki ginti hai.
+    """
+    __tablename__ = 'book_cooccurrence'
+    book_id = Column(Integer, primary_key=True)
+    other_book_id = Column(Integer, primary_key=True)
+    borrowers = Column(Integer, nullable=False)
+
+    __table_args__ = {'mysql_engine': 'InnoDB'}
+
+
+class BookRelated(Base):
+    """ Har book ke top-K "borrowed together" books, rank order me; /books/{id}/related seedha yahin se padhta hai. """
+    __tablename__ = 'book_related'
+    book_id = Column(Integer, primary_key=True)
+    related_book_id = Column(Integer, primary_key=True)
+    rank = Column(Integer, nullable=False)
+    score = Column(Float, nullable=False)
+    borrowed_together = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index('ix_book_related_book_id_rank', 'book_id', 'rank'),
+        {'mysql_engine': 'InnoDB'},
+    )
+
+
+class JobWatermark(Base):
+    """ Incremental batch jobs ki progress, jaise recommendations ke liye aakhri processed IssuedBookID. """
+    __tablename__ = 'job_watermarks'
+    name = Column(String(50), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = {'mysql_engine': 'InnoDB'}
@@ -0,0 +1,90 @@
+# file: pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import and_, or_
+
+# List endpoints agle page ka opaque cursor is header me bhejte hain (body pehle jaisi list hi rehti hai)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """ (sort_key, id) values ko opaque, URL-safe cursor string me badalta hai. """
+    payload = [{"dt": v.isoformat()} if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list):
+            raise ValueError
+        return [datetime.fromisoformat(v["dt"]) if isinstance(v, dict) else v for v in payload]
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor.")
+
+
+# Cursor ki int values DB ke BIGINT range me hi (bahar ki value par driver OverflowError deta hai)
+_INT_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+def _matches_column(column, value: Any) -> bool:
+    """ Cursor value ka type sort column ke type se milta hai ya nahi (int / str / datetime). """
+    try:
+        expected = column.type.python_type
+    except NotImplementedError:
+        return False
+    if expected is int:
+        return isinstance(value, int) and not isinstance(value, bool) and value in _INT_RANGE
+    if expected is datetime:
+        return isinstance(value, datetime)
+    if expected is str:
+        return isinstance(value, str)
+    return False
+
+
+def keyset_paginate(query, sort_column, id_column, cursor: Optional[str], limit: int, skip: int = 0, descending: bool = False):
+    """
+    Query (sync Query ya select()) par (sort_column, id_column) ordering aur keyset filter lagata hai.
+    Cursor diya ho toh skip ignore hota hai. limit + 1 rows fetch hoti hain taaki agla page pata chale.
+    sort_column aur id_column same ho sakte hain (sirf id par sort).
+    """
+    columns = [sort_column] if sort_column is id_column else [sort_column, id_column]
+    order = [c.desc() for c in columns] if descending else [c.asc() for c in columns]
+    query = query.order_by(*order)
+
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(columns) or not all(map(_matches_column, columns, values)):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor.")
+        if len(columns) == 1:
+            condition = columns[0] < values[0] if descending else columns[0] > values[0]
+        else:
+            sort_value, id_value = values
+            after = (lambda c, v: c < v) if descending else (lambda c, v: c > v)
+            condition = or_(after(sort_column, sort_value), and_(sort_column == sort_value, after(id_column, id_value)))
+        query = query.filter(condition)
+    elif skip:
+        query = query.offset(skip)
+
+    return query.limit(limit + 1)
+
+
+def paginate_results(rows: Sequence[Any], limit: int, sort_attr: str, id_attr: str = "id") -> Tuple[List[Any], Optional[str]]:
+    """ limit + 1 rows me se page aur agla cursor (agar aur rows hain) return karta hai. """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    keys = [sort_attr] if sort_attr == id_attr else [sort_attr, id_attr]
+    return items, encode_cursor([getattr(last, key) for key in keys])
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
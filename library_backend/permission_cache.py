@@ -0,0 +1,109 @@
+# file: permission_cache.py
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Optional
+
+# TTL aur size env se configure ho sakte hain (har gunicorn worker ka apna cache hota hai)
+PERMISSION_CACHE_TTL_SECONDS = float(os.getenv("PERMISSION_CACHE_TTL_SECONDS", "300"))
+PERMISSION_CACHE_MAX_ENTRIES = int(os.getenv("PERMISSION_CACHE_MAX_ENTRIES", "1024"))
+
+
+@dataclass(frozen=True)
+class EffectivePermissions:
+    """ Ek user ke role ka resolved snapshot: role ka naam aur permission names. """
+    role_id: int
+    role_name: str
+    permissions: FrozenSet[str]
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role_name.lower() == "admin"
+
+    def allows(self, permission_name: str) -> bool:
+        return self.is_admin or permission_name in self.permissions
+
+
+class PermissionCache:
+    """
+    (user_id, role_id) -> EffectivePermissions ka in-process LRU cache, TTL ke saath.
+    Har entry us role version (authz_versions) ke saath rakhi jaati hai jis par woh load hui thi; caller ka
+    version alag ho toh entry miss maani jaati hai. Isliye kisi bhi worker me role version bump hone par baaki
+    workers bhi AUTHZ_VERSION_TTL_SECONDS ke andar purana snapshot chhod dete hain.
+    invalidate_role() sirf is worker ki entries turant hata deta hai.
+    """
+
+    def __init__(self, ttl_seconds: float = PERMISSION_CACHE_TTL_SECONDS, max_entries: int = PERMISSION_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_load(self, user_id: int, role_id: int, loader: Callable[[], Optional[EffectivePermissions]],
+                    role_version: int = 0) -> Optional[EffectivePermissions]:
+        key = (user_id, role_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now and entry[1] == role_version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        # Loader lock ke bahar chalta hai taaki DB wait doosre requests ko block na kare
+        value = loader()
+        if value is None:
+            return None
+
+        with self._lock:
+            self._entries[key] = (now + self.ttl_seconds, role_version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def invalidate_role(self, role_id: int) -> None:
+        with self._lock:
+            stale_keys = [key for key in self._entries if key[1] == role_id]
+            for key in stale_keys:
+                del self._entries[key]
+            self.invalidations += len(stale_keys)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            stale_keys = [key for key in self._entries if key[0] == user_id]
+            for key in stale_keys:
+                del self._entries[key]
+            self.invalidations += len(stale_keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "worker_pid": os.getpid(),
+            }
+
+
+# Process-wide instance jo auth.require_permission istemal karta hai
+permission_cache = PermissionCache()
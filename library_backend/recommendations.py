@@ -0,0 +1,324 @@
+# file: recommendations.py
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import bindparam, delete, func, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from models import book_model, library_management_models as lm
+from models.recommendation_model import BookCooccurrence, BookRelated, JobWatermark
+
+# Har book ke itne related books store hote hain (endpoint ka max limit bhi yahi)
+RELATED_TOP_K = int(os.getenv("RELATED_TOP_K", "20"))
+# Itne se kam common borrowers wale pairs recommend nahi hote; ek hi user ka pair aksar sirf noise hai
+RELATED_MIN_BORROWERS = int(os.getenv("RELATED_MIN_BORROWERS", "2"))
+
+# Itne seconds se naye issues agli run tak ruk jaate hain: abhi commit na hui transaction ki chhoti IssuedBookID
+# watermark ke peeche chhoot na jaaye (change feed ke CHANGES_SETTLE_SECONDS jaisa)
+RELATED_SETTLE_SECONDS = int(os.getenv("RELATED_SETTLE_SECONDS", "60"))
+
+WATERMARK_NAME = "recommendations"
+# IN (...) lists aur bulk inserts is size ke chunks me
+CHUNK_SIZE = 5000
+
+
+def _chunks(values: List[int], size: int = CHUNK_SIZE) -> Iterable[List[int]]:
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def _loan_pairs(db: Session, after_id: int, upto_id: int, client_ids: Optional[List[int]] = None) -> np.ndarray:
+    """ IssuedBookID (after_id, upto_id] wale issues ke distinct (client_id, book_id) pairs, shape (n, 2). """
+    Issue, Copy = lm.IssuedBook, lm.BookCopy
+    query = (
+        select(Issue.client_id, Copy.book_id).join(Copy, Copy.id == Issue.copy_id)
+        .where(Issue.id > after_id, Issue.id <= upto_id).distinct()
+    )
+    if client_ids is None:
+        rows = db.execute(query).all()
+    else:
+        rows = [row for chunk in _chunks(client_ids) for row in db.execute(query.where(Issue.client_id.in_(chunk)))]
+    return np.array(rows, dtype=np.int64).reshape(-1, 2)
+
+
+def _pair_keys(pairs: np.ndarray) -> np.ndarray:
+    return (pairs[:, 0] << 32) | pairs[:, 1]
+
+
+def _user_book_matrix(pairs: np.ndarray, users: np.ndarray, n_books: int) -> sparse.csr_matrix:
+    """ Binary users x books matrix; row = `users` (sorted) me client ki position, column = book id. """
+    rows = np.searchsorted(users, pairs[:, 0])
+    return sparse.csr_matrix(
+        (np.ones(len(pairs), dtype=np.int64), (rows, pairs[:, 1])), shape=(len(users), n_books)
+    )
+
+
+def _matrix_size(db: Session, *pairs: np.ndarray) -> int:
+    """ Book id hi matrix index hai: sabse badi book id (books, purani cooccurrence rows, naye loans) + 1. """
+    largest = max(
+        db.scalar(select(func.max(book_model.Book.id))) or 0,
+        db.scalar(select(func.max(BookCooccurrence.book_id))) or 0,
+        *(int(p[:, 1].max()) for p in pairs if len(p)),
+    )
+    return largest + 1
+
+
+def _load_rows(db: Session, book_ids: List[int], n_books: int) -> sparse.csr_matrix:
+    """ Stored matrix ki sirf in books wali rows (baaki rows khali). """
+    data, rows, cols = [], [], []
+    for chunk in _chunks(book_ids):
+        for book_id, other_id, borrowers in db.execute(
+            select(BookCooccurrence.book_id, BookCooccurrence.other_book_id, BookCooccurrence.borrowers)
+            .where(BookCooccurrence.book_id.in_(chunk))
+        ):
+            rows.append(book_id)
+            cols.append(other_id)
+            data.append(borrowers)
+    return sparse.csr_matrix(
+        (np.array(data, dtype=np.int64), (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64))),
+        shape=(n_books, n_books),
+    )
+
+
+def _load_borrower_counts(db: Session, book_ids: List[int], n_books: int) -> np.ndarray:
+    """ Diagonal (har book ke alag borrowers) dense array me, sirf di gayi books ke liye bhara hua. """
+    counts = np.zeros(n_books, dtype=np.int64)
+    for chunk in _chunks(book_ids):
+        for book_id, borrowers in db.execute(
+            select(BookCooccurrence.book_id, BookCooccurrence.borrowers)
+            .where(BookCooccurrence.book_id.in_(chunk), BookCooccurrence.other_book_id == BookCooccurrence.book_id)
+        ):
+            counts[book_id] = borrowers
+    return counts
+
+
+def _write_cooccurrence(db: Session, matrix: sparse.csr_matrix) -> int:
+    coo = matrix.tocoo()
+    keep = coo.data > 0
+    rows = list(zip(coo.row[keep].tolist(), coo.col[keep].tolist(), coo.data[keep].tolist()))
+    for chunk in _chunks(rows):
+        db.execute(
+            insert(BookCooccurrence.__table__),
+            [{"book_id": b, "other_book_id": o, "borrowers": n} for b, o, n in chunk],
+        )
+    return len(rows)
+
+
+def _add_cooccurrence(db: Session, delta: sparse.coo_matrix) -> int:
+    """ Stored counts me delta jodta hai: `borrowers = borrowers + delta`, row na ho toh insert (dialect upsert). """
+    table = BookCooccurrence.__table__
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "mysql":
+        stmt = mysql_insert(table)
+        stmt = stmt.on_duplicate_key_update(borrowers=table.c.borrowers + stmt.inserted.borrowers)
+    else:
+        stmt = (postgresql_insert if dialect_name == "postgresql" else sqlite_insert)(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.book_id, table.c.other_book_id],
+            set_={"borrowers": table.c.borrowers + stmt.excluded.borrowers},
+        )
+    rows = list(zip(delta.row.tolist(), delta.col.tolist(), delta.data.tolist()))
+    for chunk in _chunks(rows):
+        db.execute(stmt, [{"book_id": b, "other_book_id": o, "borrowers": n} for b, o, n in chunk])
+    return len(rows)
+
+
+def top_related(matrix: sparse.csr_matrix, borrowers: np.ndarray, book_ids: np.ndarray,
+                top_k: int, min_borrowers: int) -> List[dict]:
+    """
+    `book_ids` ki rows se har book ke top_k neighbours, poora kaam vectorized (per-book Python loop nahi).
+    Score cosine hai: together / sqrt(borrowers_i * borrowers_j), taaki sirf popular books har list me upar na aayein.
+    Barabar score par zyada common borrowers, phir chhoti book id pehle.
+    """
+    coo = matrix[book_ids].tocoo()
+    rows, cols, together = book_ids[coo.row], coo.col.astype(np.int64), coo.data
+    keep = (rows != cols) & (together >= min_borrowers)
+    rows, cols, together = rows[keep], cols[keep], together[keep]
+    if not len(rows):
+        return []
+    # Stored (rounded) score par hi sort, taaki _rescore_lists ka re-rank bhi yahi order de
+    score = np.round(together / np.sqrt(borrowers[rows].astype(np.float64) * borrowers[cols]), 6)
+
+    order = np.lexsort((cols, -together, -score, rows))
+    rows, cols, together, score = rows[order], cols[order], together[order], score[order]
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+    rank = np.arange(len(rows)) - np.repeat(starts, np.diff(np.r_[starts, len(rows)]))
+    top = rank < top_k
+    return [
+        {"book_id": b, "related_book_id": r, "rank": k + 1, "score": s, "borrowed_together": n}
+        for b, r, k, s, n in zip(
+            rows[top].tolist(), cols[top].tolist(), rank[top].tolist(), score[top].tolist(), together[top].tolist()
+        )
+    ]
+
+
+def _write_related(db: Session, related: List[dict]) -> None:
+    for chunk in _chunks(related):
+        db.execute(insert(BookRelated.__table__), chunk)
+
+
+def _rescore_lists(db: Session, book_ids: np.ndarray, grown: np.ndarray, top_k: int, n_books: int):
+    """
+    Jin books ki row nahi badli par stored list me `grown` (borrowers badhe) books hain: un entries ka score
+    sirf girta hai, baaki list jaisi thi waisi. Isliye score dobara gin kar list re-rank karna kaafi hai, jab tak
+    gira hua score list ke purane sabse kam score se upar hai (list ke bahar wale candidates usse upar nahi the).
+    Bhari hui list me score us se neeche gire toh bahar ka candidate aa sakta hai: woh books lautayi jaati hain
+    taaki caller unki poori row se top-K dobara banaye. Returns (recompute book ids, updated rows ki ginti).
+    """
+    b, r, rank, score, together = [], [], [], [], []
+    for chunk in _chunks(book_ids.tolist()):
+        for row in db.execute(
+            select(BookRelated.book_id, BookRelated.related_book_id, BookRelated.rank, BookRelated.score,
+                   BookRelated.borrowed_together).where(BookRelated.book_id.in_(chunk))
+        ):
+            b.append(row[0]); r.append(row[1]); rank.append(row[2]); score.append(row[3]); together.append(row[4])
+    if not b:
+        return np.array([], dtype=np.int64), 0
+    b, r, rank = np.array(b, dtype=np.int64), np.array(r, dtype=np.int64), np.array(rank, dtype=np.int64)
+    score, together = np.array(score, dtype=np.float64), np.array(together, dtype=np.int64)
+    order = np.lexsort((rank, b))
+    b, r, rank, score, together = b[order], r[order], rank[order], score[order], together[order]
+
+    borrowers = _load_borrower_counts(db, np.union1d(b, r).tolist(), n_books)
+    new_score = np.round(together / np.sqrt(borrowers[b].astype(np.float64) * borrowers[r]), 6)
+    starts = np.flatnonzero(np.r_[True, b[1:] != b[:-1]])
+    sizes = np.diff(np.r_[starts, len(b)])
+    dropped = np.isin(r, grown) & (new_score <= np.repeat(np.minimum.reduceat(score, starts), sizes))
+    full = np.logical_or.reduceat(dropped, starts) & (sizes >= top_k)
+    recompute = b[starts][full]
+
+    keep = ~np.repeat(full, sizes)
+    b, r, rank, score, together, new_score = b[keep], r[keep], rank[keep], score[keep], together[keep], new_score[keep]
+    order = np.lexsort((r, -together, -new_score, b))
+    b, r, rank, score, together, new_score = b[order], r[order], rank[order], score[order], together[order], new_score[order]
+    starts = np.flatnonzero(np.r_[True, b[1:] != b[:-1]]) if len(b) else starts[:0]
+    new_rank = np.arange(len(b)) - np.repeat(starts, np.diff(np.r_[starts, len(b)])) + 1
+    changed = (new_rank != rank) | (new_score != score)
+    updates = [
+        {"b": bb, "r": rr, "rank": kk, "score": ss}
+        for bb, rr, kk, ss in zip(b[changed].tolist(), r[changed].tolist(), new_rank[changed].tolist(), new_score[changed].tolist())
+    ]
+    table = BookRelated.__table__
+    for chunk in _chunks(updates):
+        db.execute(
+            table.update().where(table.c.book_id == bindparam("b"), table.c.related_book_id == bindparam("r"))
+            .values(rank=bindparam("rank"), score=bindparam("score")),
+            chunk,
+        )
+    return recompute, len(updates)
+
+
+def _lock_watermark(db: Session) -> JobWatermark:
+    """ Watermark row FOR UPDATE: do jobs saath chalein toh doosra pehle ke commit tak rukta hai (double count nahi). """
+    watermark = db.execute(
+        select(JobWatermark).where(JobWatermark.name == WATERMARK_NAME).with_for_update()
+    ).scalar_one_or_none()
+    if watermark is None:
+        watermark = JobWatermark(name=WATERMARK_NAME, value=0)
+        db.add(watermark)
+        db.flush()
+    return watermark
+
+
+def _full_rebuild(db: Session, upto_id: int, top_k: int, min_borrowers: int, report: dict) -> None:
+    pairs = _loan_pairs(db, 0, upto_id)
+    users = np.unique(pairs[:, 0])
+    n_books = _matrix_size(db, pairs)
+    a = _user_book_matrix(pairs, users, n_books)
+    matrix = (a.T @ a).tocsr()
+    borrowers = matrix.diagonal()
+    books = np.flatnonzero(borrowers)
+
+    db.execute(delete(BookCooccurrence))
+    db.execute(delete(BookRelated))
+    report["cooccurrence_rows"] = _write_cooccurrence(db, matrix)
+    related = top_related(matrix, borrowers, books, top_k, min_borrowers)
+    _write_related(db, related)
+    report.update(loans=len(pairs), users=len(users), books_recomputed=len(books), related_rows=len(related))
+
+
+def _incremental(db: Session, after_id: int, upto_id: int, top_k: int, min_borrowers: int, report: dict) -> None:
+    """
+    Sirf naye issues ke users: A_old = unke pehle ke loans, A_new = pehli baar borrow hui books.
+    Matrix me badlav dC = A_newᵀA_old + A_oldᵀA_new + A_newᵀA_new (diagonal bhi isi se badhta hai); sirf
+    dC ke cells upsert hote hain. Top-K poori row se sirf un books ka dobara banta hai jinki row badli; jin lists
+    me koi aisi book hai jiske borrowers badhe, unhe _rescore_lists jagah par theek karta hai.
+    """
+    new_pairs = _loan_pairs(db, after_id, upto_id)
+    users = np.unique(new_pairs[:, 0])
+    old_pairs = _loan_pairs(db, 0, after_id, users.tolist()) if len(users) else new_pairs[:0]
+    # Jo book user pehle bhi le chuka hai uska dobara issue koi naya pair nahi banata
+    new_pairs = new_pairs[~np.isin(_pair_keys(new_pairs), _pair_keys(old_pairs))]
+    report.update(loans=len(new_pairs), users=len(users))
+    if not len(new_pairs):
+        return
+
+    n_books = _matrix_size(db, new_pairs, old_pairs)
+    a_old = _user_book_matrix(old_pairs, users, n_books)
+    a_new = _user_book_matrix(new_pairs, users, n_books)
+    cross = a_new.T @ a_old
+    delta = (cross + cross.T + a_new.T @ a_new).tocoo()
+    report["cooccurrence_rows"] = _add_cooccurrence(db, delta)
+
+    affected = np.unique(delta.row)
+    grown = np.unique(new_pairs[:, 1])
+    listed = set()
+    for chunk in _chunks(grown.tolist()):
+        listed.update(db.scalars(
+            select(BookRelated.book_id).where(BookRelated.related_book_id.in_(chunk)).distinct()
+        ))
+    listed = np.setdiff1d(np.array(sorted(listed), dtype=np.int64), affected)
+    recompute, rescored = _rescore_lists(db, listed, grown, top_k, n_books)
+    books = np.union1d(affected, recompute)
+
+    matrix = _load_rows(db, books.tolist(), n_books)
+    borrowers = _load_borrower_counts(db, np.unique(matrix.tocoo().col).tolist(), n_books)
+    related = top_related(matrix, borrowers, books, top_k, min_borrowers)
+    for chunk in _chunks(books.tolist()):
+        db.execute(delete(BookRelated).where(BookRelated.book_id.in_(chunk)))
+    _write_related(db, related)
+    report.update(books_recomputed=len(books), lists_rescored=len(listed) - len(recompute),
+                  related_rows=len(related) + rescored)
+
+
+def refresh(db: Session, full: bool = False, top_k: int = RELATED_TOP_K,
+            min_borrowers: int = RELATED_MIN_BORROWERS) -> dict:
+    """
+    Watermark ke baad ke issues se co-occurrence matrix aur top-K lists update karke ek transaction me commit.
+    full=True (ya pehli run) par poori history se C = AᵀA dobara banta hai; top_k / min_borrowers badalne ke baad,
+    ya purane issues delete / archive hone ke baad full run chahiye, kyunki incremental run sirf naye issues dekhta hai.
+    """
+    started = time.perf_counter()
+    watermark = _lock_watermark(db)
+    settled = datetime.utcnow() - timedelta(seconds=RELATED_SETTLE_SECONDS)
+    upto_id = max(watermark.value, db.scalar(
+        select(func.max(lm.IssuedBook.id)).where(lm.IssuedBook.issue_date <= settled)
+    ) or 0)
+    full = full or watermark.value == 0
+    report = {
+        "mode": "full" if full else "incremental", "from_issue_id": 0 if full else watermark.value,
+        "to_issue_id": upto_id, "loans": 0, "users": 0, "cooccurrence_rows": 0, "books_recomputed": 0,
+        "lists_rescored": 0, "related_rows": 0,
+    }
+    if full:
+        _full_rebuild(db, upto_id, top_k, min_borrowers, report)
+    elif upto_id > watermark.value:
+        _incremental(db, watermark.value, upto_id, top_k, min_borrowers, report)
+    watermark.value = upto_id
+    db.commit()
+    report["seconds"] = round(time.perf_counter() - started, 3)
+    return report
+
+
+def related_books(db: Session, book_id: int, limit: int) -> List[BookRelated]:
+    """ Stored top-K me se rank order me (ix_book_related_book_id_rank par seedha range scan). """
+    return db.execute(
+        select(BookRelated).where(BookRelated.book_id == book_id).order_by(BookRelated.rank).limit(limit)
+    ).scalars().all()
@@ -0,0 +1,43 @@
+# file: reconcile_availability.py
+"""
+books ke copies_total / copies_available / copies_on_loan counters ko book_copies se dobara gin kar
+drift report karta hai (aur default me theek bhi karta hai).
+
+Usage (library_backend folder se):
+    python reconcile_availability.py --dry-run
+    python reconcile_availability.py --batch-size 5000
+
+Report JSON stdout par; drift mila ho toh exit code 1 (cron alert ke liye), chahe fix ho gaya ho.
+"""
+import argparse
+import json
+import sys
+
+from database import SessionLocal
+# Sabhi models import karein taaki relationships resolve ho sakein
+from models import (
+    book_model, log_model, library_management_models, book_permission_model,
+    language_model, user_model, request_model, permission_model, authz_version_model, archive_model
+)
+import availability
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Recompute per-book copy counters and report drift.")
+    parser.add_argument("--dry-run", action="store_true", help="Sirf drift report; counters update nahi hote")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--max-reported", type=int, default=100, help="Report me itni books tak detail")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = availability.reconcile(db, not args.dry_run, args.batch_size, args.max_reported)
+    finally:
+        db.close()
+
+    print(json.dumps(report, indent=2))
+    return 1 if report["books_drifted"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,4 +5,4 @@ pip install --upgrade pip
 pip install -r requirements.txt
 
 # Run alembic before the app starts
-alembic stamp head
+alembic upgrade head
@@ -0,0 +1,164 @@
+# file: response_cache.py
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+import authz_versions
+from database import SessionLocal
+
+# Browser/proxy kitni der bina revalidate kiye response rakh sakte hain (0 = har baar If-None-Match)
+CATALOG_CACHE_MAX_AGE = int(os.getenv("CATALOG_CACHE_MAX_AGE", "0"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+
+# Collection versions authz_versions table me rehte hain, taaki sab workers ek hi ETag banayein
+BOOKS, CATEGORIES, LANGUAGES = "catalog:books", "catalog:categories", "catalog:languages"
+_COLLECTIONS = {"books": BOOKS, "categories": CATEGORIES, "languages": LANGUAGES}
+
+# Public GET routes aur woh collections jin par unka response depend karta hai
+# (book response me language aur subcategory -> category bhi hote hain)
+CACHED_ROUTES = [
+    (re.compile(r"^/api/books/?$"), (BOOKS, CATEGORIES, LANGUAGES)),
+    (re.compile(r"^/api/books/search$"), (BOOKS, CATEGORIES, LANGUAGES)),
+    (re.compile(r"^/api/books/fuzzy$"), (BOOKS, CATEGORIES, LANGUAGES)),
+    (re.compile(r"^/api/books/\d+$"), (BOOKS, CATEGORIES, LANGUAGES)),
+    (re.compile(r"^/api/categories/?(\d+)?$"), (CATEGORIES,)),
+    (re.compile(r"^/api/subcategories/?(\d+)?$"), (CATEGORIES,)),
+    (re.compile(r"^/api/languages/?(\d+)?$"), (LANGUAGES,)),
+]
+
+# Cached response ke saath yeh headers bhi replay hote hain
+_REPLAYED_HEADERS = ("content-type", "x-next-cursor")
+
+
+class RenderedResponseCache:
+    """ Rendered JSON bodies ka LRU; key me collection versions hain, isliye write ke baad purani entries match hi nahi hoti. """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[bytes, Dict[str, str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, body: bytes, headers: Dict[str, str]) -> None:
+        with self._lock:
+            self._entries[key] = (body, headers)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+rendered_cache = RenderedResponseCache()
+
+
+def invalidate(db: Session, *collections: str) -> None:
+    """
+    Write endpoints commit se pehle call karein ("books", "categories", "languages").
+    Version usi transaction me badhta hai; commit ke baad is worker ki cached version turant bhool jaati hai.
+    """
+    for name in collections:
+        scope = _COLLECTIONS[name]
+        authz_versions.bump_version(db, scope)
+        db.info.setdefault("catalog_bumped", set()).add(scope)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_bumped_versions(session):
+    scopes = session.info.pop("catalog_bumped", None)
+    if scopes:
+        authz_versions.forget(*scopes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_bumped_versions(session):
+    session.info.pop("catalog_bumped", None)
+
+
+def _cache_key(request: Request, scopes) -> Tuple[str, str]:
+    db = SessionLocal()
+    try:
+        versions = authz_versions.get_versions(db, scopes)
+    finally:
+        db.close()
+    query = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+    key = f"{request.url.path}?{query}|" + ",".join(f"{scope}={versions[scope]}" for scope in scopes)
+    return key, '"' + hashlib.sha1(key.encode()).hexdigest() + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": f"public, max-age={CATALOG_CACHE_MAX_AGE}, must-revalidate"}
+
+
+async def cache_public_responses(request: Request, call_next):
+    """
+    HTTP middleware: public catalog GETs ke liye strong ETag (collection versions se), If-None-Match par 304,
+    aur rendered-response cache. Jo handler `Cache-Control: no-store` lagaye (restricted/unapproved book) woh cache nahi hota.
+    """
+    if request.method != "GET":
+        return await call_next(request)
+    scopes = next((scopes for pattern, scopes in CACHED_ROUTES if pattern.match(request.url.path)), None)
+    if scopes is None:
+        return await call_next(request)
+
+    # Version lookup me DB query ho sakti hai (TTL expire hone par), isliye threadpool me
+    key, etag = await run_in_threadpool(_cache_key, request, scopes)
+    cached = rendered_cache.get(key)
+    if cached is not None:
+        body, headers = cached
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=_cache_headers(etag))
+        return Response(content=body, status_code=200, headers={**headers, **_cache_headers(etag)})
+
+    response = await call_next(request)
+    if response.status_code != 200 or "no-store" in response.headers.get("cache-control", ""):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    headers = {name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers}
+    rendered_cache.put(key, body, headers)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+    return Response(
+        content=body, status_code=200,
+        headers={**dict(response.headers), **_cache_headers(etag)}, background=response.background
+    )
@@ -1,6 +1,6 @@
 # file: schemas/book_schema.py
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 # Sahi language schema ko import kiya
 from .language_schema import Language as LanguageSchema
 # Sahi subcategory schema ko import kiya
@@ -24,9 +24,37 @@ class Book(BookBase):
     id: int
     is_approved: bool
     is_restricted: bool
+    # "3 of 5 copies available" ke liye
+    copies_total: int = 0
+    copies_available: int = 0
+    copies_on_loan: int = 0
     # Sahi schema ka istemal kiya
     language: LanguageSchema
     subcategories: List[SubcategorySchema] = []
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class BookFuzzyMatch(Book):
+    """ /books/fuzzy ka result: book aur uska trigram similarity score (0-1). """
+    similarity: float
+
+class RelatedBook(Book):
+    """ /books/{id}/related ka result: book, cosine score (0-1) aur kitne users ne dono books borrow ki. """
+    score: float
+    borrowed_together: int
+
+class BookFacetPage(BaseModel):
+    """ with_facets=true par read_books ka response: books aur facet -> {value: count}. """
+    items: List[Book]
+    facets: Dict[str, Dict[str, int]]
+
+
+class BookBatchRequest(BaseModel):
+    ids: List[int]
+
+class BookBatch(BaseModel):
+    """ /books/batch ka response: dikhne wali books (request order me), aur baaki ids ki wajah. """
+    books: List[Book]
+    not_found: List[int] = []
+    forbidden: List[int] = []
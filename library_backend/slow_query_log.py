@@ -0,0 +1,164 @@
+# file: slow_query_log.py
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from fastapi import Request
+from sqlalchemy import event
+
+# Isse zyada time lene wali queries record hoti hain
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+# Har statement shape ke pehle N slow occurrences ka EXPLAIN capture hota hai
+SLOW_QUERY_EXPLAIN_SAMPLES = int(os.getenv("SLOW_QUERY_EXPLAIN_SAMPLES", "3"))
+SLOW_QUERY_MAX_SHAPES = int(os.getenv("SLOW_QUERY_MAX_SHAPES", "500"))
+
+# Kaun si API route ne query chalayi, yeh middleware set karta hai
+current_route: ContextVar[str] = ContextVar("current_route", default="-")
+
+# IN (...) lists ki lambai alag hone par bhi ek hi shape maana jaaye
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%\([^)]+\)s|%s|:\w+|\$\d+)\s*,)+\s*(?:\?|%\([^)]+\)s|%s|:\w+|\$\d+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    return _WHITESPACE.sub(" ", _IN_LIST.sub("(...)", statement)).strip()
+
+
+class SlowQueryLog:
+    """ Slow statements ko shape ke hisaab se aggregate karta hai (count, total/max time, routes, EXPLAIN). """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._shapes = {}
+
+    def record(self, statement: str, parameters, duration_ms: float, route: str) -> bool:
+        """ Entry update karta hai; True return karta hai agar is occurrence ka EXPLAIN lena chahiye. """
+        shape = statement_shape(statement)
+        key = hashlib.sha1(shape.encode()).hexdigest()[:16]
+        with self._lock:
+            entry = self._shapes.get(key)
+            if entry is None:
+                if len(self._shapes) >= SLOW_QUERY_MAX_SHAPES:
+                    # Sabse kam total time wali shape hata kar jagah banayein
+                    victim = min(self._shapes, key=lambda k: self._shapes[k]["total_ms"])
+                    del self._shapes[victim]
+                entry = self._shapes[key] = {
+                    "shape_id": key, "statement": shape, "count": 0, "total_ms": 0.0, "max_ms": 0.0,
+                    "routes": Counter(), "last_parameters": None, "explains": [],
+                }
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            entry["routes"][route] += 1
+            entry["last_parameters"] = repr(parameters)[:500]
+            return entry["count"] <= SLOW_QUERY_EXPLAIN_SAMPLES
+
+    def add_explain(self, statement: str, duration_ms: float, route: str, plan: str) -> None:
+        key = hashlib.sha1(statement_shape(statement).encode()).hexdigest()[:16]
+        with self._lock:
+            entry = self._shapes.get(key)
+            if entry is not None:
+                entry["explains"].append({"duration_ms": round(duration_ms, 3), "route": route, "plan": plan})
+
+    def top(self, limit: int = 20) -> list:
+        with self._lock:
+            entries = sorted(self._shapes.values(), key=lambda e: e["total_ms"], reverse=True)[:limit]
+            return [
+                {
+                    **entry,
+                    "total_ms": round(entry["total_ms"], 3),
+                    "max_ms": round(entry["max_ms"], 3),
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 3),
+                    "routes": dict(entry["routes"].most_common(10)),
+                    "explains": list(entry["explains"]),
+                }
+                for entry in entries
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+def _explain(conn, statement: str, parameters) -> str:
+    """
+    Usi connection par raw DBAPI cursor se EXPLAIN chalata hai (SQLAlchemy events dobara trigger nahi hote).
+    ANALYZE sirf SELECT ke liye, kyunki woh query ko sach me execute karta hai.
+    Postgres par savepoint se wrap karte hain taaki EXPLAIN fail hone par transaction abort na ho.
+    """
+    dialect = conn.dialect.name
+    is_select = statement.lstrip().upper().startswith(("SELECT", "WITH"))
+    if dialect == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if is_select else "EXPLAIN "
+    elif dialect == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    else:
+        prefix = "EXPLAIN "
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    use_savepoint = dialect == "postgresql"
+    try:
+        if use_savepoint:
+            cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception as exc:
+            if use_savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            return f"EXPLAIN failed: {exc}"
+        if use_savepoint:
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return "\n".join(" | ".join(str(col) for col in row) for row in rows)
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("slow_query_start")
+    if not starts:
+        return
+    duration_ms = (time.perf_counter() - starts.pop()) * 1000
+    if duration_ms < SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    route = current_route.get()
+    capture_explain = slow_query_log.record(statement, parameters, duration_ms, route)
+    if capture_explain and not executemany:
+        slow_query_log.add_explain(statement, duration_ms, route, _explain(conn, statement, parameters))
+
+
+def _handle_error(exception_context):
+    # Fail hui query ka start time stack se hata dein
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("slow_query_start"):
+        conn.info["slow_query_start"].pop()
+
+
+def install(*engines) -> None:
+    """ Diye gaye sync engines (async ke liye engine.sync_engine) par timing hooks lagata hai. """
+    for engine in engines:
+        if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+            event.listen(engine, "handle_error", _handle_error)
+
+
+async def track_request_route(request: Request, call_next):
+    """ HTTP middleware: request ka method aur path current_route me rakhta hai. """
+    token = current_route.set(f"{request.method} {request.url.path}")
+    try:
+        return await call_next(request)
+    finally:
+        current_route.reset(token)
@@ -0,0 +1,300 @@
+# file: suggest_index.py
+import os
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from index_refresher import IndexRefresher
+from models import book_model, user_model
+
+# Doosre workers ki writes is interval ke andar poore reload se dikhti hain
+SUGGEST_INDEX_REFRESH_SECONDS = float(os.getenv("SUGGEST_INDEX_REFRESH_SECONDS", "300"))
+SUGGEST_MAX_RESULTS = int(os.getenv("SUGGEST_MAX_RESULTS", "25"))
+# Title ke itne shuruati words tak har word se prefix match hota hai ("rings" -> "The Lord of the Rings")
+SUGGEST_MAX_WORD_STARTS = 8
+
+_WORD = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def normalize(value: Optional[str]) -> str:
+    return " ".join(_WORD.findall((value or "").casefold()))
+
+
+def word_keys(value: Optional[str]) -> List[str]:
+    """ Har word se shuru hone wala normalized suffix; inhi par prefix lookup hota hai. """
+    words = _WORD.findall((value or "").casefold())
+    return list(dict.fromkeys(" ".join(words[i:]) for i in range(min(len(words), SUGGEST_MAX_WORD_STARTS))))
+
+
+class PrefixIndex:
+    """ (key, ref) tuples ki sorted list; prefix lookup bisect se, add/remove insort / bisect se. """
+
+    def __init__(self):
+        self._entries: List[Tuple[str, object]] = []
+
+    def build(self, entries: Iterable[Tuple[str, object]]) -> None:
+        self._entries = sorted(set(entries))
+
+    def add(self, key: str, ref) -> None:
+        insort(self._entries, (key, ref))
+
+    def remove(self, key: str, ref) -> None:
+        i = bisect_left(self._entries, (key, ref))
+        if i < len(self._entries) and self._entries[i] == (key, ref):
+            del self._entries[i]
+
+    def lookup(self, prefix: str, limit: int) -> Tuple[list, bool]:
+        """ Pehle `limit` alag refs (key order me) aur kya aur bhi the. """
+        refs: list = []
+        seen = set()
+        i = bisect_left(self._entries, (prefix,))
+        while i < len(self._entries):
+            key, ref = self._entries[i]
+            if not key.startswith(prefix):
+                break
+            if ref not in seen:
+                if len(refs) == limit:
+                    return refs, True
+                seen.add(ref)
+                refs.append(ref)
+            i += 1
+        return refs, False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SuggestBook(NamedTuple):
+    title: str
+    author: Optional[str]
+    is_approved: bool
+    is_restricted: bool
+
+    def scopes(self) -> Tuple[str, ...]:
+        """ public: sab dekh sakte hain; all: staff; restricted: restricted-books admin page. """
+        scopes = ["all"]
+        if self.is_approved and not self.is_restricted:
+            scopes.append("public")
+        if self.is_restricted:
+            scopes.append("restricted")
+        return tuple(scopes)
+
+
+class SuggestUser(NamedTuple):
+    username: str
+    full_name: Optional[str]
+
+
+class SuggestIndex:
+    """
+    Book titles, authors aur users ke type-ahead ke liye in-memory sorted prefix indexes.
+    Books aur users ke ORM flush events badli hui rows stale mark karte hain; background refresher
+    (index_refresher) sirf wahi rows dobara padh kar unki entries hataata / daalta hai, aur har
+    refresh_seconds par poora rebuild karke swap karta hai. Request path sirf suggest() se padhta hai.
+    """
+
+    def __init__(self, refresh_seconds: float = SUGGEST_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._reset()
+        self._stale_books: Set[int] = set()
+        self._stale_users: Set[int] = set()
+        self._loaded_at: Optional[float] = None
+        # mark_stale isse set karta hai taaki refresher thread turant jaage
+        self.changed = threading.Event()
+
+    @property
+    def loaded_at(self) -> Optional[float]:
+        return self._loaded_at
+
+    def _reset(self) -> None:
+        self._books: Dict[int, SuggestBook] = {}
+        self._users: Dict[int, SuggestUser] = {}
+        self._titles = {scope: PrefixIndex() for scope in ("public", "all", "restricted")}
+        self._authors = {scope: PrefixIndex() for scope in ("public", "all", "restricted")}
+        # scope -> author naam -> kitni books; naam index me tabhi tak jab tak count > 0
+        self._author_counts: Dict[str, Counter] = {scope: Counter() for scope in ("public", "all", "restricted")}
+        self._user_index = PrefixIndex()
+
+    @staticmethod
+    def _fetch_books(db: Session, book_ids: Optional[Iterable[int]] = None) -> Dict[int, SuggestBook]:
+        Book = book_model.Book
+        query = db.query(Book.id, Book.title, Book.author, Book.is_approved, Book.is_restricted).filter(
+            Book.deleted_at.is_(None)
+        )
+        if book_ids is not None:
+            query = query.filter(Book.id.in_(list(book_ids)))
+        return {
+            book_id: SuggestBook(title, author, bool(is_approved), bool(is_restricted))
+            for book_id, title, author, is_approved, is_restricted in query.yield_per(5000)
+        }
+
+    @staticmethod
+    def _fetch_users(db: Session, user_ids: Optional[Iterable[int]] = None) -> Dict[int, SuggestUser]:
+        User = user_model.User
+        query = db.query(User.id, User.username, User.full_name).filter(User.deleted_at.is_(None))
+        if user_ids is not None:
+            query = query.filter(User.id.in_(list(user_ids)))
+        return {user_id: SuggestUser(username, full_name) for user_id, username, full_name in query}
+
+    @staticmethod
+    def _user_keys(user: SuggestUser) -> List[str]:
+        return list(dict.fromkeys([normalize(user.username)] + word_keys(user.full_name)))
+
+    def _add_book(self, book_id: int, book: SuggestBook) -> None:
+        self._books[book_id] = book
+        for scope in book.scopes():
+            for key in word_keys(book.title):
+                self._titles[scope].add(key, book_id)
+            if book.author:
+                counts = self._author_counts[scope]
+                counts[book.author] += 1
+                if counts[book.author] == 1:
+                    for key in word_keys(book.author):
+                        self._authors[scope].add(key, book.author)
+
+    def _remove_book(self, book_id: int) -> None:
+        book = self._books.pop(book_id, None)
+        if book is None:
+            return
+        for scope in book.scopes():
+            for key in word_keys(book.title):
+                self._titles[scope].remove(key, book_id)
+            if book.author:
+                counts = self._author_counts[scope]
+                counts[book.author] -= 1
+                if counts[book.author] <= 0:
+                    del counts[book.author]
+                    for key in word_keys(book.author):
+                        self._authors[scope].remove(key, book.author)
+
+    def _add_user(self, user_id: int, user: SuggestUser) -> None:
+        self._users[user_id] = user
+        for key in self._user_keys(user):
+            self._user_index.add(key, user_id)
+
+    def _remove_user(self, user_id: int) -> None:
+        user = self._users.pop(user_id, None)
+        if user is not None:
+            for key in self._user_keys(user):
+                self._user_index.remove(key, user_id)
+
+    def load(self, db: Session) -> None:
+        """ Poore indexes ek baar sort karke banata hai (lock ke bahar), phir swap. """
+        # Fetch ke dauraan stale hui rows agli ensure_fresh me lagengi, isliye clear fetch se pehle
+        with self._lock:
+            self._stale_books.clear()
+            self._stale_users.clear()
+        books, users = self._fetch_books(db), self._fetch_users(db)
+        fresh = SuggestIndex(self.refresh_seconds)
+        fresh._books, fresh._users = books, users
+        titles = {scope: [] for scope in fresh._titles}
+        for book_id, book in books.items():
+            for scope in book.scopes():
+                titles[scope].extend((key, book_id) for key in word_keys(book.title))
+                if book.author:
+                    fresh._author_counts[scope][book.author] += 1
+        for scope, entries in titles.items():
+            fresh._titles[scope].build(entries)
+            fresh._authors[scope].build(
+                (key, author) for author in fresh._author_counts[scope] for key in word_keys(author)
+            )
+        fresh._user_index.build(
+            (key, user_id) for user_id, user in users.items() for key in self._user_keys(user)
+        )
+        with self._lock:
+            self._books, self._users = fresh._books, fresh._users
+            self._titles, self._authors, self._author_counts = fresh._titles, fresh._authors, fresh._author_counts
+            self._user_index = fresh._user_index
+            self._loaded_at = time.monotonic()
+
+    def mark_stale(self, book_ids: Iterable[int] = (), user_ids: Iterable[int] = ()) -> None:
+        with self._lock:
+            self._stale_books.update(book_ids)
+            self._stale_users.update(user_ids)
+        self.changed.set()
+
+    def ensure_fresh(self, db: Session) -> None:
+        """ Refresher thread se: interval poora ho toh poora reload, warna sirf stale rows. """
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.refresh_seconds:
+            self.load(db)
+            return
+        with self._lock:
+            stale_books, self._stale_books = self._stale_books, set()
+            stale_users, self._stale_users = self._stale_users, set()
+        books = self._fetch_books(db, stale_books) if stale_books else {}
+        users = self._fetch_users(db, stale_users) if stale_users else {}
+        with self._lock:
+            for book_id in stale_books:
+                self._remove_book(book_id)
+                if book_id in books:
+                    self._add_book(book_id, books[book_id])
+            for user_id in stale_users:
+                self._remove_user(user_id)
+                if user_id in users:
+                    self._add_user(user_id, users[user_id])
+
+    def suggest(self, kind: str, prefix: str, limit: int, scope: str = "public") -> Tuple[List[dict], bool]:
+        """ kind: book / author / user. Books aur authors `scope` (public / all / restricted) ke andar se. """
+        prefix = normalize(prefix)
+        if not prefix:
+            return [], False
+        with self._lock:
+            if kind == "book":
+                ids, truncated = self._titles[scope].lookup(prefix, limit)
+                items = [{"id": book_id, "title": self._books[book_id].title, "author": self._books[book_id].author} for book_id in ids]
+            elif kind == "author":
+                names, truncated = self._authors[scope].lookup(prefix, limit)
+                items = [{"author": name, "books": self._author_counts[scope][name]} for name in names]
+            else:
+                ids, truncated = self._user_index.lookup(prefix, limit)
+                items = [{"id": user_id, "username": self._users[user_id].username, "full_name": self._users[user_id].full_name} for user_id in ids]
+        return items, truncated
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "books": len(self._books),
+                "users": len(self._users),
+                "title_entries": {scope: len(index) for scope, index in self._titles.items()},
+                "author_entries": {scope: len(index) for scope, index in self._authors.items()},
+                "user_entries": len(self._user_index),
+            }
+
+
+suggest_index = SuggestIndex()
+suggest_refresher = IndexRefresher("suggest", suggest_index)
+
+
+# --- Session events: kisi bhi controller se book / user badle toh stale ---
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_rows(session, flush_context):
+    books = session.info.setdefault("suggest_changed_books", set())
+    users = session.info.setdefault("suggest_changed_users", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, book_model.Book) and obj.id is not None:
+            books.add(obj.id)
+        elif isinstance(obj, user_model.User) and obj.id is not None:
+            users.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changed_rows(session):
+    books = session.info.pop("suggest_changed_books", None)
+    users = session.info.pop("suggest_changed_users", None)
+    if books or users:
+        suggest_index.mark_stale(books or (), users or ())
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_rows(session):
+    session.info.pop("suggest_changed_books", None)
+    session.info.pop("suggest_changed_users", None)
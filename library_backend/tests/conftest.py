@@ -0,0 +1,143 @@
+# file: tests/conftest.py
+"""
+Tests ek temporary SQLite file par poori app chalate hain (library_backend folder se `python -m pytest`).
+DATABASE_URL `database` import hone se pehle set hona chahiye, isliye yeh sab module level par hai.
+"""
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+_DB_DIR = tempfile.mkdtemp(prefix="library_tests_")
+atexit.register(shutil.rmtree, _DB_DIR, ignore_errors=True)
+_DB_FILE = os.path.join(_DB_DIR, "test.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+os.environ["DATABASE_REPLICA_URLS"] = ""
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import main
+import authz_versions
+from auth import create_access_token, get_password_hash
+from database import Base, SessionLocal, async_engine, engine
+from models import book_model, language_model, library_management_models, permission_model, user_model
+from permission_cache import permission_cache
+
+LIBRARIAN_PERMISSIONS = ["BOOK_MANAGE", "BOOK_ISSUE", "CATEGORY_MANAGE", "COPY_VIEW", "LOG_VIEW"]
+
+
+def _seed() -> dict:
+    db = SessionLocal()
+    try:
+        admin = user_model.Role(name="Admin")
+        librarian = user_model.Role(name="Librarian")
+        member = user_model.Role(name="Member")
+        db.add_all([admin, librarian, member])
+        db.flush()
+        librarian.permissions = [permission_model.Permission(name=name) for name in LIBRARIAN_PERMISSIONS]
+        users = {
+            name: user_model.User(
+                username=name, email=f"{name}@example.com", password_hash=get_password_hash(name),
+                role_id=role.id, status="Active"
+            )
+            for name, role in (("admin", admin), ("librarian", librarian), ("member", member))
+        }
+        db.add_all(users.values())
+        language = language_model.Language(name="English")
+        category = book_model.Category(name="Fiction")
+        location = library_management_models.Location(name="Main hall")
+        db.add_all([language, category, location])
+        db.flush()
+        book = book_model.Book(title="Dune", author="Frank Herbert", language_id=language.id, is_approved=True)
+        db.add(book)
+        db.flush()
+        copies = [library_management_models.BookCopy(book_id=book.id, location_id=location.id) for _ in range(5)]
+        db.add_all(copies)
+        db.commit()
+        return {
+            "users": {name: user.id for name, user in users.items()},
+            "category_id": category.id, "language_id": language.id, "copy_ids": [copy.id for copy in copies],
+        }
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="session")
+def seeded():
+    Base.metadata.create_all(bind=engine)
+    return _seed()
+
+
+@pytest.fixture(scope="session")
+def client(seeded):
+    # `with` se lifespan chalta hai (ACL / facet / suggest indexes load)
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def tokens(client):
+    """ /token se naye format (permission-bearing) tokens. """
+    result = {}
+    for name in ("admin", "librarian", "member"):
+        response = client.post("/token", data={"username": name, "password": name})
+        assert response.status_code == 200, response.text
+        result[name] = response.json()["access_token"]
+    return result
+
+
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def legacy_token(username: str) -> str:
+    """ Sirf `sub` wala purana token: auth ko DB fallback (user lookup + permission cache) se guzarta hai. """
+    return create_access_token({"sub": username})
+
+
+def due_date() -> str:
+    return (datetime.utcnow() + timedelta(days=14)).isoformat()
+
+
+class StatementCounter:
+    """ Sync aur async dono engines par chale SQL statements (before_cursor_execute) record karta hai. """
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        # Index refresher threads ki queries request ka hissa nahi hain
+        if not threading.current_thread().name.endswith("-refresher"):
+            self.statements.append(statement)
+
+    @contextmanager
+    def request(self):
+        """ Block ke andar chale statements; auth caches cold karke taaki ginti har baar same rahe. """
+        permission_cache.clear()
+        authz_versions._versions.clear()
+        self.statements = []
+        yield self
+        self.count = len(self.statements)
+
+    def user_lookups(self) -> int:
+        """ Auth wala username lookup; response serialization ke users loads isme nahi gine jaate. """
+        return sum(1 for statement in self.statements if 'WHERE users."Username"' in statement)
+
+
+@pytest.fixture
+def sql_counter():
+    counter = StatementCounter()
+    engines = [engine, async_engine.sync_engine]
+    for db_engine in engines:
+        event.listen(db_engine, "before_cursor_execute", counter)
+    yield counter
+    for db_engine in engines:
+        event.remove(db_engine, "before_cursor_execute", counter)
@@ -0,0 +1,90 @@
+# file: tests/test_availability.py
+"""
+Books ke copies_total / copies_available / copies_on_loan counters: copy banana, issue aur return unhe
+saath saath badalte hain, aur availability.reconcile haath se bigade counters pakad kar theek karta hai.
+"""
+import pytest
+from sqlalchemy import update
+
+import availability
+from conftest import bearer, due_date
+from database import SessionLocal
+from models import book_model, library_management_models as lm
+
+
+def _counters(book_id: int) -> tuple:
+    db = SessionLocal()
+    try:
+        book = db.get(book_model.Book, book_id)
+        return book.copies_total, book.copies_available, book.copies_on_loan
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def new_book(seeded):
+    db = SessionLocal()
+    try:
+        book = book_model.Book(title="Counted", author="Tester", language_id=seeded["language_id"], is_approved=True)
+        location_id = db.query(lm.Location.id).filter(lm.Location.name == "Main hall").scalar()
+        db.add(book)
+        db.commit()
+        return {"id": book.id, "location_id": location_id}
+    finally:
+        db.close()
+
+
+def test_copy_issue_and_return_move_counters(client, seeded, tokens, new_book):
+    assert _counters(new_book["id"]) == (0, 0, 0)
+
+    response = client.post(
+        "/api/copies/", json={"book_id": new_book["id"], "location_id": new_book["location_id"]},
+        headers=bearer(tokens["admin"])
+    )
+    assert response.status_code == 201, response.text
+    copy_id = response.json()["id"]
+    assert _counters(new_book["id"]) == (1, 1, 0)
+
+    response = client.post(
+        "/api/issues/issue",
+        json={"client_id": seeded["users"]["member"], "copy_id": copy_id, "due_date": due_date()},
+        headers=bearer(tokens["librarian"])
+    )
+    assert response.status_code == 201, response.text
+    issue_id = response.json()["id"]
+    assert _counters(new_book["id"]) == (1, 0, 1)
+
+    response = client.post(f"/api/issues/return/{issue_id}", headers=bearer(tokens["librarian"]))
+    assert response.status_code == 200, response.text
+    assert _counters(new_book["id"]) == (1, 1, 0)
+
+
+def test_reconcile_reports_and_fixes_drift(client, tokens, new_book):
+    response = client.post(
+        "/api/copies/", json={"book_id": new_book["id"], "location_id": new_book["location_id"]},
+        headers=bearer(tokens["admin"])
+    )
+    assert response.status_code == 201, response.text
+
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(book_model.Book).where(book_model.Book.id == new_book["id"])
+            .values(copies_total=7, copies_available=0, copies_on_loan=3)
+        )
+        db.commit()
+
+        report = availability.reconcile(db, fix=False)
+        drift = next(item for item in report["drift"] if item["book_id"] == new_book["id"])
+        assert drift["stored"] == {"copies_total": 7, "copies_available": 0, "copies_on_loan": 3}
+        assert drift["actual"] == {"copies_total": 1, "copies_available": 1, "copies_on_loan": 0}
+        assert _counters(new_book["id"]) == (7, 0, 3)  # fix=False kuch nahi badalta
+
+        report = availability.reconcile(db, fix=True)
+        assert report["fixed"] and any(item["book_id"] == new_book["id"] for item in report["drift"])
+        assert _counters(new_book["id"]) == (1, 1, 0)
+
+        report = availability.reconcile(db, fix=False)
+        assert report["books_drifted"] == 0
+    finally:
+        db.close()
@@ -0,0 +1,71 @@
+# file: tests/test_catalog_import.py
+"""
+POST /api/books/import: CSV rows batches me import, aur har fail hui row (duplicate ISBN, unknown language,
+validation) ka row number ke saath error report.
+"""
+from conftest import bearer
+from database import SessionLocal
+from models import book_model
+
+CSV = """title,author,isbn,language,language_id
+Import One,A,IMP-0001,english,
+Import Two,B,IMP-0001,English,
+Import Three,C,,Klingon,
+,D,IMP-0004,English,
+Import Five,E,IMP-0005,,{language_id}
+Import Six,F,IMP-0006,,9999
+Import Seven,G,IMP-0001,English,
+"""
+
+
+def _import(client, tokens, content: str, **params):
+    return client.post(
+        "/api/books/import", params=params, headers=bearer(tokens["librarian"]),
+        files={"file": ("books.csv", content.encode(), "text/csv")}
+    )
+
+
+def test_import_reports_errors_per_row(client, seeded, tokens):
+    response = _import(client, tokens, CSV.format(language_id=seeded["language_id"]), batch_size=2)
+    assert response.status_code == 200, response.text
+    report = response.json()
+
+    assert report["total_rows"] == 7
+    assert report["imported"] == 2
+    assert report["failed"] == 5
+    errors = {error["row"]: error["error"] for error in report["errors"]}
+    assert sorted(errors) == [3, 4, 5, 7, 8]
+    # Duplicate ISBN: usi batch me (row 3) aur baad ke batch me (row 8)
+    assert errors[3] == "A book with ISBN IMP-0001 already exists."
+    assert errors[8] == "A book with ISBN IMP-0001 already exists."
+    assert errors[4] == "Language 'Klingon' not found."
+    assert errors[5].startswith("title:")
+    assert errors[7] == "Language with ID 9999 not found."
+    assert report["errors_truncated"] is False
+
+    db = SessionLocal()
+    try:
+        imported = db.query(book_model.Book).filter(book_model.Book.title.in_(["Import One", "Import Five"])).all()
+        assert sorted(book.isbn for book in imported) == ["IMP-0001", "IMP-0005"]
+        assert all(not book.is_approved for book in imported)  # Import hui books pending approval
+    finally:
+        db.close()
+
+
+def test_isbn_already_in_catalog_is_rejected(client, tokens):
+    first = _import(client, tokens, "title,isbn,language\nFirst,IMP-0100,English\n")
+    assert first.status_code == 200 and first.json()["imported"] == 1, first.text
+
+    response = _import(client, tokens, "title,isbn,language\nAgain,IMP-0100,English\n")
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["imported"] == 0
+    assert report["errors"] == [{"row": 2, "error": "A book with ISBN IMP-0100 already exists."}]
+
+
+def test_unknown_format_is_rejected(client, tokens):
+    response = client.post(
+        "/api/books/import", headers=bearer(tokens["librarian"]),
+        files={"file": ("books.txt", b"title\nX\n", "text/plain")}
+    )
+    assert response.status_code == 400
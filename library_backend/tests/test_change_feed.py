@@ -0,0 +1,52 @@
+# file: tests/test_change_feed.py
+"""
+Change feed token ke clocks: archive ke saath compare hone se pehle type dialect se milna chahiye
+(SQLite par text, baaki jagah timestamp), warna crafted token 500 deta tha.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from change_feed import encode_token
+from database import SessionLocal
+from models import book_model
+from models.archive_model import archive_tables
+from pagination import encode_cursor
+
+
+@pytest.fixture(scope="module")
+def archived_book(seeded):
+    """ Ek archived book, taaki retention se purane tokens archive table tak pahunchein. """
+    archive = archive_tables["books"]
+    db = SessionLocal()
+    try:
+        book = db.execute(select(book_model.Book.__table__).where(book_model.Book.title == "Dune")).mappings().one()
+        row = {**book, "id": 10_000, "archived_at": datetime.utcnow()}
+        db.execute(archive.insert().values(**row))
+        db.commit()
+        yield row["id"]
+        db.execute(archive.delete().where(archive.c.id == row["id"]))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_datetime_clock_on_sqlite_is_rejected(client, archived_book):
+    token = encode_token({"book": encode_cursor([datetime(2000, 1, 1), 1])})
+    response = client.get("/api/changes/", params={"since": token})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid change feed token."
+
+
+@pytest.mark.parametrize("clock", [None, 7, ["2000-01-01"]])
+def test_non_clock_values_are_rejected(client, archived_book, clock):
+    token = encode_token({"book": encode_cursor([clock, 1])})
+    assert client.get("/api/changes/", params={"since": token}).status_code == 400
+
+
+def test_old_text_clock_asks_for_reset(client, archived_book):
+    token = encode_token({"book": encode_cursor(["2000-01-01 00:00:00", 1])})
+    response = client.get("/api/changes/", params={"since": token})
+    assert response.status_code == 200, response.text
+    assert response.json()["reset"] is True
@@ -0,0 +1,113 @@
+# file: tests/test_login_throttle.py
+"""
+Login throttling: username ka bucket khaali hone par /token bcrypt se pehle 429 + Retry-After deta hai,
+aur failed attempts har window me sirf ek LOGIN_FAILED summary row likhte hain.
+"""
+import pytest
+
+from database import SessionLocal
+from login_throttle import (
+    LOGIN_USER_BURST, FailedLoginAggregator, TokenBucketThrottle, failed_login_aggregator, login_throttle, throttle_keys
+)
+from models import log_model
+
+CLIENT_IP = "testclient"  # TestClient ka request.client.host
+
+
+@pytest.fixture
+def fresh_login_state(monkeypatch):
+    """ Throttle buckets aur aggregator khaali; test ke baad bhi, taaki baaki tests ke logins na atkein. """
+    usernames = ["throttled_user", "librarian"]
+    keys = [key for username in usernames for key in throttle_keys(username, CLIENT_IP)]
+    login_throttle.reset(keys)
+    failed_login_aggregator.drain(force=True)
+    # Poora test ek hi window me
+    monkeypatch.setattr(failed_login_aggregator, "window_seconds", 3600)
+    yield
+    login_throttle.reset(keys)
+    failed_login_aggregator.drain(force=True)
+
+
+def _failed_log_rows() -> int:
+    db = SessionLocal()
+    try:
+        return db.query(log_model.Log).filter(log_model.Log.action_type == "LOGIN_FAILED").count()
+    finally:
+        db.close()
+
+
+def _login(client, username: str, password: str):
+    return client.post("/token", data={"username": username, "password": password})
+
+
+def test_repeated_bad_passwords_get_429_with_retry_after(client, seeded, fresh_login_state):
+    for _ in range(LOGIN_USER_BURST):
+        assert _login(client, "throttled_user", "wrong").status_code == 401
+
+    response = _login(client, "throttled_user", "wrong")
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+    # Doosra username usi IP se abhi bhi login kar sakta hai (IP bucket bada hai)
+    assert _login(client, "librarian", "librarian").status_code == 200
+
+
+def test_successful_login_resets_username_bucket(client, seeded, fresh_login_state):
+    for _ in range(LOGIN_USER_BURST - 1):
+        assert _login(client, "librarian", "wrong").status_code == 401
+    assert _login(client, "librarian", "librarian").status_code == 200
+    for _ in range(LOGIN_USER_BURST - 1):
+        assert _login(client, "librarian", "wrong").status_code == 401
+    assert _login(client, "librarian", "librarian").status_code == 200
+
+
+def test_one_failed_login_summary_row_per_window(client, seeded, fresh_login_state, monkeypatch):
+    before = _failed_log_rows()
+    for _ in range(LOGIN_USER_BURST):
+        _login(client, "throttled_user", "wrong")
+    assert _login(client, "throttled_user", "wrong").status_code == 429
+    # Window abhi chal rahi hai: koi row nahi
+    assert _failed_log_rows() == before
+
+    # Window khatam: agla attempt saari ginti ki ek hi summary row likhta hai
+    monkeypatch.setattr(failed_login_aggregator, "window_seconds", 0)
+    assert _login(client, "throttled_user", "wrong").status_code == 429
+    assert _failed_log_rows() == before + 1
+
+    db = SessionLocal()
+    try:
+        row = db.query(log_model.Log).filter(log_model.Log.action_type == "LOGIN_FAILED") \
+            .order_by(log_model.Log.id.desc()).first()
+        assert row.description.startswith(f"{LOGIN_USER_BURST + 2} failed login attempts (2 throttled)")
+        assert "throttled_user" in row.description
+    finally:
+        db.close()
+
+
+def test_token_bucket_refills_over_time(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("login_throttle.time.monotonic", lambda: now[0])
+    throttle = TokenBucketThrottle()
+    keys = ["user:someone"]
+    for _ in range(LOGIN_USER_BURST):
+        assert throttle.retry_after(keys) is None
+        throttle.consume(keys)
+    retry_after = throttle.retry_after(keys)
+    assert retry_after is not None and throttle.rejected == 1
+
+    now[0] += retry_after
+    assert throttle.retry_after(keys) is None
+
+
+def test_aggregator_drains_once_per_window(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("login_throttle.time.monotonic", lambda: now[0])
+    aggregator = FailedLoginAggregator(window_seconds=60)
+    aggregator.record("a", "1.1.1.1")
+    aggregator.record("a", "1.1.1.1", throttled=True)
+    assert aggregator.drain() is None
+
+    now[0] += 61
+    summary = aggregator.drain()
+    assert summary.startswith("2 failed login attempts (1 throttled)")
+    assert aggregator.drain() is None
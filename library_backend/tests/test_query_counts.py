@@ -0,0 +1,52 @@
+# file: tests/test_query_counts.py
+"""
+Har authenticated endpoint par SQL statements ki ginti. Endpoints require_permission ko dependencies=[...] aur
+current_user dono me lete hain; request-scoped Principal ki wajah se auth chain ek hi baar chalni chahiye.
+Budgets cold auth caches (permission cache aur authz version cache khaali) par hain, yaani worst case.
+"""
+import pytest
+
+from conftest import bearer, due_date, legacy_token
+
+
+def _requests(seeded):
+    """ (naam, method, path, kwargs, expected status) """
+    return [
+        ("create_book", "post", "/api/books/",
+         {"json": {"title": "Count me", "author": "Tester", "language_id": seeded["language_id"]}}, 201),
+        ("issue_book_to_client", "post", "/api/issues/issue",
+         {"json": {"client_id": seeded["users"]["member"], "copy_id": seeded["copy_ids"][0], "due_date": due_date()}}, 201),
+        ("update_category", "put", f"/api/categories/{seeded['category_id']}",
+         {"json": {"name": "Fiction", "description": "Updated"}}, 200),
+        ("read_logs", "get", "/api/logs/", {}, 200),
+    ]
+
+
+# Permission-bearing token: auth sirf authz_versions se version check karta hai
+TOKEN_BUDGETS = {"create_book": 10, "issue_book_to_client": 16, "update_category": 7, "read_logs": 8}
+# Purana token: upar se ek user lookup aur ek role/permissions load (authz version wala select dono me hai)
+LEGACY_EXTRA = 2
+
+
+@pytest.mark.parametrize("index", range(4))
+def test_statement_budget_with_permission_token(client, seeded, tokens, sql_counter, index):
+    name, method, path, kwargs, expected = _requests(seeded)[index]
+    with sql_counter.request():
+        response = getattr(client, method)(path, headers=bearer(tokens["librarian"]), **kwargs)
+    assert response.status_code == expected, response.text
+    # Token fresh hai: auth ke liye user lookup hona hi nahi chahiye
+    assert sql_counter.user_lookups() == 0
+    assert sql_counter.count <= TOKEN_BUDGETS[name]
+
+
+@pytest.mark.parametrize("index", range(4))
+def test_statement_budget_with_legacy_token(client, seeded, sql_counter, index):
+    name, method, path, kwargs, expected = _requests(seeded)[index]
+    if name == "issue_book_to_client":
+        kwargs = {"json": {**kwargs["json"], "copy_id": seeded["copy_ids"][1]}}
+    with sql_counter.request():
+        response = getattr(client, method)(path, headers=bearer(legacy_token("librarian")), **kwargs)
+    assert response.status_code == expected, response.text
+    # Dependency aur current_user dono ke bawajood user sirf ek baar load hota hai
+    assert sql_counter.user_lookups() == 1
+    assert sql_counter.count <= TOKEN_BUDGETS[name] + LEGACY_EXTRA
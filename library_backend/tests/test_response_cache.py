@@ -0,0 +1,26 @@
+# file: tests/test_response_cache.py
+"""
+Rendered-response cache ke hits aur 304 bhi CORSMiddleware se guzarne chahiye, warna cross-origin
+browser clients doosri request se fail hone lagte hain.
+"""
+from response_cache import rendered_cache
+
+ORIGIN = {"Origin": "http://example.com"}
+
+
+def test_cached_hit_and_304_keep_cors_headers(client, seeded):
+    rendered_cache.clear()
+    first = client.get("/api/languages/", headers=ORIGIN)
+    assert first.status_code == 200
+    assert first.headers["access-control-allow-origin"]
+    etag = first.headers["etag"]
+
+    cached = client.get("/api/languages/", headers=ORIGIN)
+    assert cached.status_code == 200
+    assert rendered_cache.stats()["hits"] >= 1
+    assert cached.headers["access-control-allow-origin"] == first.headers["access-control-allow-origin"]
+    assert "etag" in cached.headers["access-control-expose-headers"].lower()
+
+    not_modified = client.get("/api/languages/", headers={**ORIGIN, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["access-control-allow-origin"] == first.headers["access-control-allow-origin"]
@@ -0,0 +1,60 @@
+# file: tests/test_suggest.py
+"""
+/api/suggest ke staff-only scopes aur kind=user par require_permission jaise hi checks, Active status samet.
+"""
+import pytest
+
+from auth import get_password_hash
+from conftest import bearer, legacy_token
+from database import SessionLocal
+from models import user_model
+
+
+@pytest.fixture(scope="module")
+def inactive_librarian(seeded):
+    """ BOOK_MANAGE wala librarian jiska status Inactive hai; purana token DB se status padhta hai. """
+    db = SessionLocal()
+    try:
+        role = db.query(user_model.Role).filter(user_model.Role.name == "Librarian").one()
+        user = user_model.User(
+            username="inactive_librarian", email="inactive@example.com",
+            password_hash=get_password_hash("inactive"), role_id=role.id, status="Inactive"
+        )
+        db.add(user)
+        db.commit()
+        return user.username
+    finally:
+        db.close()
+
+
+def _suggest(client, token=None, **params):
+    headers = bearer(token) if token else {}
+    return client.get("/api/suggest/", params={"kind": "book", "prefix": "du", **params}, headers=headers)
+
+
+def test_public_scope_needs_no_login(client):
+    assert _suggest(client).status_code == 200
+
+
+@pytest.mark.parametrize("scope", ["all", "restricted"])
+def test_staff_scope_for_active_librarian(client, tokens, scope):
+    assert _suggest(client, tokens["librarian"], scope=scope).status_code == 200
+
+
+@pytest.mark.parametrize("scope", ["all", "restricted"])
+def test_staff_scope_rejects_anonymous_and_members(client, tokens, scope):
+    assert _suggest(client, scope=scope).status_code == 401
+    assert _suggest(client, tokens["member"], scope=scope).status_code == 403
+
+
+@pytest.mark.parametrize("scope", ["all", "restricted"])
+def test_staff_scope_rejects_inactive_user(client, inactive_librarian, scope):
+    response = _suggest(client, legacy_token(inactive_librarian), scope=scope)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user, please contact admin."
+
+
+def test_user_kind_needs_user_view(client, tokens, inactive_librarian):
+    assert _suggest(client, tokens["librarian"], kind="user").status_code == 403
+    assert _suggest(client, tokens["admin"], kind="user").status_code == 200
+    assert _suggest(client, legacy_token(inactive_librarian), kind="user").status_code == 400
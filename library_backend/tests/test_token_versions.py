@@ -0,0 +1,91 @@
+# file: tests/test_token_versions.py
+"""
+Permission-bearing token ka "uv" claim: user ka status ya role badalte hi purana token stale ho jaata hai
+aur auth DB se dobara resolve karta hai (jahan naya status / role lagta hai).
+"""
+import pytest
+
+import authz_versions
+from auth import get_password_hash
+from conftest import bearer
+from database import SessionLocal
+from models import user_model
+
+
+def _create_librarian(username: str) -> int:
+    db = SessionLocal()
+    try:
+        role = db.query(user_model.Role).filter(user_model.Role.name == "Librarian").one()
+        user = user_model.User(
+            username=username, email=f"{username}@example.com",
+            password_hash=get_password_hash(username), role_id=role.id, status="Active"
+        )
+        db.add(user)
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+def _update_user(user_id: int, **values) -> None:
+    db = SessionLocal()
+    try:
+        user = db.get(user_model.User, user_id)
+        for key, value in values.items():
+            setattr(user, key, value)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _login(client, username: str) -> str:
+    response = client.post("/token", data={"username": username, "password": username})
+    assert response.status_code == 200, response.text
+    return response.json()["access_token"]
+
+
+def _version(user_id: int) -> int:
+    scope = authz_versions.user_scope(user_id)
+    authz_versions.forget(scope)
+    db = SessionLocal()
+    try:
+        return authz_versions.get_versions(db, [scope])[scope]
+    finally:
+        db.close()
+
+
+def test_deactivating_user_revokes_existing_token(client):
+    user_id = _create_librarian("to_deactivate")
+    token = _login(client, "to_deactivate")
+    assert client.get("/api/logs/", headers=bearer(token)).status_code == 200
+
+    before = _version(user_id)
+    _update_user(user_id, status="Inactive")
+    assert _version(user_id) == before + 1
+
+    response = client.get("/api/logs/", headers=bearer(token))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user, please contact admin."
+
+
+def test_role_change_revokes_token_permissions(client):
+    user_id = _create_librarian("to_demote")
+    token = _login(client, "to_demote")
+    assert client.get("/api/logs/", headers=bearer(token)).status_code == 200
+
+    db = SessionLocal()
+    try:
+        member_role_id = db.query(user_model.Role.id).filter(user_model.Role.name == "Member").scalar()
+    finally:
+        db.close()
+    _update_user(user_id, role_id=member_role_id)
+
+    assert client.get("/api/logs/", headers=bearer(token)).status_code == 403
+
+
+@pytest.mark.parametrize("values", [{"email": "renamed@example.com"}, {"full_name": "Renamed"}])
+def test_unrelated_user_changes_keep_version(client, values):
+    user_id = _create_librarian(f"unrelated_{next(iter(values))}")
+    before = _version(user_id)
+    _update_user(user_id, **values)
+    assert _version(user_id) == before
@@ -0,0 +1,103 @@
+# file: verify_indexes.py
+"""
+Har hot endpoint ki query ka EXPLAIN chala kar check karta hai ki expected index use ho raha hai.
+
+Usage (library_backend folder se, `alembic upgrade head` ke baad):
+    python verify_indexes.py
+
+Postgres par chhoti tables me planner seq scan chun leta hai, isliye check ke dauraan
+enable_seqscan off kiya jaata hai; sawaal yeh hai ki index *use ho sakta hai*, chahe data kam ho.
+Koi check fail ho toh exit code 1.
+"""
+import sys
+from datetime import datetime
+
+from sqlalchemy import or_, select
+
+from database import engine
+# Sabhi models import karein taaki relationships resolve ho sakein
+from models import (
+    book_model, log_model, library_management_models as lm, book_permission_model,
+    language_model, user_model, request_model, permission_model, authz_version_model
+)
+
+Book = book_model.Book
+Log = log_model.Log
+BookPermission = book_permission_model.BookPermission
+
+# (endpoint, query, jo indexes plan me hone chahiye - inme se koi ek)
+CHECKS = [
+    ("GET /api/books",
+     select(Book.id).where(Book.is_restricted == False, Book.is_approved == True, Book.deleted_at.is_(None)).limit(100),
+     ["ix_books_live_catalog"]),
+    ("GET /api/logs",
+     select(Log.id).order_by(Log.timestamp.desc()).limit(100),
+     ["ix_logs_timestamp"]),
+    ("GET /api/logs?user_id=",
+     select(Log.id).where(Log.action_by_id == 1).order_by(Log.timestamp.desc()).limit(100),
+     ["ix_logs_action_by_timestamp"]),
+    ("GET /api/logs?action_type=",
+     select(Log.id).where(Log.action_type == "BOOK_CREATED").order_by(Log.timestamp.desc()).limit(100),
+     ["ix_logs_action_type_timestamp"]),
+    ("GET /api/issues (status)",
+     select(lm.IssuedBook.id).where(lm.IssuedBook.status == "Issued"),
+     ["ix_issued_books_status", "ix_issued_books_client_status"]),
+    ("issues of a client",
+     select(lm.IssuedBook.id).where(lm.IssuedBook.client_id == 1, lm.IssuedBook.status == "Issued"),
+     ["ix_issued_books_client_status"]),
+    ("POST /api/issues/issue (copy history)",
+     select(lm.IssuedBook.id).where(lm.IssuedBook.copy_id == 1),
+     ["ix_issued_books_copy"]),
+    ("GET /api/copies (available copies of a book)",
+     select(lm.BookCopy.id).where(lm.BookCopy.book_id == 1, lm.BookCopy.status == "Available"),
+     ["ix_book_copies_book_status"]),
+    ("copies at a location",
+     select(lm.BookCopy.id).where(lm.BookCopy.location_id == 1),
+     ["ix_book_copies_location"]),
+    ("GET /api/digital-access/user/{id}",
+     select(lm.DigitalAccess.id).where(lm.DigitalAccess.client_id == 1).order_by(lm.DigitalAccess.access_timestamp.desc()),
+     ["ix_digital_access_client_timestamp"]),
+    ("GET /api/books/{id} (restricted ACL)",
+     select(BookPermission.id).where(BookPermission.book_id == 1, or_(BookPermission.user_id == 1, BookPermission.role_id == 2)),
+     ["ix_book_permissions_book_user", "ix_book_permissions_book_role"]),
+    ("GET /api/changes (books)",
+     select(Book.id).where(Book.updated_at > datetime(2026, 1, 1)).order_by(Book.updated_at, Book.id).limit(500),
+     ["ix_books_updated_at_id"]),
+    ("GET /api/changes (copies)",
+     select(lm.BookCopy.id).where(lm.BookCopy.updated_at > datetime(2026, 1, 1)).order_by(lm.BookCopy.updated_at, lm.BookCopy.id).limit(500),
+     ["ix_book_copies_updated_at_id"]),
+    ("books of a subcategory",
+     select(book_model.book_subcategory_link.c.book_id).where(book_model.book_subcategory_link.c.subcategory_id == 1),
+     ["ix_book_subcategory_link_subcategory"]),
+]
+
+
+def explain(conn, query) -> str:
+    sql = str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    if engine.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql).fetchall()
+        return "\n".join(str(row[-1]) for row in rows)
+    rows = conn.exec_driver_sql("EXPLAIN " + sql).fetchall()
+    return "\n".join(str(row[0]) for row in rows)
+
+
+def main() -> int:
+    failures = 0
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.exec_driver_sql("SET enable_seqscan = off")
+        for endpoint, query, expected in CHECKS:
+            plan = explain(conn, query)
+            used = [name for name in expected if name in plan]
+            status = "OK  " if used else "FAIL"
+            failures += 0 if used else 1
+            print(f"[{status}] {endpoint}: expected {' or '.join(expected)}")
+            if not used:
+                print("       " + plan.replace("\n", "\n       "))
+        conn.rollback()
+    print(f"\n{len(CHECKS) - failures}/{len(CHECKS)} checks passed.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
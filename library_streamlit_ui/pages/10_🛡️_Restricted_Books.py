@@ -2,7 +2,7 @@
 import streamlit as st
 import pandas as pd
 import requests
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import get_data, post_data, delete_data, get_auth_headers, suggest, BASE_URL
 
 st.set_page_config(layout="wide", page_title="Restricted Book Permissions")
 if not st.session_state.get("is_authenticated", False): st.error("Please log in."); st.stop()
@@ -12,21 +12,20 @@ st.info("Grant specific users or roles permission to view books marked as 'Restr
 # --- Data Fetching ---
 @st.cache_data(ttl=30)
 def load_data():
-    all_books, b_err = get_data("/api/books/?approved_only=true")
     users, u_err = get_data("/api/users/")
     roles, r_err = get_data("/api/users/roles/")
-    return all_books, b_err, users, u_err, roles, r_err
+    return users, u_err, roles, r_err
 
-all_books, b_err, users, u_err, roles, r_err = load_data()
-if any([b_err, u_err, r_err]): st.error("Could not load data."); st.stop()
-
-restricted_books = [b for b in all_books if b.get('is_restricted')]
-
-if not restricted_books:
-    st.warning("**No Restricted Books Found.**\n\nTo use this feature, first mark a book as 'restricted' from the 'Edit / Delete Book' tab in the Book Management page.")
-    st.stop()
+users, u_err, roles, r_err = load_data()
+if any([u_err, r_err]): st.error("Could not load data."); st.stop()
 
 # --- Main UI ---
+# Restricted books type-ahead se (/api/suggest scope=restricted), poori book list download nahi hoti
+book_prefix = st.text_input("Search Restricted Books by Title", placeholder="Type a few letters...")
+restricted_books = suggest("book", book_prefix, scope="restricted")
+if book_prefix and not restricted_books:
+    st.warning("**No matching Restricted Books.**\n\nTo use this feature, first mark a book as 'restricted' from the 'Edit / Delete Book' tab in the Book Management page.")
+
 book_options = {f"{b['title']} (ID: {b['id']})": b for b in restricted_books}
 selected_book_display = st.selectbox("Select a Restricted Book to Manage", options=book_options.keys(), index=None)
 
@@ -41,10 +40,11 @@ if selected_book_display:
         st.subheader("Assign New Permission")
         assign_to = st.radio("Assign to:", ["A Specific User", "An Entire Role"], key=f"assign_type_{book_id}", horizontal=True)
         
+        user_prefix = st.text_input("Search User", key=f"perm_user_prefix_{book_id}") if assign_to == "A Specific User" else ""
         with st.form("assign_perm_form", clear_on_submit=True):
             user_id, role_id = None, None
-            if assign_to == "A Specific User" and users:
-                user_map = {f"{u['username']} (ID: {u['id']})": u['id'] for u in users}
+            if assign_to == "A Specific User":
+                user_map = {f"{u['username']} (ID: {u['id']})": u['id'] for u in suggest("user", user_prefix)}
                 selected_user = st.selectbox("Select User", user_map.keys(), index=None)
                 user_id = user_map.get(selected_user)
             if assign_to == "An Entire Role" and roles:
@@ -79,9 +79,9 @@ if selected_book_display:
                 perm_desc = row['Assigned To']
                 if st.button(f"Revoke from: {perm_desc}", key=f"revoke_{perm_id}", use_container_width=True):
                     with st.spinner("Revoking..."):
-                        response = requests.delete(f"{BASE_URL}/api/book-permissions/{perm_id}", headers=get_auth_headers())
-                        if response.ok:
+                        _, err = delete_data(f"/api/book-permissions/{perm_id}")
+                        if not err:
                             st.success("Permission revoked!"); st.cache_data.clear(); st.rerun()
-                        else: st.error(f"Failed: {response.json().get('detail')}")
+                        else: st.error(f"Failed: {err}")
         else:
             st.info("No special permissions assigned to this book yet.")
\ No newline at end of file
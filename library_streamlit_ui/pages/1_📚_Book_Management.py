@@ -2,7 +2,8 @@
 import streamlit as st
 import pandas as pd
 import requests
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from urllib.parse import quote
+from services.api_client import get_data, post_data, put_data, delete_data, get_auth_headers, BASE_URL
 
 # Page ka configuration set karein
 st.set_page_config(layout="wide", page_title="Book Management")
@@ -39,18 +40,16 @@ with tab1:
         st.cache_data.clear(); st.rerun()
 
     if books:
-        search_query = st.text_input("Search by Title, Author, or ISBN", placeholder="Type here to search...")
+        search_query = st.text_input("Search by Title, Author, Publisher or Description", placeholder="Type here to search...")
         
         df = pd.DataFrame(books)
         
-        # Search functionality
+        # Search backend ke full-text search endpoint se (ranked results)
         if search_query:
-            mask = (
-                df['title'].str.contains(search_query, case=False, na=False) |
-                df['author'].str.contains(search_query, case=False, na=False) |
-                df['isbn'].str.contains(search_query, case=False, na=False)
-            )
-            df_search = df[mask]
+            results, search_err = get_data(f"/api/books/search?q={quote(search_query)}&approved_only=false&limit=100")
+            if search_err:
+                st.error(f"Search failed: {search_err}")
+            df_search = pd.DataFrame(results or [], columns=df.columns)
         else:
             df_search = df
 
@@ -148,10 +147,10 @@ with tab3:
                         "is_restricted": is_restricted
                     }
                     with st.spinner("Saving..."):
-                        response = requests.put(f"{BASE_URL}/api/books/{selected_book['id']}", json=update_data, headers=get_auth_headers())
-                        if response.ok:
+                        _, err = put_data(f"/api/books/{selected_book['id']}", update_data)
+                        if not err:
                             st.success("Book updated!"); st.cache_data.clear(); st.rerun()
-                        else: st.error(f"Update failed: {response.json().get('detail')}")
+                        else: st.error(f"Update failed: {err}")
 
             # --- Delete Section ---
             st.divider()
@@ -160,7 +159,7 @@ with tab3:
                 st.error("Warning: This will permanently soft-delete the book.")
                 if st.button("DELETE This Book Permanently", type="primary"):
                     with st.spinner("Deleting..."):
-                        response = requests.delete(f"{BASE_URL}/api/books/{selected_book['id']}", headers=get_auth_headers())
-                        if response.status_code == 204:
+                        _, err = delete_data(f"/api/books/{selected_book['id']}")
+                        if not err:
                             st.success("Book deleted!"); st.cache_data.clear(); st.rerun()
-                        else: st.error(f"Deletion failed: {response.json().get('detail')}")
\ No newline at end of file
+                        else: st.error(f"Deletion failed: {err}")
\ No newline at end of file
@@ -2,7 +2,7 @@
 import streamlit as st
 import pandas as pd
 import requests
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import get_data, post_data, put_data, delete_data, get_auth_headers, BASE_URL
 
 st.set_page_config(layout="wide", page_title="Category Management")
 if not st.session_state.get("is_authenticated", False): st.error("Please log in."); st.stop()
@@ -41,9 +41,9 @@ with tab1:
                 c1.write(f"**{cat['name']}** (ID: {cat['id']})")
                 if c2.button("Edit", key=f"edit_cat_{cat['id']}"): st.session_state.editing_id = f"cat_{cat['id']}"
                 if c3.button("Delete", key=f"del_cat_{cat['id']}", type="primary"):
-                    response = requests.delete(f"{BASE_URL}/api/categories/{cat['id']}", headers=get_auth_headers())
-                    if response.ok: st.success("Deleted!"); st.cache_data.clear(); st.rerun()
-                    else: st.error(f"Failed: {response.json().get('detail')}")
+                    _, err = delete_data(f"/api/categories/{cat['id']}")
+                    if not err: st.success("Deleted!"); st.cache_data.clear(); st.rerun()
+                    else: st.error(f"Failed: {err}")
 
                 if st.session_state.get('editing_id') == f"cat_{cat['id']}":
                     with st.form(f"edit_form_{cat['id']}"):
@@ -51,9 +51,9 @@ with tab1:
                         new_desc = st.text_area("New Desc", value=cat.get('description', ''))
                         if st.form_submit_button("Save"):
                             data = {"name": new_name, "description": new_desc}
-                            response = requests.put(f"{BASE_URL}/api/categories/{cat['id']}", json=data, headers=get_auth_headers())
-                            if response.ok: st.success("Updated!"); del st.session_state.editing_id; st.cache_data.clear(); st.rerun()
-                            else: st.error(f"Failed: {response.json().get('detail')}")
+                            _, err = put_data(f"/api/categories/{cat['id']}", data)
+                            if not err: st.success("Updated!"); del st.session_state.editing_id; st.cache_data.clear(); st.rerun()
+                            else: st.error(f"Failed: {err}")
 
 # --- TAB 2: SUBCATEGORY MANAGEMENT ---
 with tab2:
@@ -84,9 +84,9 @@ with tab2:
                 c1.write(f"**{sub['name']}** in *{sub.get('category', {}).get('name', 'N/A')}* (ID: {sub['id']})")
                 if c2.button("Edit", key=f"edit_sub_{sub['id']}"): st.session_state.editing_id = f"sub_{sub['id']}"
                 if c3.button("Delete", key=f"del_sub_{sub['id']}", type="primary"):
-                    response = requests.delete(f"{BASE_URL}/api/subcategories/{sub['id']}", headers=get_auth_headers())
-                    if response.ok: st.success("Deleted!"); st.cache_data.clear(); st.rerun()
-                    else: st.error(f"Failed: {response.json().get('detail')}")
+                    _, err = delete_data(f"/api/subcategories/{sub['id']}")
+                    if not err: st.success("Deleted!"); st.cache_data.clear(); st.rerun()
+                    else: st.error(f"Failed: {err}")
 
                 if st.session_state.get('editing_id') == f"sub_{sub['id']}":
                     with st.form(f"edit_form_sub_{sub['id']}"):
@@ -102,6 +102,6 @@ with tab2:
 
                         if st.form_submit_button("Save"):
                             data = {"name": new_sub_name, "description": new_sub_desc, "category_id": cat_map[new_parent_name]}
-                            response = requests.put(f"{BASE_URL}/api/subcategories/{sub['id']}", json=data, headers=get_auth_headers())
-                            if response.ok: st.success("Updated!"); del st.session_state.editing_id; st.cache_data.clear(); st.rerun()
-                            else: st.error(f"Failed: {response.json().get('detail')}")
\ No newline at end of file
+                            _, err = put_data(f"/api/subcategories/{sub['id']}", data)
+                            if not err: st.success("Updated!"); del st.session_state.editing_id; st.cache_data.clear(); st.rerun()
+                            else: st.error(f"Failed: {err}")
\ No newline at end of file
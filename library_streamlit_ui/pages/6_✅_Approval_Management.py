@@ -2,7 +2,7 @@
 import streamlit as st
 import pandas as pd
 import requests
-from services.api_client import get_data, get_auth_headers, BASE_URL
+from services.api_client import get_data, put_data, get_auth_headers, BASE_URL
 
 # Page ka configuration set karein
 st.set_page_config(layout="wide", page_title="Approval Management")
@@ -61,13 +61,13 @@ with tab1:
                         if st.button("Approve", key=f"approve_{request['id']}", type="primary", use_container_width=True):
                             with st.spinner("Approving..."):
                                 review_data = {"status": "Approved", "remarks": "Approved via UI"}
-                                response = requests.put(f"{BASE_URL}/api/requests/{request['id']}/review", json=review_data, headers=get_auth_headers())
-                                if response.ok:
+                                _, err = put_data(f"/api/requests/{request['id']}/review", review_data)
+                                if not err:
                                     st.success("Book Approved!")
                                     st.cache_data.clear()
                                     st.rerun()
                                 else:
-                                    st.error(f"Failed: {response.json().get('detail', 'Unknown error')}")
+                                    st.error(f"Failed: {err}")
 
                         # --- Reject Button Logic ---
                         if st.button("Reject", key=f"reject_{request['id']}", use_container_width=True):
@@ -82,14 +82,14 @@ with tab1:
                                 if st.form_submit_button("Confirm Rejection", type="primary"):
                                     with st.spinner("Rejecting..."):
                                         review_data = {"status": "Rejected", "remarks": remarks}
-                                        response = requests.put(f"{BASE_URL}/api/requests/{request['id']}/review", json=review_data, headers=get_auth_headers())
-                                        if response.ok:
+                                        _, err = put_data(f"/api/requests/{request['id']}/review", review_data)
+                                        if not err:
                                             st.warning("Book Rejected!")
                                             del st.session_state.rejecting_id
                                             st.cache_data.clear()
                                             st.rerun()
                                         else:
-                                            st.error(f"Failed: {response.json().get('detail', 'Unknown error')}")
+                                            st.error(f"Failed: {err}")
 
 
                     # Column 2: Book Details
@@ -3,7 +3,7 @@ import streamlit as st
 import pandas as pd
 import requests
 from datetime import datetime, timedelta
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import get_data, post_data, get_auth_headers, suggest, BASE_URL
 
 st.set_page_config(layout="wide", page_title="Copies & Issuing")
 if not st.session_state.get("is_authenticated", False): st.error("Please log in."); st.stop()
@@ -11,15 +11,13 @@ st.title("📚 Book Copies & Issuing System")
 
 @st.cache_data(ttl=30)
 def load_data():
-    books, b_err = get_data("/api/books/?approved_only=true")
     locations, l_err = get_data("/api/locations/")
     copies, c_err = get_data("/api/copies/")
-    users, u_err = get_data("/api/users/")
     issues, i_err = get_data("/api/issues/")
-    return books, b_err, locations, l_err, copies, c_err, users, u_err, issues, i_err
+    return locations, l_err, copies, c_err, issues, i_err
 
-books, b_err, locations, l_err, copies, c_err, users, u_err, issues, i_err = load_data()
-if any([b_err, l_err, c_err, u_err, i_err]): st.error("Could not load necessary data."); st.stop()
+locations, l_err, copies, c_err, issues, i_err = load_data()
+if any([l_err, c_err, i_err]): st.error("Could not load necessary data."); st.stop()
 
 tab1, tab2, tab3 = st.tabs(["Manage Book Copies", "Issue a Book", "Return a Book"])
 
@@ -27,8 +25,10 @@ tab1, tab2, tab3 = st.tabs(["Manage Book Copies", "Issue a Book", "Return a Book
 with tab1:
     st.header("Add & View Book Copies")
     with st.expander("➕ Add New Copy"):
+        # Poori book list download karne ki jagah type-ahead (/api/suggest)
+        book_prefix = st.text_input("Search Book by Title", key="copy_book_prefix", placeholder="Type a few letters...")
         with st.form("add_copy_form", clear_on_submit=True):
-            book_options = {f"{b['title']} (ID: {b['id']})": b['id'] for b in books} if books else {}
+            book_options = {f"{b['title']} (ID: {b['id']})": b['id'] for b in suggest("book", book_prefix)}
             location_options = {f"{l['name']} (ID: {l['id']})": l['id'] for l in locations} if locations else {}
             selected_book_display = st.selectbox("Select Book *", book_options.keys(), index=None)
             selected_location_display = st.selectbox("Select Location *", location_options.keys(), index=None)
@@ -57,10 +57,11 @@ with tab1:
 # --- TAB 2: ISSUE A BOOK ---
 with tab2:
     st.header("Issue a Book to a Client")
+    client_prefix = st.text_input("Search Client by Username or Name", key="issue_client_prefix", placeholder="Type a few letters...")
     with st.form("issue_book_form", clear_on_submit=True):
         available_copies = [c for c in copies if c.get('status') == 'Available'] if copies else []
         copy_options = {f"Copy ID: {c['id']} ({c.get('book', {}).get('title', 'N/A')})": c['id'] for c in available_copies}
-        user_options = {f"{u['username']} (ID: {u['id']})": u['id'] for u in users} if users else {}
+        user_options = {f"{u['username']} (ID: {u['id']})": u['id'] for u in suggest("user", client_prefix)}
         
         selected_copy_display = st.selectbox("Select Available Book Copy *", copy_options.keys(), index=None)
         selected_user_display = st.selectbox("Select Client *", user_options.keys(), index=None)
@@ -98,7 +99,7 @@ with tab3:
                 st.warning("Please select an issue to return.")
             else:
                 issue_id = return_options[selected_issue_display]
-                response = requests.post(f"{BASE_URL}/api/issues/return/{issue_id}", headers=get_auth_headers())
-                if response.ok:
+                _, err = post_data(f"/api/issues/return/{issue_id}", None)
+                if not err:
                     st.success("Book returned!"); st.cache_data.clear(); st.rerun()
-                else: st.error(f"Failed: {response.json().get('detail')}")
\ No newline at end of file
+                else: st.error(f"Failed: {err}")
\ No newline at end of file
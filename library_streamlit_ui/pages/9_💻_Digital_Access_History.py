@@ -11,7 +11,7 @@ st.title("📚 Book Copies & Issuing System")
 
 @st.cache_data(ttl=30)
 def load_data():
-    books, b_err = get_data("/api/books/?approved_only=true")
+    books, b_err = get_data("/api/books/?approved_only=true&fields=id,title&limit=5000")
     locations, l_err = get_data("/api/locations/")
     copies, c_err = get_data("/api/copies/")
     users, u_err = get_data("/api/users/")
@@ -98,7 +98,7 @@ with tab3:
                 st.warning("Please select an issue to return.")
             else:
                 issue_id = return_options[selected_issue_display]
-                response = requests.post(f"{BASE_URL}/api/issues/return/{issue_id}", headers=get_auth_headers())
-                if response.ok:
+                _, err = post_data(f"/api/issues/return/{issue_id}", None)
+                if not err:
                     st.success("Book returned!"); st.cache_data.clear(); st.rerun()
-                else: st.error(f"Failed: {response.json().get('detail')}")
\ No newline at end of file
+                else: st.error(f"Failed: {err}")
\ No newline at end of file
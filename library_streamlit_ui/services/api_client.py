@@ -1,6 +1,7 @@
 # file: services/api_client.py
 import requests
 import streamlit as st
+from urllib.parse import quote
 
 # Aapke FastAPI backend ka URL
 BASE_URL = "https://library-api-nb4f.onrender.com"
@@ -9,6 +10,16 @@ def get_session_state():
     """Streamlit ke session state ko access karta hai."""
     return st.session_state
 
+def get_http_session():
+    """
+    Har Streamlit user ke liye ek requests.Session, taaki backend ki read-your-writes
+    cookie agli GET requests ke saath wapas jaaye.
+    """
+    session = get_session_state()
+    if "http" not in session:
+        session.http = requests.Session()
+    return session.http
+
 def login(username, password):
     """Login karke token haasil karta hai."""
     try:
@@ -39,7 +50,7 @@ def login(username, password):
 def logout():
     """User ko logout karta hai."""
     session = get_session_state()
-    keys_to_delete = ["token", "role", "username", "is_authenticated"]
+    keys_to_delete = ["token", "role", "username", "is_authenticated", "http"]
     for key in keys_to_delete:
         if key in session:
             del session[key]
@@ -56,20 +67,51 @@ def get_data(endpoint):
     """Backend se data (GET request) fetch karta hai."""
     try:
         headers = get_auth_headers()
-        response = requests.get(f"{BASE_URL}{endpoint}", headers=headers)
+        response = get_http_session().get(f"{BASE_URL}{endpoint}", headers=headers)
         response.raise_for_status()
         return response.json(), None
     except Exception as e:
         return None, str(e)
 
+def suggest(kind, prefix, scope="public", limit=15):
+    """/api/suggest se type-ahead options; khaali prefix par kuch nahi."""
+    if not prefix or not prefix.strip():
+        return []
+    data, err = get_data(f"/api/suggest/?kind={kind}&prefix={quote(prefix.strip())}&scope={scope}&limit={limit}")
+    return data["suggestions"] if data and not err else []
+
 def post_data(endpoint, data):
     """Backend par data (POST request) bhejta hai."""
     try:
         headers = get_auth_headers()
-        response = requests.post(f"{BASE_URL}{endpoint}", json=data, headers=headers)
+        response = get_http_session().post(f"{BASE_URL}{endpoint}", json=data, headers=headers)
+        response.raise_for_status()
+        return response.json(), None
+    except requests.exceptions.HTTPError as e:
+         return None, e.response.json().get('detail', str(e))
+    except Exception as e:
+        return None, str(e)
+
+def put_data(endpoint, data):
+    """Backend par data update (PUT request) karta hai."""
+    try:
+        headers = get_auth_headers()
+        response = get_http_session().put(f"{BASE_URL}{endpoint}", json=data, headers=headers)
         response.raise_for_status()
         return response.json(), None
     except requests.exceptions.HTTPError as e:
          return None, e.response.json().get('detail', str(e))
     except Exception as e:
         return None, str(e)
+
+def delete_data(endpoint):
+    """Backend par DELETE request bhejta hai; 204 par body nahi hoti, tab data None."""
+    try:
+        headers = get_auth_headers()
+        response = get_http_session().delete(f"{BASE_URL}{endpoint}", headers=headers)
+        response.raise_for_status()
+        return (response.json() if response.content else None), None
+    except requests.exceptions.HTTPError as e:
+         return None, e.response.json().get('detail', str(e))
+    except Exception as e:
+        return None, str(e)
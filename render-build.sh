@@ -6,5 +6,5 @@ echo "Installing dependencies..."
 pip install -r library_backend/requirements.txt
 
 cd library_backend
-echo "Running alembic stamp..."
-alembic stamp head
+echo "Running alembic migrations..."
+alembic upgrade head